@@ -0,0 +1,32 @@
+"""networkx vs igraph centrality backends"""
+
+import networkx as nx
+import pytest
+
+from vc_analysis.network import backends
+
+pytest.importorskip('igraph')
+
+
+def test_igraph_backend_parity():
+    G = nx.gnm_random_graph(300, 900, seed=7)
+    # A few isolates and a separate component
+    G.add_nodes_from(range(300, 305))
+    G.add_edges_from([(305, 306), (306, 307)])
+    for u, v in G.edges():
+        G[u][v]['weight'] = 1 + (u + v) % 3
+
+    parity = backends.check_backend_parity(G, year=2000)
+    assert not parity.empty
+    assert parity['match'].all(), parity[~parity['match']]
+
+
+def test_igraph_backend_parity_weighted():
+    G = nx.gnm_random_graph(200, 700, seed=11)
+    for u, v in G.edges():
+        G[u][v]['weight'] = 1 + (u * v) % 4
+
+    parity = backends.check_backend_parity(
+        G, year=2000, use_weighted_betweenness=True, use_weighted_constraint=True,
+        use_weighted_structural_holes=True, use_weighted_power=True)
+    assert parity['match'].all(), parity[~parity['match']]
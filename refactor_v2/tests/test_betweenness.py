@@ -0,0 +1,33 @@
+"""Exact and sampled betweenness"""
+
+import networkx as nx
+import numpy as np
+
+from vc_analysis.network import centrality
+
+
+def test_exact_betweenness_identical_across_n_jobs():
+    G = nx.gnm_random_graph(600, 1800, seed=3)
+    serial = centrality._exact_betweenness_array(G, True, None, n_jobs=1, chunk_size=64)
+    parallel = centrality._exact_betweenness_array(G, True, None, n_jobs=2, chunk_size=64)
+
+    assert np.array_equal(serial, parallel)
+    reference = np.fromiter(nx.betweenness_centrality(G).values(), dtype=float)
+    assert np.allclose(serial, reference, rtol=1e-12, atol=1e-15)
+
+
+def test_adaptive_betweenness_standard_error_coverage():
+    G = nx.barabasi_albert_graph(1000, 2, seed=1)
+    estimate, std_error, rel_error = centrality.adaptive_betweenness_centrality(
+        G, normalized=True, target_error=0.1, seed=42)
+    exact = nx.betweenness_centrality(G)
+
+    nodes = [v for v in G if exact[v] > 0]
+    est = np.array([estimate[v] for v in nodes])
+    se = np.array([std_error[v] for v in nodes])
+    ex = np.array([exact[v] for v in nodes])
+
+    # Roughly 95% of nodes within 2 standard errors of exact betweenness
+    assert np.mean(np.abs(est - ex) <= 2 * se) >= 0.9
+    true_error = np.linalg.norm(est - ex) / np.linalg.norm(ex)
+    assert 0.5 * rel_error <= true_error <= 2 * rel_error
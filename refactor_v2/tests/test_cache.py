@@ -0,0 +1,34 @@
+"""On-disk network cache"""
+
+import pandas as pd
+import pytest
+
+from vc_analysis.network import construction
+
+
+def _weighted_edges(G):
+    return {(*sorted(edge[:2]), edge[2]) for edge in G.edges(data='weight')}
+
+
+@pytest.mark.parametrize('engine', ['networkx', 'sparse'])
+@pytest.mark.parametrize('firms', [[0, 1, 1, 2, 2, 3], ['f0', 'f1', 'f1', 'f2', 'f2', 'f3']])
+def test_cache_hit_matches_recompute(tmp_path, firms, engine, monkeypatch):
+    df = pd.DataFrame({
+        'firmname': firms * 2,
+        'comname': ['a', 'a', 'b', 'b', 'c', 'c'] * 2,
+        'year': [1998] * 6 + [1999] * 6,
+    })
+    options = dict(time_window=1, use_parallel=False, engine=engine)
+    fresh = construction.construct_networks_for_years(df, [1999, 2000], **options)
+    construction.construct_networks_for_years(df, [1999, 2000], use_cache=True, cache_dir=tmp_path, **options)
+
+    def no_build(*args, **kwargs):
+        raise AssertionError("network rebuilt despite cache hit")
+    monkeypatch.setattr(construction, 'construct_vc_network', no_build)
+    cached = construction.construct_networks_for_years(df, [1999, 2000], use_cache=True,
+                                                      cache_dir=tmp_path, **options)
+
+    for year in (1999, 2000):
+        assert list(cached[year].nodes()) == list(fresh[year].nodes())
+        assert [type(v) for v in cached[year]] == [type(v) for v in fresh[year]]
+        assert _weighted_edges(cached[year]) == _weighted_edges(fresh[year])
@@ -0,0 +1,88 @@
+"""Year network construction"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vc_analysis.network import construction
+
+
+def _edge_set(G):
+    return {tuple(sorted(edge)) for edge in G.edges()}
+
+
+@pytest.mark.parametrize('engine', ['networkx', 'sparse'])
+def test_integer_firm_ids_do_not_collide_with_events(engine):
+    # Integer event codes 0, 1, 2 must not merge with firms 0, 1, 2
+    df = pd.DataFrame({
+        'firmname': [0, 1, 1, 2, 2, 3],
+        'comname': ['a', 'a', 'b', 'b', 'c', 'c'],
+        'year': 1999,
+    })
+    G = construction.construct_vc_network(df, 2000, engine=engine)
+
+    assert sorted(G.nodes()) == [0, 1, 2, 3]
+    assert _edge_set(G) == {(0, 1), (1, 2), (2, 3)}
+
+
+def _weighted_edges(G):
+    return {(*sorted(edge[:2]), edge[2]) for edge in G.edges(data='weight')}
+
+
+@pytest.mark.parametrize('firms', [[0, 1, 1, 2, 2, 3], ['f0', 'f1', 'f1', 'f2', 'f2', 'f3']])
+def test_shared_memory_networks_match_per_year(firms):
+    df = pd.DataFrame({
+        'firmname': firms * 2,
+        'comname': ['a', 'a', 'b', 'b', 'c', 'c'] * 2,
+        'year': [1998] * 6 + [1999] * 6,
+    })
+    options = dict(time_window=1, use_parallel=True, n_jobs=2, engine='sparse')
+    shared = construction.construct_networks_for_years(df, [1999, 2000], shared_memory=True, **options)
+    direct = construction.construct_networks_for_years(df, [1999, 2000], **options)
+
+    for year in (1999, 2000):
+        assert list(shared[year].nodes()) == list(direct[year].nodes())
+        assert [type(v) for v in shared[year]] == [type(v) for v in direct[year]]
+        assert _weighted_edges(shared[year]) == _weighted_edges(direct[year])
+
+
+def test_encode_round_data_custom_columns():
+    df = pd.DataFrame({'vc': ['x', 'y', 'y', 'z'], 'company': ['a', 'a', 'b', 'b'], 'fy': 1999})
+    encoded = construction.encode_round_data(df, firm_col='vc', event_col='deal',
+                                             year_col='fy', company_col='company')
+
+    assert encoded['firm_labels'].tolist() == ['x', 'y', 'z']
+    G = construction.construct_vc_network_from_encoded(encoded, 2000, time_window=1)
+    assert _edge_set(G) == {('x', 'y'), ('y', 'z')}
+
+
+def _random_rounds(n_rows=600, n_firms=40, n_companies=40, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'firmname': [f"vc{i}" for i in rng.integers(0, n_firms, n_rows)],
+        'comname': [f"c{i}" for i in rng.integers(0, n_companies, n_rows)],
+        'year': rng.integers(1990, 2000, n_rows),
+    })
+
+
+@pytest.mark.parametrize('engine', ['sparse', 'igraph'])
+def test_projection_engines_match_networkx(engine):
+    if engine == 'igraph':
+        pytest.importorskip('igraph')
+    df = _random_rounds()
+    reference = construction.construct_vc_network(df, 1998, edge_cutpoint=2, engine='networkx')
+    G = construction.construct_vc_network(df, 1998, edge_cutpoint=2, engine=engine)
+
+    assert set(G.nodes()) == set(reference.nodes())
+    assert _weighted_edges(G) == _weighted_edges(reference)
+
+
+def test_incremental_networks_match_full_construction():
+    df = _random_rounds()
+    years = [1995, 1996, 1997, 1999]
+    incremental = construction.construct_networks_incremental(df, years, time_window=3, edge_cutpoint=2)
+
+    for year in years:
+        full = construction.construct_vc_network(df, year, time_window=3, edge_cutpoint=2, engine='sparse')
+        assert set(incremental[year].nodes()) == set(full.nodes())
+        assert _weighted_edges(incremental[year]) == _weighted_edges(full)
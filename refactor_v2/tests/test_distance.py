@@ -0,0 +1,60 @@
+"""Network distances against networkx shortest paths"""
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from vc_analysis.network import distance
+
+
+def _graph():
+    G = nx.relabel_nodes(nx.gnm_random_graph(150, 180, seed=4), lambda i: f"vc{i}")
+    G.add_edges_from([('x1', 'x2'), ('x2', 'x3')])
+    G.add_node('isolate')
+    return G
+
+
+def _expected_matrix(G, max_distance):
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    expected = np.full((len(nodes), len(nodes)), distance.UNREACHABLE, dtype=np.int16)
+    for source, lengths in nx.all_pairs_shortest_path_length(G, cutoff=max_distance):
+        for target, d in lengths.items():
+            expected[index[source], index[target]] = d
+    return expected
+
+
+@pytest.mark.parametrize('backend', ['networkx', 'igraph'])
+@pytest.mark.parametrize('max_distance', [3, None])
+def test_distance_matrix_matches_networkx(backend, max_distance):
+    if backend == 'igraph':
+        pytest.importorskip('igraph')
+    G = _graph()
+    D, nodes = distance.distance_matrix(G, max_distance=max_distance, block_size=16, backend=backend)
+
+    assert nodes.tolist() == list(G)
+    assert D.dtype == np.int16
+    assert np.array_equal(D, _expected_matrix(G, max_distance))
+
+
+def test_dyad_distances_match_full_matrix():
+    networks = {2000: _graph(), 2001: nx.relabel_nodes(nx.gnm_random_graph(100, 150, seed=5), lambda i: f"vc{i}")}
+    rng = np.random.default_rng(0)
+    firms = list(networks[2000]) + ['unknown']
+    dyads = pd.DataFrame([
+        {'year': year, 'vc1': rng.choice(firms), 'vc2': rng.choice(firms)}
+        for year in [2000, 2001, 2002] for _ in range(300)
+    ])
+    result = distance.compute_dyad_distances(dyads, networks, max_distance=4, block_size=8)
+
+    matrices = {year: distance.distance_matrix(G, max_distance=4) for year, G in networks.items()}
+    positions = {year: {v: i for i, v in enumerate(nodes)} for year, (_, nodes) in matrices.items()}
+    for row in result.itertuples():
+        position = positions.get(row.year, {})
+        if row.vc1 in position and row.vc2 in position:
+            expected = matrices[row.year][0][position[row.vc1], position[row.vc2]]
+        else:
+            # Unknown firms and years without a network
+            expected = distance.UNREACHABLE
+        assert row.distance == expected, row
@@ -0,0 +1,35 @@
+"""Memory-mapped distance store"""
+
+import networkx as nx
+import numpy as np
+
+from vc_analysis.network import distance, distance_store
+
+
+def test_store_roundtrip_matches_distance_matrix(tmp_path):
+    networks = {
+        2000: nx.relabel_nodes(nx.gnm_random_graph(80, 100, seed=6), lambda i: f"vc{i}"),
+        # Later year with new firms and some firms gone
+        2001: nx.relabel_nodes(nx.gnm_random_graph(90, 120, seed=7), lambda i: f"vc{i + 20}"),
+    }
+    distance_store.build_distance_store(networks, tmp_path, max_distance=5, block_size=16)
+    store = distance_store.load_distance_store(tmp_path)
+    assert isinstance(store['distances'][2000], np.memmap)
+
+    firms = [f"vc{i}" for i in range(110)] + ['unknown']
+    codes = distance_store.firm_codes(tmp_path, firms)
+    assert (codes[:-1] >= 0).all() and codes[-1] == -1
+
+    i, j = np.meshgrid(np.arange(len(firms)), np.arange(len(firms)), indexing='ij')
+    for year, G in networks.items():
+        found = distance_store.lookup_distances(store, year, codes[i], codes[j])
+        D, nodes = distance.distance_matrix(G, max_distance=5)
+        position = {v: k for k, v in enumerate(nodes)}
+        expected = np.full(found.shape, distance.UNREACHABLE, dtype=np.int16)
+        for a, u in enumerate(firms):
+            for b, v in enumerate(firms):
+                if u in position and v in position:
+                    expected[a, b] = D[position[u], position[v]]
+        assert np.array_equal(found, expected)
+
+    assert (distance_store.lookup_distances(store, 1999, codes[i], codes[j]) == distance.UNREACHABLE).all()
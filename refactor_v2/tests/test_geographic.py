@@ -0,0 +1,49 @@
+"""ZIP code normalization and coordinate lookup"""
+
+import numpy as np
+import pandas as pd
+
+from vc_analysis.distance import geographic
+
+
+def _table():
+    return {'zip': np.array([1, 2134, 94305], dtype=np.int32),
+            'lat': np.array([40.0, 42.35, 37.42]),
+            'lng': np.array([-70.0, -71.13, -122.17])}
+
+
+def test_normalize_zip_codes_is_idempotent():
+    raw = np.array(['abc', None, '02134', 94305.0, ' 2134 '], dtype=object)
+    once = geographic.normalize_zip_codes(raw)
+
+    assert once.tolist() == [-1, -1, 2134, 94305, 2134]
+    assert np.array_equal(geographic.normalize_zip_codes(once), once)
+
+
+def test_build_zipcode_database_skips_invalid_zips():
+    # 'abc' must not turn into ZIP 00001
+    firms = pd.DataFrame({'firmzip': ['abc', '02134']})
+    companies = pd.DataFrame({'comzip': [94305.0, np.nan]})
+    db = geographic.build_zipcode_database(firms, companies, table=_table())
+
+    assert db == {'02134': {'lat': 42.35, 'lng': -71.13},
+                  '94305': {'lat': 37.42, 'lng': -122.17}}
+
+
+def test_zip_map_matches_per_row_lookup():
+    zipcode_db = {'00001': {'lat': 40.0, 'lng': -70.0},
+                  '02134': {'lat': 42.35, 'lng': -71.13},
+                  '94305': {'lat': 37.42, 'lng': -122.17}}
+    zips = np.array(['02134', 2134, 2134.0, '94305', None, np.nan, 'abc', '99999', 1, '02134'] * 3,
+                    dtype=object)
+    lat, lng = geographic._map_zip_coordinates(zips, zipcode_db)
+
+    per_row = [geographic.zip_to_coordinates(z, zipcode_db) for z in zips]
+    expected_lat = np.array([np.nan if la is None else la for la, _ in per_row])
+    expected_lng = np.array([np.nan if ln is None else ln for _, ln in per_row])
+    assert np.array_equal(lat, expected_lat, equal_nan=True)
+    assert np.array_equal(lng, expected_lng, equal_nan=True)
+
+    table_lat, table_lng = geographic.lookup_zip_coordinates(zips, _table())
+    assert np.array_equal(table_lat, expected_lat, equal_nan=True)
+    assert np.array_equal(table_lng, expected_lng, equal_nan=True)
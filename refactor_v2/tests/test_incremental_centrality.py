@@ -0,0 +1,25 @@
+"""Incremental local centralities against full recomputation"""
+
+import networkx as nx
+
+from vc_analysis.network import centrality
+
+
+def _labelled_graph(n, m, seed):
+    G = nx.gnm_random_graph(n, m, seed=seed)
+    return nx.relabel_nodes(G, {i: f"f{i}" for i in G})
+
+
+def test_normalized_degree_with_new_firms():
+    # New firms change n, so every node's degree / (n-1) changes
+    G1 = _labelled_graph(200, 600, seed=1)
+    G2 = G1.copy()
+    G2.add_edges_from((f"n{i}", f"f{i}") for i in range(50))
+
+    options = dict(compute_betweenness=False, compute_power=False, normalize_degree=True)
+    df1 = centrality.compute_all_centralities(G1, 2000, **options)
+    df2 = centrality.compute_all_centralities(G2, 2001, previous=(G1, df1),
+                                              verify_incremental=True, **options)
+
+    full = centrality.compute_all_centralities(G2, 2001, **options)
+    assert (df2['dgr_cent'] == full['dgr_cent']).all()
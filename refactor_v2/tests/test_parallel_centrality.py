@@ -0,0 +1,22 @@
+"""Parallel centrality scheduling against the serial loop"""
+
+import networkx as nx
+import pandas as pd
+
+from vc_analysis.network import centrality
+
+
+def test_parallel_schedule_matches_serial():
+    # One large year so that it is split into measure groups
+    networks = {
+        2000: nx.gnm_random_graph(60, 150, seed=1),
+        2001: nx.gnm_random_graph(400, 1600, seed=2),
+        2002: nx.gnm_random_graph(80, 200, seed=3),
+    }
+    jobs = centrality.plan_centrality_jobs(networks, 2)
+    assert any(group is not None for _, year, group in jobs if year == 2001)
+
+    serial = centrality.compute_centralities_for_networks(networks, use_parallel=False)
+    parallel = centrality.compute_centralities_for_networks(networks, use_parallel=True, n_jobs=2)
+
+    pd.testing.assert_frame_equal(parallel, serial)
@@ -0,0 +1,18 @@
+"""Bonacich power centrality"""
+
+import networkx as nx
+import numpy as np
+
+from vc_analysis.network import centrality
+
+
+def test_power_beta_below_one_is_not_clamped():
+    G = nx.gnm_random_graph(80, 240, seed=5)
+    df = centrality.compute_all_centralities(
+        G, 2000, compute_betweenness=False, power_beta_values=[0.995],
+        normalize_power=False, compute_power_max=False)
+
+    A = nx.to_numpy_array(G, nodelist=list(G))
+    beta = 0.995 / np.max(np.linalg.eigvalsh(A))
+    expected = np.linalg.solve(np.eye(len(A)) - beta * A, A.sum(axis=1))
+    assert np.allclose(df['pwr_p99'].to_numpy(), expected, rtol=1e-8)
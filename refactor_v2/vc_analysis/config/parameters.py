@@ -20,6 +20,18 @@ class NetworkParameters:
     use_weighted: bool = True
     directed: bool = False
 
+    # Projection engine: 'networkx' (bipartite.weighted_projected_graph),
+    # 'sparse' (scipy incidence matrix, co-investment counts as B^T·B) or
+    # 'igraph' (igraph bipartite projection with multiplicities)
+    projection_engine: str = 'networkx'
+    # Network output: 'graph' (nx.Graph), 'sparse' ((csr_matrix, firm labels))
+    # or 'csr' (compact CSRGraph)
+    output_format: str = 'graph'
+    # Slide the co-investment window from year to year instead of rebuilding it
+    use_incremental: bool = False
+    # Parallel workers read integer-encoded rounds from memory-mapped files
+    use_shared_memory: bool = False
+
 
 @dataclass
 class CentralityParameters:
@@ -36,6 +48,7 @@ class CentralityParameters:
     use_weighted_power: bool = False  # Use edge weights for power centrality (default: unweighted)
     use_weighted_constraint: bool = False  # Use edge weights for constraint (default: unweighted)
     weight_column: str = 'weight'  # Edge weight attribute name
+    backend: str = 'networkx'  # Graph backend: 'networkx' or 'igraph' (C implementations)
     
     # Normalization settings for each centrality measure
     normalize_degree: bool = False  # Use raw degree count
@@ -57,10 +70,15 @@ class CentralityParameters:
     # Power centrality beta values
     power_beta_values: List[float] = field(default_factory=lambda: [0.0, 0.75, 0.99])
     compute_power_max: bool = True  # Compute pwr_max (1/lambda_max)
+    warm_start_eigen: bool = False  # Seed each year's lambda_max solve with the adjacent year's eigenvector
+    incremental_local_measures: bool = False  # Reuse previous-year local measures for unchanged neighbourhoods
     
     # Approximate betweenness (for large networks)
     use_approximate_betweenness: bool = True
-    betweenness_k: int = 500  # Number of nodes to sample
+    betweenness_k: int = 500  # Number of nodes to sample (compute_all_centralities betweenness_k)
+    betweenness_n_jobs: int = 1  # Parallel jobs for exact betweenness (use_approximate_betweenness=False)
+    betweenness_target_error: Optional[float] = None  # Adaptive sampling until this relative error (None = fixed k)
+    betweenness_seed: int = 42  # Seed for sampled betweenness sources
     
     # Parallel processing
     use_parallel: bool = True
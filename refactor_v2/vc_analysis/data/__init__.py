@@ -3,6 +3,7 @@
 from . import loader
 from . import merger
 from . import filter
+from . import synthetic
 
-__all__ = ['loader', 'merger', 'filter']
+__all__ = ['loader', 'merger', 'filter', 'synthetic']
 
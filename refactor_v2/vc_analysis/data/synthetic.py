@@ -0,0 +1,392 @@
+"""
+Synthetic VC investment data
+
+This module generates round, company, firm and fund tables with the
+column schemas expected by the pipeline (constants.REQUIRED_*_COLUMNS),
+so that every stage can be run, tested and benchmarked without the
+proprietary source files.
+
+The generator is fully vectorized and seeded. Its main features are:
+- investment activity growing over time with a late-1990s boom
+- firm entry and exit (founding year, active lifetime)
+- heavy-tailed firm activity (a few hub VCs) and syndicate sizes
+- ZIP codes clustered in VC hubs (CA, MA, NY, ...)
+- company exits (IPO, M&A, closure) and fund closings
+"""
+
+import pandas as pd
+import numpy as np
+import logging
+from typing import Dict, Optional
+
+from ..config import constants
+
+logger = logging.getLogger(__name__)
+
+# (state code, first ZIP, last ZIP, share of firms/companies)
+ZIP_REGIONS = [
+    ('CA', 90000, 96199, 0.34),
+    ('MA', 1000, 2799, 0.11),
+    ('NY', 10000, 14999, 0.10),
+    ('TX', 75000, 79999, 0.07),
+    ('WA', 98000, 99499, 0.05),
+    ('IL', 60000, 62999, 0.04),
+    ('CO', 80000, 81699, 0.04),
+    ('PA', 15000, 19699, 0.04),
+    ('NJ', 7000, 8999, 0.04),
+    ('GA', 30000, 31999, 0.03),
+    ('NC', 27000, 28999, 0.03),
+    ('FL', 32000, 34999, 0.03),
+    ('MN', 55000, 56799, 0.02),
+    ('VA', 20100, 24699, 0.02),
+    ('OH', 43000, 45999, 0.02),
+    ('MI', 48000, 49999, 0.02),
+]
+
+STAGES = ['Startup/Seed', 'Early Stage', 'Expansion', 'Later Stage']
+
+FIRM_TYPES = {
+    'Independent VC': ('IVC', 0.68),
+    'Corporate VC': ('CVC', 0.12),
+    'Private Equity': ('PE', 0.08),
+    'Angel': ('Angel', 0.05),
+    'Hedge Fund': ('HF', 0.02),
+    'Other': ('Other', 0.05),
+}
+
+
+def _year_weights(years: np.ndarray) -> np.ndarray:
+    """Relative investment activity per year (growth trend plus dot-com boom)"""
+    t = years - years.min()
+    boom = 2.5 * np.exp(-0.5 * ((years - 2000) / 1.2) ** 2)
+    w = np.exp(0.06 * t) * (1 + boom)
+    return w / w.sum()
+
+
+def _sample_zipcodes(rng: np.random.Generator, n: int):
+    """Draw n ZIP codes (5-digit strings) and their state codes from the hub regions"""
+    shares = np.array([r[3] for r in ZIP_REGIONS])
+    region = rng.choice(len(ZIP_REGIONS), size=n, p=shares / shares.sum())
+
+    lo = np.array([r[1] for r in ZIP_REGIONS])[region]
+    hi = np.array([r[2] for r in ZIP_REGIONS])[region]
+    # Concentrate on a limited set of ZIPs per region (office clusters)
+    span = np.maximum((hi - lo) // 25, 1)
+    zips = lo + 25 * rng.integers(0, span + 1, size=n) + rng.integers(0, 5, size=n)
+    zips = np.minimum(zips, hi)
+
+    states = np.array([r[0] for r in ZIP_REGIONS])[region]
+    return pd.Series(zips).astype(str).str.zfill(5).to_numpy(), states
+
+
+def _random_dates(rng: np.random.Generator, years: np.ndarray) -> pd.DatetimeIndex:
+    """Uniform random date within each given year"""
+    start = (np.asarray(years, dtype=np.int64) - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+    days = rng.integers(0, 365, size=len(start)).astype('timedelta64[D]')
+    return pd.DatetimeIndex(start + days)
+
+
+def generate_firm_data(n_firms: int,
+                       start_year: int = 1970,
+                       end_year: int = 2023,
+                       seed: int = constants.RANDOM_SEED) -> pd.DataFrame:
+    """
+    Generate VC firm table
+
+    Parameters
+    ----------
+    n_firms : int
+        Number of firms
+    start_year : int, default=1970
+        First investment year
+    end_year : int, default=2023
+        Last investment year
+    seed : int, default=constants.RANDOM_SEED
+        Random seed
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: firmname, firmfounding, firmtype, firmtype2, firmnation,
+        firmzip, firmstate, plus the generator fields firm_exit_year and
+        firm_activity (used to draw investments)
+    """
+    rng = np.random.default_rng(seed)
+
+    years = np.arange(start_year - 10, end_year + 1)
+    founding_year = rng.choice(years, size=n_firms, p=_year_weights(years))
+    # Active lifetime: most firms stay 5-20 years, some survive for decades
+    lifetime = np.ceil(rng.gamma(shape=2.0, scale=8.0, size=n_firms)).astype(int) + 2
+    exit_year = founding_year + lifetime
+
+    # Heavy-tailed activity: a few hub VCs make most investments
+    activity = rng.pareto(1.3, size=n_firms) + 1.0
+
+    types = list(FIRM_TYPES)
+    type_p = np.array([FIRM_TYPES[t][1] for t in types])
+    firmtype = rng.choice(len(types), size=n_firms, p=type_p / type_p.sum())
+
+    zips, states = _sample_zipcodes(rng, n_firms)
+    # Some firms have no recorded ZIP
+    zips = np.where(rng.random(n_firms) < 0.05, None, zips)
+
+    width = len(str(n_firms))
+    firm_df = pd.DataFrame({
+        'firmname': [f"VC Firm {i:0{width}d}" for i in range(1, n_firms + 1)],
+        'firmfounding': _random_dates(rng, founding_year),
+        'firmtype': np.array(types, dtype=object)[firmtype],
+        'firmtype2': np.array([FIRM_TYPES[t][0] for t in types], dtype=object)[firmtype],
+        'firmnation': 'United States',
+        'firmzip': zips,
+        'firmstate': states,
+        'firm_exit_year': exit_year.astype(np.int16),
+        'firm_activity': activity.astype(np.float32),
+    })
+
+    return firm_df
+
+
+def generate_round_and_company_data(n_rounds: int,
+                                    firm_df: pd.DataFrame,
+                                    start_year: int = 1970,
+                                    end_year: int = 2023,
+                                    max_syndicate_size: int = 30,
+                                    seed: int = constants.RANDOM_SEED):
+    """
+    Generate round table (one row per firm-round participation) and company table
+
+    Parameters
+    ----------
+    n_rounds : int
+        Number of round rows to generate
+    firm_df : pd.DataFrame
+        Firm table from generate_firm_data
+    start_year : int, default=1970
+        First investment year
+    end_year : int, default=2023
+        Last investment year
+    max_syndicate_size : int, default=30
+        Cap on the number of investors per round
+    seed : int, default=constants.RANDOM_SEED
+        Random seed
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]
+        (round_df, company_df)
+    """
+    rng = np.random.default_rng(seed + 1)
+
+    # Heavy-tailed syndicate sizes (Zipf), mean around 2.3
+    mean_syndicate = 2.3
+    n_events = int(np.ceil(n_rounds / mean_syndicate * 1.1)) + 1
+
+    # Companies raise 1-10+ rounds (geometric)
+    rounds_per_company = np.minimum(rng.geometric(0.4, size=n_events), 15)
+    n_companies = int(np.searchsorted(np.cumsum(rounds_per_company), n_events)) + 1
+    rounds_per_company = rounds_per_company[:n_companies]
+
+    years = np.arange(start_year, end_year + 1)
+    company_first_year = rng.choice(years, size=n_companies, p=_year_weights(years))
+
+    # Expand to round events: round k happens 0-3 years after round k-1
+    company_idx = np.repeat(np.arange(n_companies), rounds_per_company)
+    round_start = np.cumsum(rounds_per_company) - rounds_per_company
+    round_number = np.arange(len(company_idx)) - np.repeat(round_start, rounds_per_company) + 1
+    gaps = np.where(round_number == 1, 0, rng.poisson(0.9, size=len(company_idx)))
+    gap_cumsum = np.cumsum(gaps)
+    offset = gap_cumsum - np.repeat(gap_cumsum[round_start], rounds_per_company)
+    event_year = company_first_year[company_idx] + offset
+
+    keep = event_year <= end_year
+    company_idx, round_number, event_year = company_idx[keep], round_number[keep], event_year[keep]
+
+    # Syndicate size per round event
+    syndicate = np.minimum(rng.zipf(2.2, size=len(company_idx)), max_syndicate_size)
+    row_event = np.repeat(np.arange(len(company_idx)), syndicate)[:n_rounds]
+    if len(row_event) < n_rounds:
+        logger.warning(f"Generated {len(row_event)} round rows (requested {n_rounds})")
+
+    row_year = event_year[row_event]
+
+    # Investors: active firms drawn proportionally to activity, year by year
+    firm_found = pd.to_datetime(firm_df['firmfounding']).dt.year.to_numpy()
+    firm_exit = firm_df['firm_exit_year'].to_numpy()
+    firm_activity = firm_df['firm_activity'].to_numpy(dtype=float)
+    row_firm = np.empty(len(row_event), dtype=np.int64)
+
+    order = np.argsort(row_year, kind='stable')
+    sorted_years = row_year[order]
+    unique_years, starts = np.unique(sorted_years, return_index=True)
+    bounds = np.append(starts, len(sorted_years))
+    for i, year in enumerate(unique_years):
+        idx = order[bounds[i]:bounds[i + 1]]
+        active = np.flatnonzero((firm_found <= year) & (firm_exit >= year))
+        if len(active) == 0:
+            active = np.arange(len(firm_df))
+        p = firm_activity[active] / firm_activity[active].sum()
+        row_firm[idx] = rng.choice(active, size=len(idx), p=p)
+
+    # Round attributes
+    stage_idx = np.minimum(round_number[row_event] - 1, len(STAGES) - 1)
+    stage_idx = np.clip(stage_idx + rng.integers(-1, 2, size=len(row_event)), 0, len(STAGES) - 1)
+    event_amount = rng.lognormal(mean=7.0, sigma=1.2, size=len(company_idx)) * \
+        (1 + 0.8 * (round_number - 1))
+    event_date = _random_dates(rng, event_year)
+
+    amount = (event_amount[row_event] / syndicate[row_event]).astype(np.float32)
+    disclosed = np.where(rng.random(len(row_event)) < 0.35, np.nan, amount)
+    estimated = np.where(rng.random(len(row_event)) < 0.10, np.nan,
+                         amount * rng.uniform(0.8, 1.2, size=len(row_event)))
+
+    width = len(str(n_companies))
+    company_names = np.array([f"Company {i:0{width}d}" for i in range(1, n_companies + 1)], dtype=object)
+
+    round_df = pd.DataFrame({
+        'firmname': firm_df['firmname'].to_numpy()[row_firm],
+        'comname': company_names[company_idx[row_event]],
+        'rnddate': event_date[row_event],
+        'year': row_year.astype(np.int16),
+        'RoundNumber': round_number[row_event].astype(np.int16),
+        'RoundAmountDisclosedThou': disclosed.astype(np.float32),
+        'RoundAmountEstimatedThou': estimated.astype(np.float32),
+        'CompanyStageLevel1': np.array(STAGES, dtype=object)[stage_idx],
+    })
+
+    # Company table: exits after the last round
+    last_year = np.full(n_companies, start_year)
+    np.maximum.at(last_year, company_idx, event_year)
+    outcome = rng.choice(4, size=n_companies, p=[0.08, 0.22, 0.25, 0.45])
+    situ = np.array(['Went Public', 'Acquisition', 'Defunct', 'Active'], dtype=object)[outcome]
+    situ = np.where((outcome == 1) & (rng.random(n_companies) < 0.4), 'Merger', situ)
+    exit_year = last_year + rng.integers(1, 7, size=n_companies)
+    exited = (outcome < 3) & (exit_year <= end_year)
+    situ = np.where((outcome < 3) & ~exited, 'Active', situ)
+    sit_date = _random_dates(rng, exit_year)
+
+    industries = [ind for group in constants.INDUSTRY_CODES.values() for ind in group]
+    ind_p = rng.dirichlet(np.ones(len(industries)) * 2)
+    com_zips, com_states = _sample_zipcodes(rng, n_companies)
+
+    company_df = pd.DataFrame({
+        'comname': company_names,
+        'comsitu': situ,
+        'date_sit': pd.Series(sit_date).where(exited),
+        'date_ipo': pd.Series(sit_date).where(exited & (situ == 'Went Public')),
+        'date_fnd': _random_dates(rng, company_first_year - rng.integers(0, 4, size=n_companies)),
+        'comindmnr': np.array(industries, dtype=object)[rng.choice(len(industries), size=n_companies, p=ind_p)],
+        'comnation': 'United States',
+        'comzip': com_zips,
+        'comstate': com_states,
+        'comstage1': np.array(STAGES, dtype=object)[rng.integers(0, len(STAGES), size=n_companies)],
+    })
+
+    # Only companies that appear in round data
+    company_df = company_df[company_df['comname'].isin(pd.unique(round_df['comname']))]
+
+    return round_df, company_df.reset_index(drop=True)
+
+
+def generate_fund_data(firm_df: pd.DataFrame,
+                       end_year: int = 2023,
+                       seed: int = constants.RANDOM_SEED) -> pd.DataFrame:
+    """
+    Generate fund table (fund closings every few years while a firm is active)
+
+    Parameters
+    ----------
+    firm_df : pd.DataFrame
+        Firm table from generate_firm_data
+    end_year : int, default=2023
+        Last year
+    seed : int, default=constants.RANDOM_SEED
+        Random seed
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: fundname, firmname, fundyear, fundiniclosing (dd.mm.yyyy), fundsize
+    """
+    rng = np.random.default_rng(seed + 2)
+
+    found = pd.to_datetime(firm_df['firmfounding']).dt.year.to_numpy()
+    last = np.minimum(firm_df['firm_exit_year'].to_numpy(), end_year)
+    activity = firm_df['firm_activity'].to_numpy(dtype=float)
+
+    # Roughly one fund every 3-5 years
+    n_funds = np.maximum(1, (np.maximum(last - found, 0) / rng.uniform(3, 5, size=len(firm_df))).astype(int))
+    firm_idx = np.repeat(np.arange(len(firm_df)), n_funds)
+    fund_seq = np.arange(len(firm_idx)) - np.repeat(np.cumsum(n_funds) - n_funds, n_funds)
+    span = np.maximum(last - found, 0)[firm_idx]
+    fund_year = found[firm_idx] + np.floor(span * fund_seq / n_funds[firm_idx]).astype(int) + \
+        rng.integers(0, 2, size=len(firm_idx))
+    fund_year = np.minimum(fund_year, end_year)
+
+    closing = _random_dates(rng, fund_year).strftime('%d.%m.%Y')
+    closing = np.where(rng.random(len(firm_idx)) < 0.1, None, closing)
+    size = rng.lognormal(mean=4.0, sigma=1.0, size=len(firm_idx)) * np.sqrt(activity[firm_idx]) * \
+        (1 + 0.3 * fund_seq)
+
+    firmnames = firm_df['firmname'].to_numpy()[firm_idx]
+    fund_df = pd.DataFrame({
+        'fundname': [f"{name} Fund {k + 1}" for name, k in zip(firmnames, fund_seq)],
+        'firmname': firmnames,
+        'fundyear': fund_year.astype(np.int16),
+        'fundiniclosing': closing,
+        'fundsize': size.astype(np.float32),
+    })
+
+    return fund_df
+
+
+def generate_synthetic_data(n_rounds: int = 100_000,
+                            n_firms: Optional[int] = None,
+                            start_year: int = constants.ANALYSIS_CONSTANTS['MIN_YEAR'],
+                            end_year: int = constants.ANALYSIS_CONSTANTS['MAX_YEAR'],
+                            seed: int = constants.RANDOM_SEED) -> Dict[str, pd.DataFrame]:
+    """
+    Generate a complete synthetic dataset
+
+    Scales from 10k to 10M round rows; the same seed always gives the
+    same data. Output has the same keys as loader.load_all_data.
+
+    Parameters
+    ----------
+    n_rounds : int, default=100_000
+        Number of round rows (firm-round participations)
+    n_firms : Optional[int], default=None
+        Number of VC firms (default: about one firm per 20 round rows,
+        at least 50)
+    start_year : int, default=1970
+        First investment year
+    end_year : int, default=2023
+        Last investment year
+    seed : int, default=constants.RANDOM_SEED
+        Random seed
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Dictionary with keys: 'round', 'company', 'firm', 'fund'
+    """
+    if n_firms is None:
+        n_firms = max(50, n_rounds // 20)
+
+    logger.info(f"Generating synthetic data: {n_rounds:,} round rows, {n_firms:,} firms (seed={seed})")
+
+    firm_df = generate_firm_data(n_firms, start_year, end_year, seed=seed)
+    round_df, company_df = generate_round_and_company_data(n_rounds, firm_df, start_year, end_year, seed=seed)
+    fund_df = generate_fund_data(firm_df, end_year, seed=seed)
+
+    data = {
+        'round': round_df,
+        'company': company_df,
+        'firm': firm_df.drop(columns=['firm_exit_year', 'firm_activity']),
+        'fund': fund_df,
+    }
+
+    for name, df in data.items():
+        memory_mb = df.memory_usage(deep=True).sum() / 1024**2
+        logger.info(f"{name}: {len(df)} rows, {len(df.columns)} columns, {memory_mb:.2f} MB")
+
+    return data
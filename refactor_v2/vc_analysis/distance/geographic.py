@@ -8,10 +8,11 @@ based on ZIP codes using the Haversine formula.
 import pandas as pd
 import numpy as np
 from math import radians, cos, sin, asin, sqrt
-from typing import Optional, Dict, List
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple, Union
 import logging
-from joblib import Parallel, delayed
-from tqdm import tqdm
+
+from ..config import paths
 
 logger = logging.getLogger(__name__)
 
@@ -179,13 +180,181 @@ def zip_to_coordinates(zip_code, zipcode_db: Optional[Dict[str, Dict]] = None) -
     return (None, None)
 
 
+def _map_zip_coordinates(zip_codes, zipcode_db: Optional[Dict[str, Dict]]) -> Tuple[np.ndarray, np.ndarray]:
+    """(lat, lng) per row: zip_to_coordinates once per distinct ZIP, broadcast with np.take"""
+    codes, uniques = pd.factorize(np.asarray(zip_codes, dtype=object))
+    coords = [zip_to_coordinates(z, zipcode_db) for z in uniques]
+    # Trailing NaN slot for missing ZIPs (code -1)
+    lat = np.array([np.nan if c[0] is None else c[0] for c in coords] + [np.nan], dtype=float)
+    lng = np.array([np.nan if c[1] is None else c[1] for c in coords] + [np.nan], dtype=float)
+    return np.take(lat, codes), np.take(lng, codes)
+
+
+def default_zipcode_table_path() -> Path:
+    """Default location of the ZIP centroid table"""
+    return paths.get_cache_path('zip_centroids', 'npz')
+
+
+def normalize_zip_codes(zip_codes) -> np.ndarray:
+    """
+    Vectorized normalize_zip_code returning integer ZIP codes
+
+    Numeric input (e.g. a ZIP column read as float) is handled with array
+    arithmetic; other input is normalized once per distinct value.
+
+    Parameters
+    ----------
+    zip_codes : array-like
+        ZIP codes in any format accepted by normalize_zip_code
+
+    Returns
+    -------
+    np.ndarray
+        int32 ZIP codes (01234 -> 1234), -1 where normalize_zip_code gives None
+        or the number is negative
+    """
+    values = np.asarray(zip_codes)
+
+    if values.dtype.kind in 'iuf':
+        # Negative numbers are invalid, so the -1 sentinel stays -1 and the
+        # output can be normalized again
+        values = values.astype(float)
+        valid = np.isfinite(values) & (values == np.floor(values)) & (values >= 0) & (values < 100000)
+        return np.where(valid, values, -1).astype(np.int32)
+
+    codes, uniques = pd.factorize(values)
+    normalized = np.array([normalize_zip_code(z) for z in uniques], dtype=object)
+    unique_ints = np.array([-1 if z is None else int(z) for z in normalized], dtype=np.int32)
+    return np.where(codes >= 0, unique_ints[np.maximum(codes, 0)], -1).astype(np.int32)
+
+
+def build_zipcode_table(source: Optional[Union[pd.DataFrame, str, Path]] = None,
+                        path: Optional[Union[str, Path]] = None,
+                        zip_col: str = 'zip',
+                        lat_col: str = 'lat',
+                        lng_col: str = 'lng') -> Dict[str, np.ndarray]:
+    """
+    Build the local ZIP centroid table (one-time step)
+
+    The table is saved as sorted arrays in an .npz file so that lookups
+    (lookup_zip_coordinates) are a single searchsorted with no per-ZIP
+    library calls and no network access.
+
+    Parameters
+    ----------
+    source : pd.DataFrame, str, Path or None, default=None
+        ZIP centroids as a DataFrame or a CSV/TSV file (e.g. the Census
+        ZCTA Gazetteer file with zip_col='GEOID', lat_col='INTPTLAT',
+        lng_col='INTPTLONG'). If None, all ZIPs of uszipcode's local
+        database are read in one query.
+    path : str or Path, optional
+        Output file (default_zipcode_table_path() if None)
+    zip_col : str, default='zip'
+        ZIP column of source
+    lat_col : str, default='lat'
+        Latitude column of source
+    lng_col : str, default='lng'
+        Longitude column of source
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        'zip' (sorted int32), 'lat' and 'lng' (float64)
+    """
+    if source is None:
+        if not HAS_USZIPCODE:
+            raise ImportError("build_zipcode_table needs a source file or the uszipcode library")
+        search = SearchEngine()
+        rows = search.ses.query(SimpleZipcode.zipcode, SimpleZipcode.lat, SimpleZipcode.lng).all()
+        source = pd.DataFrame(rows, columns=[zip_col, lat_col, lng_col])
+    elif not isinstance(source, pd.DataFrame):
+        sep = '\t' if str(source).endswith(('.txt', '.tsv')) else ','
+        source = pd.read_csv(source, sep=sep, dtype={zip_col: str})
+        source.columns = source.columns.str.strip()
+
+    zips = normalize_zip_codes(source[zip_col].to_numpy())
+    lat = pd.to_numeric(source[lat_col], errors='coerce').to_numpy(dtype=float)
+    lng = pd.to_numeric(source[lng_col], errors='coerce').to_numpy(dtype=float)
+
+    valid = (zips >= 0) & np.isfinite(lat) & np.isfinite(lng)
+    zips, lat, lng = zips[valid], lat[valid], lng[valid]
+    # Sort and keep the first centroid of duplicated ZIPs
+    zips, first = np.unique(zips, return_index=True)
+    table = {'zip': zips.astype(np.int32), 'lat': lat[first], 'lng': lng[first]}
+
+    path = Path(path) if path is not None else default_zipcode_table_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, **table)
+    logger.info(f"Saved {len(zips):,} ZIP centroids to {path}")
+    return table
+
+
+def load_zipcode_table(path: Optional[Union[str, Path]] = None) -> Dict[str, np.ndarray]:
+    """
+    Load the ZIP centroid table written by build_zipcode_table
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Table file (default_zipcode_table_path() if None)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        'zip' (sorted int32), 'lat' and 'lng' (float64)
+    """
+    path = Path(path) if path is not None else default_zipcode_table_path()
+    if not path.exists():
+        raise FileNotFoundError(f"ZIP centroid table not found at {path}. Run build_zipcode_table first.")
+    with np.load(path, allow_pickle=False) as f:
+        return {name: f[name] for name in ('zip', 'lat', 'lng')}
+
+
+def lookup_zip_coordinates(zip_codes,
+                           table: Optional[Dict[str, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ZIP code to (lat, lng) lookup in the ZIP centroid table
+
+    Parameters
+    ----------
+    zip_codes : array-like
+        ZIP codes in any format accepted by normalize_zip_code
+    table : dict, optional
+        Output of load_zipcode_table (loaded from the default path if None)
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (latitude, longitude) arrays, NaN where the ZIP is invalid or unknown
+    """
+    if table is None:
+        table = load_zipcode_table()
+
+    zips = normalize_zip_codes(zip_codes)
+    lat = np.full(len(zips), np.nan)
+    lng = np.full(len(zips), np.nan)
+    if len(table['zip']) == 0:
+        return lat, lng
+
+    pos = np.minimum(np.searchsorted(table['zip'], zips), len(table['zip']) - 1)
+    found = (zips >= 0) & (table['zip'][pos] == zips)
+    lat[found] = table['lat'][pos[found]]
+    lng[found] = table['lng'][pos[found]]
+    return lat, lng
+
+
 def build_zipcode_database(firm_df: pd.DataFrame,
                           company_df: pd.DataFrame,
                           firmzip_col: str = 'firmzip',
-                          comzip_col: str = 'comzip') -> Dict[str, Dict]:
+                          comzip_col: str = 'comzip',
+                          table: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, Dict]:
     """
     Build ZIP code to coordinates database from firm and company data
     
+    Coordinates come from the local ZIP centroid table (see
+    build_zipcode_table). If no table exists yet, it is built once from
+    uszipcode's local database.
+    
     Parameters
     ----------
     firm_df : pd.DataFrame
@@ -196,6 +365,8 @@ def build_zipcode_database(firm_df: pd.DataFrame,
         Column name for firm ZIP code
     comzip_col : str
         Column name for company ZIP code
+    table : dict, optional
+        ZIP centroid table (load_zipcode_table() if None)
     
     Returns
     -------
@@ -222,49 +393,33 @@ def build_zipcode_database(firm_df: pd.DataFrame,
     logger.info(f"  Total unique ZIP codes: {len(unique_zips)}")
     
     # Convert ZIP codes to coordinates
-    if HAS_USZIPCODE:
-        search = SearchEngine()
-        converted = 0
-        failed = 0
-        failed_samples = []  # Store samples of failed ZIP codes for debugging
-        
-        for zip_code in unique_zips:
-            zip_normalized = normalize_zip_code(zip_code)
-            if zip_normalized is None:
-                failed += 1
-                if len(failed_samples) < 10:  # Store first 10 failed samples
-                    failed_samples.append((zip_code, "normalization_failed"))
-                continue
-            
-            # Skip if already in database
-            if zip_normalized in zipcode_db:
-                continue
-            
-            try:
-                result = search.by_zipcode(zip_normalized)
-                if result and result.lat and result.lng:
-                    zipcode_db[zip_normalized] = {
-                        'lat': result.lat,
-                        'lng': result.lng
-                    }
-                    converted += 1
-                else:
-                    failed += 1
-                    if len(failed_samples) < 10:
-                        failed_samples.append((zip_code, zip_normalized, "not_found_in_uszipcode"))
-            except Exception as e:
-                logger.debug(f"Error looking up ZIP {zip_normalized}: {e}")
-                failed += 1
-                if len(failed_samples) < 10:
-                    failed_samples.append((zip_code, zip_normalized, f"exception: {str(e)[:50]}"))
-        
-        logger.info(f"  Converted: {converted:,}, Failed: {failed:,} ({failed/(converted+failed)*100:.1f}%)")
-        if failed_samples:
-            logger.info(f"  Sample failed ZIP codes (original -> normalized -> reason):")
-            for sample in failed_samples[:5]:
-                logger.info(f"    {sample}")
-    else:
-        logger.warning("  uszipcode library not available. Cannot build ZIP code database.")
+    if table is None:
+        try:
+            table = load_zipcode_table()
+        except FileNotFoundError:
+            if not HAS_USZIPCODE:
+                logger.warning("  No ZIP centroid table and uszipcode library not available. "
+                               "Cannot build ZIP code database.")
+                return zipcode_db
+            table = build_zipcode_table()
+    
+    unique_zips = np.array(list(unique_zips), dtype=object)
+    zips = normalize_zip_codes(unique_zips)
+    lat, lng = lookup_zip_coordinates(unique_zips, table)
+    found = ~np.isnan(lat)
+    
+    for z, la, ln in zip(zips[found], lat[found], lng[found]):
+        zipcode_db[f"{z:05d}"] = {'lat': float(la), 'lng': float(ln)}
+    
+    converted = len(zipcode_db)
+    failed = int((~found).sum())
+    logger.info(f"  Converted: {converted:,}, Failed: {failed:,} ({failed/max(len(zips), 1)*100:.1f}%)")
+    if failed:
+        samples = [(z, "normalization_failed" if n < 0 else "not_found_in_table")
+                   for z, n in zip(unique_zips[~found][:5], zips[~found][:5])]
+        logger.info(f"  Sample failed ZIP codes (original -> reason):")
+        for sample in samples:
+            logger.info(f"    {sample}")
     
     return zipcode_db
 
@@ -340,47 +495,14 @@ def calculate_vc_company_distances(round_df: pd.DataFrame,
         how='left'
     )
     
-    # Convert ZIP codes to coordinates (parallelized)
-    logger.info("Converting ZIP codes to coordinates (parallelized)...")
-    
-    def _convert_zip_batch(zip_codes, zipcode_db):
-        """Convert a batch of ZIP codes to coordinates"""
-        results = []
-        for zip_code in zip_codes:
-            lat, lng = zip_to_coordinates(zip_code, zipcode_db)
-            results.append((lat, lng))
-        return results
-    
-    # Parallel ZIP code conversion
-    from vc_analysis.config.parameters import ParallelParameters
-    n_jobs = ParallelParameters.n_jobs
-    
-    # Split into chunks for parallel processing
-    chunk_size = max(1000, len(round_with_zips) // (n_jobs * 4) if n_jobs > 0 else len(round_with_zips) // 4)
-    
-    # Process firm ZIP codes
-    firm_zips = round_with_zips[firmzip_col].tolist()
-    firm_coords = Parallel(n_jobs=n_jobs)(
-        delayed(_convert_zip_batch)(
-            firm_zips[i:i+chunk_size], zipcode_db
-        )
-        for i in range(0, len(firm_zips), chunk_size)
+    # Convert ZIP codes to coordinates (once per unique ZIP)
+    logger.info("Converting ZIP codes to coordinates...")
+    round_with_zips['firm_lat'], round_with_zips['firm_lng'] = _map_zip_coordinates(
+        round_with_zips[firmzip_col].to_numpy(), zipcode_db
     )
-    firm_coords = [coord for batch in firm_coords for coord in batch]
-    round_with_zips['firm_lat'] = [c[0] for c in firm_coords]
-    round_with_zips['firm_lng'] = [c[1] for c in firm_coords]
-    
-    # Process company ZIP codes
-    com_zips = round_with_zips[comzip_col].tolist()
-    com_coords = Parallel(n_jobs=n_jobs)(
-        delayed(_convert_zip_batch)(
-            com_zips[i:i+chunk_size], zipcode_db
-        )
-        for i in range(0, len(com_zips), chunk_size)
+    round_with_zips['com_lat'], round_with_zips['com_lng'] = _map_zip_coordinates(
+        round_with_zips[comzip_col].to_numpy(), zipcode_db
     )
-    com_coords = [coord for batch in com_coords for coord in batch]
-    round_with_zips['com_lat'] = [c[0] for c in com_coords]
-    round_with_zips['com_lng'] = [c[1] for c in com_coords]
     
     # Calculate distances (vectorized)
     logger.info("Calculating distances (vectorized)...")
@@ -543,43 +665,19 @@ def calculate_vc_copartner_distances(round_df: pd.DataFrame,
         how='left'
     )
     
-    # Convert firm ZIP codes to coordinates (parallelized)
-    logger.info("Converting firm ZIP codes to coordinates (parallelized)...")
-    
-    def _convert_zip_batch(zip_codes, zipcode_db):
-        """Convert a batch of ZIP codes to coordinates"""
-        results = []
-        for zip_code in zip_codes:
-            lat, lng = zip_to_coordinates(zip_code, zipcode_db)
-            results.append((lat, lng))
-        return results
-    
-    # Parallel ZIP code conversion
-    from vc_analysis.config.parameters import ParallelParameters
-    n_jobs = ParallelParameters.n_jobs
-    
-    # Split into chunks for parallel processing
-    firm_zips = round_with_firmzip[firmzip_col].tolist()
-    chunk_size = max(1000, len(firm_zips) // (n_jobs * 4) if n_jobs > 0 else len(firm_zips) // 4)
-    
-    firm_coords = Parallel(n_jobs=n_jobs)(
-        delayed(_convert_zip_batch)(
-            firm_zips[i:i+chunk_size], zipcode_db
-        )
-        for i in range(0, len(firm_zips), chunk_size)
+    # Convert firm ZIP codes to coordinates (once per unique ZIP)
+    logger.info("Converting firm ZIP codes to coordinates...")
+    round_with_firmzip['firm_lat'], round_with_firmzip['firm_lng'] = _map_zip_coordinates(
+        round_with_firmzip[firmzip_col].to_numpy(), zipcode_db
     )
-    firm_coords = [coord for batch in firm_coords for coord in batch]
-    round_with_firmzip['firm_lat'] = [c[0] for c in firm_coords]
-    round_with_firmzip['firm_lng'] = [c[1] for c in firm_coords]
     
     # Find co-investment partners (firms investing in same company in same round)
     logger.info("Identifying co-investment partners...")
     
-    # Create round identifier (company + year)
-    round_with_firmzip['round_id'] = (
-        round_with_firmzip[comname_col].astype(str) + '_' +
-        round_with_firmzip[year_col].astype(str)
-    )
+    # Create round identifier (integer code per company-year)
+    round_with_firmzip['round_id'] = round_with_firmzip.groupby(
+        [comname_col, year_col], sort=False, dropna=False, observed=True
+    ).ngroup()
     
     # Vectorized approach: Calculate all co-partner distances at once
     logger.info("Calculating co-partner distances (vectorized)...")
@@ -1,9 +1,13 @@
 """Network construction and analysis"""
 
+from . import csr_graph
+from . import backends
 from . import construction
+from . import cache
 from . import centrality
 from . import distance
+from . import distance_store
 from . import imprinting
 
-__all__ = ['construction', 'centrality', 'distance', 'imprinting']
+__all__ = ['csr_graph', 'backends', 'construction', 'cache', 'centrality', 'distance', 'distance_store', 'imprinting']
 
@@ -0,0 +1,257 @@
+"""
+On-disk cache for year networks
+
+Each year network is stored as a compressed .npz edge list under
+paths.CACHE_DIR / 'networks'. Files are keyed by a fingerprint of the
+round rows in the year's window plus the network parameters, so a cache
+entry is only reused when neither the underlying data nor the
+parameters changed. Writing a new entry for a year removes that year's
+stale entries for the same parameters; entries for other parameter sets
+are kept.
+"""
+
+import hashlib
+import numbers
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..config import paths
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUBDIR = 'networks'
+CACHE_VERSION = 3
+
+
+def default_cache_dir() -> Path:
+    """Default directory for cached year networks"""
+    return paths.CACHE_DIR / CACHE_SUBDIR
+
+
+def compute_year_fingerprints(round_df: pd.DataFrame,
+                              firm_col: str = 'firmname',
+                              event_col: str = 'event',
+                              year_col: str = 'year',
+                              company_col: str = 'comname') -> Dict[int, str]:
+    """
+    Fingerprint the network-relevant round columns of every calendar year
+
+    Rows are hashed with pd.util.hash_pandas_object on the firm, event (or
+    company, if no event column exists) and year columns. Row hashes are
+    sorted within each year, so row order does not affect the fingerprint.
+
+    Parameters
+    ----------
+    round_df : pd.DataFrame
+        Investment round data
+    firm_col : str, default='firmname'
+        Firm column name
+    event_col : str, default='event'
+        Event column name
+    year_col : str, default='year'
+        Year column name
+    company_col : str, default='comname'
+        Company column used when event_col is missing
+
+    Returns
+    -------
+    Dict[int, str]
+        {year: sha256 hex digest}
+    """
+    cols = [firm_col, event_col if event_col in round_df.columns else company_col, year_col]
+    row_hashes = pd.util.hash_pandas_object(round_df[cols], index=False).to_numpy()
+    years = round_df[year_col].to_numpy()
+
+    valid = pd.notna(years)
+    row_hashes, years = row_hashes[valid], years[valid].astype(np.int64)
+
+    order = np.lexsort((row_hashes, years))
+    row_hashes, years = row_hashes[order], years[order]
+
+    unique_years, starts = np.unique(years, return_index=True)
+    bounds = np.append(starts, len(years))
+
+    return {
+        int(year): hashlib.sha256(row_hashes[bounds[i]:bounds[i + 1]].tobytes()).hexdigest()
+        for i, year in enumerate(unique_years)
+    }
+
+
+def network_cache_key(window_years: Iterable[int],
+                      year_fingerprints: Dict[int, str],
+                      **network_params) -> str:
+    """
+    Cache key for one year network
+
+    Parameters
+    ----------
+    window_years : Iterable[int]
+        Calendar years covered by the network's time window
+    year_fingerprints : Dict[int, str]
+        Output of compute_year_fingerprints
+    **network_params : dict
+        Parameters that affect the network (e.g. time_window, edge_cutpoint)
+
+    Returns
+    -------
+    str
+        '<parameter digest>-<data digest>' (sha256 hex digests; the data
+        digest also covers the parameters)
+    """
+    params = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for name in sorted(network_params):
+        params.update(f"{name}={network_params[name]!r};".encode())
+
+    h = params.copy()
+    for year in window_years:
+        h.update(f"{year}:{year_fingerprints.get(int(year), 'empty')};".encode())
+    return f"{params.hexdigest()}-{h.hexdigest()}"
+
+
+def _cache_file(cache_dir: Path, year: int, key: str) -> Path:
+    params, data = key.split('-')
+    return Path(cache_dir) / f"vc_network_{year}_{params[:12]}_{data[:16]}.npz"
+
+
+def load_cached_network(cache_dir: Path, year: int, key: str) -> Optional[Tuple[sp.csr_matrix, np.ndarray]]:
+    """
+    Load a cached year network
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Cache directory
+    year : int
+        Target year
+    key : str
+        Cache key from network_cache_key
+
+    Returns
+    -------
+    Optional[Tuple[sp.csr_matrix, np.ndarray]]
+        (co-investment matrix, firm labels), or None on a cache miss
+    """
+    path = _cache_file(cache_dir, year, key)
+    if not path.exists():
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as f:
+            if str(f['key']) != key:
+                return None
+            stored = f['firm_labels']
+            if bool(f['numpy_scalars']):
+                labels = np.fromiter(stored, dtype=object, count=len(stored))
+            else:
+                labels = stored.astype(object)
+            n = len(labels)
+            upper = sp.coo_matrix((f['weight'], (f['source'], f['target'])), shape=(n, n))
+    except Exception as e:
+        logger.warning(f"Error reading cached network {path}: {e}")
+        return None
+
+    W = (upper + upper.T).tocsr()
+    W.sort_indices()
+    logger.info(f"Year {year}: loaded cached network ({n} VCs, {W.nnz // 2} edges)")
+    return W, labels
+
+
+def save_cached_network(cache_dir: Path,
+                        year: int,
+                        key: str,
+                        W: sp.csr_matrix,
+                        firm_labels: np.ndarray) -> Optional[Path]:
+    """
+    Save a year network as an upper-triangle edge list and drop stale entries
+
+    Labels are stored as strings or int64, whichever they all are, along
+    with whether they were numpy or Python scalars (the networkx engine
+    gives numpy integers, the sparse ones Python ints), so cache hits
+    return the same label values and types as a fresh build. Networks with
+    other labels are not cached.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Cache directory
+    year : int
+        Target year
+    key : str
+        Cache key from network_cache_key
+    W : sp.csr_matrix
+        Symmetric co-investment matrix
+    firm_labels : np.ndarray
+        Firm labels aligned with W
+
+    Returns
+    -------
+    Optional[Path]
+        Path of the cache file (None if the labels cannot be stored)
+    """
+    labels = np.asarray(firm_labels, dtype=object)
+    numpy_scalars = len(labels) > 0 and isinstance(labels[0], np.generic)
+    if all(isinstance(label, str) for label in labels):
+        labels = labels.astype(str)
+    elif all(isinstance(label, numbers.Integral) and not isinstance(label, bool) for label in labels):
+        labels = labels.astype(np.int64)
+    else:
+        logger.warning(f"Year {year}: firm labels are not all strings or all integers; network not cached")
+        return None
+
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = _cache_file(cache_dir, year, key)
+
+    upper = sp.triu(W, k=1).tocoo()
+    index_dtype = np.int32 if W.shape[0] < np.iinfo(np.int32).max else np.int64
+    np.savez_compressed(
+        path,
+        key=np.array(key),
+        firm_labels=labels,
+        numpy_scalars=np.array(numpy_scalars),
+        source=upper.row.astype(index_dtype),
+        target=upper.col.astype(index_dtype),
+        weight=upper.data
+    )
+
+    # Same year and parameters, older data
+    for stale in cache_dir.glob(f"vc_network_{year}_{key.split('-')[0][:12]}_*.npz"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+    return path
+
+
+def clear_network_cache(cache_dir: Optional[Path] = None, years: Optional[List[int]] = None) -> int:
+    """
+    Delete cached year networks
+
+    Parameters
+    ----------
+    cache_dir : Optional[Path], default=None
+        Cache directory (default_cache_dir() if None)
+    years : Optional[List[int]], default=None
+        Years to delete (all years if None)
+
+    Returns
+    -------
+    int
+        Number of files deleted
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    if not cache_dir.exists():
+        return 0
+
+    patterns = [f"vc_network_{year}_*.npz" for year in years] if years else ["vc_network_*.npz"]
+    removed = 0
+    for pattern in patterns:
+        for path in cache_dir.glob(pattern):
+            path.unlink(missing_ok=True)
+            removed += 1
+
+    logger.info(f"Removed {removed} cached networks from {cache_dir}")
+    return removed
@@ -11,14 +11,38 @@ This module implements various centrality measures including:
 import pandas as pd
 import numpy as np
 import networkx as nx
-from scipy.sparse.linalg import eigs
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+import inspect
+import json
 import logging
-from typing import Optional, Dict, List
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Dict, List, Tuple, Union
+
+from . import backends
+from .csr_graph import CSRGraph, as_networkx, adjacency_matrix
 
 logger = logging.getLogger(__name__)
 
+# Sampled betweenness uses this many pivot sources on graphs larger than it
+BETWEENNESS_PIVOTS = 500
+# Sources per chunk of source-partitioned exact betweenness
+BETWEENNESS_CHUNK_SIZE = 256
+# Adaptive betweenness: sources per batch and batches before it may stop
+ADAPTIVE_BETWEENNESS_BATCH = 32
+ADAPTIVE_BETWEENNESS_MIN_BATCHES = 8
+# Typical number of sources drawn by adaptive betweenness (cost model only)
+ADAPTIVE_BETWEENNESS_SOURCES = 256
+# Power centrality: sparse LU solve up to this many nodes, CG above
+POWER_DIRECT_MAX_NODES = 2000
+
 
-def compute_degree_centrality(G: nx.Graph, 
+def compute_degree_centrality(G: Union[nx.Graph, CSRGraph], 
                              normalized: bool = False,
                              weighted: bool = False,
                              weight: str = 'weight') -> Dict[str, float]:
@@ -27,7 +51,7 @@ def compute_degree_centrality(G: nx.Graph,
     
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         Network
     normalized : bool, default=False
         If True, normalize by (n-1). If False, return raw degree count.
@@ -41,34 +65,288 @@ def compute_degree_centrality(G: nx.Graph,
     Dict[str, float]
         Degree centrality values
     """
-    if weighted:
-        # Weighted degree (strength)
-        degree_dict = dict(G.degree(weight=weight))
+    ctx = GraphContext(G, weight=weight)
+    values = _degree_measure(ctx, {'normalize_degree': normalized, 'use_weighted_degree': weighted})
+    return dict(zip(ctx.nodes, values['dgr_cent'].tolist()))
+
+
+def _betweenness_partial(G: nx.Graph,
+                         source_chunks: List[List],
+                         weight: Optional[str]) -> List[np.ndarray]:
+    """Dependency sums of each source chunk, in G.nodes() order"""
+    nodes = list(G)
+    partials = []
+    for sources in source_chunks:
+        bc = nx.betweenness_centrality_subset(G, sources, nodes, normalized=False, weight=weight)
+        partials.append(np.fromiter((bc[v] for v in nodes), dtype=float, count=len(nodes)))
+    return partials
+
+
+def exact_betweenness_centrality(G: Union[nx.Graph, CSRGraph],
+                                 normalized: bool = True,
+                                 weighted: bool = False,
+                                 weight: str = 'weight',
+                                 n_jobs: int = 1,
+                                 chunk_size: int = BETWEENNESS_CHUNK_SIZE) -> Dict[str, float]:
+    """
+    Exact Brandes betweenness with BFS sources partitioned into chunks
+
+    Sources are split into fixed chunks of G.nodes() order and each chunk's
+    dependency vector is computed independently (in a process pool if
+    n_jobs != 1). Chunks are always summed in the same order, so the result
+    is byte-identical for every n_jobs.
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    normalized : bool, default=True
+        Normalize by 2/((n-1)(n-2)) for undirected graphs
+    weighted : bool, default=False
+        If True, use edge weights as distances (Dijkstra)
+    weight : str, default='weight'
+        Edge weight attribute name
+    n_jobs : int, default=1
+        Number of parallel jobs (1 = serial)
+    chunk_size : int, default=BETWEENNESS_CHUNK_SIZE
+        Number of sources per chunk (part of the summation order, so keep
+        it fixed when comparing runs)
+
+    Returns
+    -------
+    Dict[str, float]
+        Betweenness centrality values
+    """
+    G = as_networkx(G, weight)
+    betweenness = _exact_betweenness_array(G, normalized, weight if weighted else None, n_jobs, chunk_size)
+    return dict(zip(G.nodes(), betweenness.tolist()))
+
+
+def _exact_betweenness_array(G: nx.Graph,
+                             normalized: bool,
+                             weight_param: Optional[str],
+                             n_jobs: int,
+                             chunk_size: int) -> np.ndarray:
+    """exact_betweenness_centrality as an array in G.nodes() order"""
+    nodes = list(G)
+    n = len(nodes)
+    if n == 0:
+        return np.zeros(0)
+
+    chunks = [nodes[i:i + chunk_size] for i in range(0, n, chunk_size)]
+
+    if n_jobs != 1 and len(chunks) > 1:
+        from joblib import Parallel, delayed, effective_n_jobs
+        n_tasks = min(len(chunks), 4 * effective_n_jobs(n_jobs))
+        groups = np.array_split(np.arange(len(chunks)), n_tasks)
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_betweenness_partial)(G, [chunks[i] for i in group], weight_param)
+            for group in groups
+        )
+        partials = [part for result in results for part in result]
     else:
-        # Unweighted degree
-        degree_dict = dict(G.degree())
-    
-    if normalized and not weighted:
-        # Normalize by (n-1) for unweighted
-        n = G.number_of_nodes()
-        if n > 1:
-            degree_dict = {node: deg / (n - 1) for node, deg in degree_dict.items()}
-    
-    return degree_dict
+        partials = _betweenness_partial(G, chunks, weight_param)
+
+    # Fixed summation order -> identical floats regardless of n_jobs
+    betweenness = np.zeros(n)
+    for part in partials:
+        betweenness += part
+
+    # betweenness_centrality_subset halves the ordered-pair sums of undirected graphs
+    if normalized and n > 2:
+        betweenness *= 2 / ((n - 1) * (n - 2))
+
+    return betweenness
+
+
+def adaptive_betweenness_centrality(G: Union[nx.Graph, CSRGraph],
+                                    normalized: bool = True,
+                                    weighted: bool = False,
+                                    weight: str = 'weight',
+                                    target_error: float = 0.05,
+                                    batch_size: int = ADAPTIVE_BETWEENNESS_BATCH,
+                                    min_batches: int = ADAPTIVE_BETWEENNESS_MIN_BATCHES,
+                                    max_samples: Optional[int] = None,
+                                    seed: Optional[int] = 42) -> Tuple[Dict[str, float], Dict[str, float], float]:
+    """
+    Pivot-sampled betweenness that adds sources until a target error is met
+
+    Sources are drawn without replacement in a seeded random order and
+    processed in batches of batch_size. Each batch gives an unbiased
+    estimate (n / batch_size) * (batch dependency sums); the running
+    estimate is their mean. Sampling stops once the relative error
+    ||batch standard error||_2 / ||estimate||_2 (batch means, with a
+    finite-population correction) is at most target_error, after
+    max_samples sources, or when every node has been used as a source
+    (the result is then exact and the error is 0).
+
+    The per-node standard error uses the variance of the single-source
+    dependencies. Dependencies are heavy-tailed (a node can get most of
+    its betweenness from a few sources that were never drawn), so the
+    squared coefficient of variation is floored at the 95th percentile of
+    the node's degree class (log2 degree). Nodes of degree >= 2 that no
+    source reached get the smallest positive error of their class. On
+    seeded BA, power-law-cluster and ER graphs about 93-98% of nodes lie
+    within 2 standard errors of exact betweenness for target errors of
+    0.05-0.2.
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    normalized : bool, default=True
+        Normalize by 2/((n-1)(n-2)) for undirected graphs
+    weighted : bool, default=False
+        If True, use edge weights as distances (Dijkstra)
+    weight : str, default='weight'
+        Edge weight attribute name
+    target_error : float, default=0.05
+        Relative L2 standard error at which sampling stops
+    batch_size : int, default=ADAPTIVE_BETWEENNESS_BATCH
+        Sources per batch
+    min_batches : int, default=ADAPTIVE_BETWEENNESS_MIN_BATCHES
+        Batches required before the error estimate is trusted
+    max_samples : Optional[int], default=None
+        Maximum number of sources (all nodes if None)
+    seed : Optional[int], default=42
+        Seed for the source order
+
+    Returns
+    -------
+    Tuple[Dict[str, float], Dict[str, float], float]
+        (betweenness estimates, per-node standard errors, achieved relative error)
+    """
+    G = as_networkx(G, weight)
+    estimate, std_error, rel_error = _adaptive_betweenness_arrays(
+        G, normalized, weight if weighted else None, target_error, batch_size, min_batches, max_samples, seed)
+    nodes = list(G)
+    return dict(zip(nodes, estimate.tolist())), dict(zip(nodes, std_error.tolist())), rel_error
+
+
+def _source_dependencies(G, nodes: Optional[List], sources: np.ndarray,
+                         weight_param: Optional[str]) -> np.ndarray:
+    """Dependencies of each source position (rows) on an nx.Graph or igraph.Graph"""
+    if isinstance(G, nx.Graph):
+        return np.stack(_betweenness_partial(G, [[nodes[i]] for i in sources], weight_param))
+    return np.stack([backends.igraph_betweenness(G, weight_param, sources=[int(i)]) for i in sources])
+
+
+def _node_standard_errors(sum_dep: np.ndarray,
+                          sum_sq_dep: np.ndarray,
+                          n_sampled: int,
+                          degree: np.ndarray) -> np.ndarray:
+    """Per-node standard error of n * mean(dependency), floored by degree class"""
+    n = len(sum_dep)
+    if n_sampled < 2:
+        return np.full(n, np.nan)
+    mean = sum_dep / n_sampled
+    var = np.maximum(sum_sq_dep - n_sampled * mean ** 2, 0.0) / (n_sampled - 1)
+    scale = n * np.sqrt((1 - n_sampled / n) / n_sampled)
+
+    hit = mean > 0
+    cv2 = np.zeros(n)
+    cv2[hit] = var[hit] / mean[hit] ** 2
+    degree_class = np.floor(np.log2(np.maximum(degree, 1))).astype(np.int64)
+    std_error = scale * np.sqrt(var)
+    for cls in np.unique(degree_class):
+        members = degree_class == cls
+        if not (members & hit).any():
+            continue
+        floor = np.quantile(cv2[members & hit], 0.95)
+        std_error[members] = np.maximum(std_error[members], scale * mean[members] * np.sqrt(floor))
+        # No source reached these nodes; degree >= 2 means they can still be on paths
+        unseen = members & ~hit & (degree >= 2)
+        seen_errors = std_error[members & hit]
+        if unseen.any() and (seen_errors > 0).any():
+            std_error[unseen] = seen_errors[seen_errors > 0].min()
+    return std_error
+
+
+def _adaptive_betweenness_arrays(G,
+                                 normalized: bool,
+                                 weight_param: Optional[str],
+                                 target_error: float,
+                                 batch_size: int,
+                                 min_batches: int,
+                                 max_samples: Optional[int],
+                                 seed: Optional[int]) -> Tuple[np.ndarray, np.ndarray, float]:
+    """adaptive_betweenness_centrality as arrays in node order (G: nx.Graph or igraph.Graph)"""
+    nodes = list(G) if isinstance(G, nx.Graph) else None
+    n = len(nodes) if nodes is not None else G.vcount()
+    if n == 0:
+        return np.zeros(0), np.zeros(0), 0.0
+    if target_error <= 0:
+        raise ValueError(f"target_error must be positive, got {target_error}")
+    if batch_size < 1 or min_batches < 2:
+        raise ValueError("batch_size must be >= 1 and min_batches >= 2")
 
+    max_samples = n if max_samples is None else min(max_samples, n)
+    order = np.random.default_rng(seed).permutation(n)
 
-def compute_betweenness_centrality(G: nx.Graph, 
+    batch_sums = []
+    sum_sq_dep = np.zeros(n)
+    n_sampled = 0
+    estimate = np.zeros(n)
+    rel_error = np.inf
+
+    while n_sampled < max_samples:
+        batch = order[n_sampled:n_sampled + min(batch_size, max_samples - n_sampled)]
+        dependencies = _source_dependencies(G, nodes, batch, weight_param)
+        batch_sums.append(dependencies.sum(axis=0))
+        sum_sq_dep += (dependencies ** 2).sum(axis=0)
+        n_sampled += len(batch)
+
+        total = np.sum(batch_sums, axis=0)
+        estimate = total * (n / n_sampled)
+        if n_sampled == n:
+            rel_error = 0.0
+            break
+        if len(batch_sums) < min_batches or len(batch) < batch_size:
+            continue
+
+        batch_estimates = np.asarray(batch_sums) * (n / batch_size)
+        fpc = np.sqrt(1 - n_sampled / n)
+        batch_error = batch_estimates.std(axis=0, ddof=1) / np.sqrt(len(batch_sums)) * fpc
+        norm = np.linalg.norm(estimate)
+        rel_error = float(np.linalg.norm(batch_error) / norm) if norm > 0 else 0.0
+        if rel_error <= target_error:
+            break
+
+    if n_sampled == n:
+        std_error = np.zeros(n)
+    else:
+        degree = (np.fromiter((d for _, d in G.degree()), dtype=np.int64, count=n) if nodes is not None
+                  else np.asarray(G.degree(), dtype=np.int64))
+        std_error = _node_standard_errors(np.sum(batch_sums, axis=0), sum_sq_dep, n_sampled, degree)
+
+    if n_sampled < n and len(batch_sums) < min_batches:
+        logger.warning(f"Adaptive betweenness stopped after {n_sampled} sources, "
+                       f"too few batches for an error estimate")
+
+    if normalized and n > 2:
+        scale = 2 / ((n - 1) * (n - 2))
+        estimate = estimate * scale
+        std_error = std_error * scale
+
+    logger.debug(f"Adaptive betweenness: {n_sampled}/{n} sources, relative error {rel_error:.4f}")
+    return estimate, std_error, rel_error
+
+
+def compute_betweenness_centrality(G: Union[nx.Graph, CSRGraph], 
                                   normalized: bool = True,
                                   weighted: bool = False,
                                   weight: str = 'weight',
                                   approximate: bool = True,
-                                  k: int = 500) -> Dict[str, float]:
+                                  k: int = BETWEENNESS_PIVOTS,
+                                  n_jobs: int = 1,
+                                  target_error: Optional[float] = None,
+                                  seed: Optional[int] = None) -> Dict[str, float]:
     """
     Compute betweenness centrality
     
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         Network
     normalized : bool, default=True
         Normalize by 2/((n-1)(n-2)) for undirected graphs
@@ -78,23 +356,356 @@ def compute_betweenness_centrality(G: nx.Graph,
         Edge weight attribute name
     approximate : bool, default=True
         Use approximate algorithm for large networks
-    k : int, default=500
+    k : int, default=BETWEENNESS_PIVOTS
         Number of nodes to sample for approximation
+    n_jobs : int, default=1
+        Parallel jobs for exact betweenness (see exact_betweenness_centrality)
+    target_error : Optional[float], default=None
+        If set (and approximate=True), sample sources adaptively until this
+        relative error is reached instead of using a fixed k
+        (see adaptive_betweenness_centrality)
+    seed : Optional[int], default=None
+        Seed for the sampled sources
     
     Returns
     -------
     Dict[str, float]
         Betweenness centrality values
     """
+    G = as_networkx(G, weight)
     weight_param = weight if weighted else None
     
+    if approximate and target_error is not None:
+        return adaptive_betweenness_centrality(G, normalized=normalized, weighted=weighted, weight=weight,
+                                               target_error=target_error, seed=seed)[0]
     if approximate and G.number_of_nodes() > k:
-        return nx.betweenness_centrality(G, k=k, normalized=normalized, weight=weight_param)
+        return nx.betweenness_centrality(G, k=k, normalized=normalized, weight=weight_param, seed=seed)
+    else:
+        return exact_betweenness_centrality(G, normalized=normalized, weighted=weighted,
+                                            weight=weight, n_jobs=n_jobs)
+
+
+def leading_eigenpair(A: sp.spmatrix,
+                      v0: Optional[np.ndarray] = None,
+                      dense_threshold: int = 100) -> Tuple[float, np.ndarray]:
+    """
+    Leading eigenpair (Perron root and vector) of a symmetric non-negative matrix
+
+    Parameters
+    ----------
+    A : sp.spmatrix
+        Symmetric adjacency matrix
+    v0 : Optional[np.ndarray], default=None
+        Starting vector (e.g. the previous year's eigenvector). With a start
+        vector LOBPCG is used, falling back to ARPACK if it does not converge.
+    dense_threshold : int, default=100
+        Use a dense eigensolver for graphs up to this many nodes
+
+    Returns
+    -------
+    Tuple[float, np.ndarray]
+        (λ_max, non-negative unit eigenvector); (0.0, zeros) for a graph
+        without edges
+    """
+    n = A.shape[0]
+    if n == 0 or A.nnz == 0:
+        return 0.0, np.zeros(n)
+    if n <= dense_threshold:
+        eigenvalues, eigenvectors = np.linalg.eigh(A.toarray().astype(float))
+        value, vector = eigenvalues[-1], eigenvectors[:, -1]
     else:
-        return nx.betweenness_centrality(G, normalized=normalized, weight=weight_param)
+        A = sp.csr_matrix(A, dtype=float)
+        n_matvec = 0
+
+        def matvec(x):
+            nonlocal n_matvec
+            n_matvec += 1
+            return A @ x
+
+        def matmat(X):
+            nonlocal n_matvec
+            n_matvec += X.shape[1]
+            return A @ X
+
+        op = spla.LinearOperator(A.shape, matvec=matvec, matmat=matmat, dtype=float)
+        if v0 is not None and not np.any(v0):
+            v0 = None
+
+        value = None
+        if v0 is not None:
+            # A good start vector lets LOBPCG converge in a few block iterations
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                eigenvalues, eigenvectors = spla.lobpcg(op, v0.reshape(-1, 1).astype(float),
+                                                       largest=True, tol=1e-10, maxiter=200)
+            value, vector = eigenvalues[0], eigenvectors[:, 0]
+            residual = np.linalg.norm(A @ vector - value * vector)
+            if not np.isfinite(value) or residual > 1e-8 * max(abs(value), 1.0):
+                value = None
+        if value is None:
+            # Perron root of a non-negative symmetric matrix = largest algebraic eigenvalue
+            eigenvalues, eigenvectors = spla.eigsh(op, k=1, which='LA', v0=v0)
+            value, vector = eigenvalues[0], eigenvectors[:, 0]
+        logger.debug(f"Leading eigenpair: n={n}, {n_matvec} matvecs "
+                     f"({'warm' if v0 is not None else 'cold'} start)")
+
+    # The Perron vector is determined up to sign
+    if vector.sum() < 0:
+        vector = -vector
+    return float(value), vector
+
+
+def largest_eigenvalue(A: sp.spmatrix, dense_threshold: int = 100) -> float:
+    """
+    Largest eigenvalue (spectral radius) of a symmetric non-negative matrix
+
+    Parameters
+    ----------
+    A : sp.spmatrix
+        Symmetric adjacency matrix
+    dense_threshold : int, default=100
+        Use a dense eigensolver for graphs up to this many nodes
+
+    Returns
+    -------
+    float
+        λ_max (0.0 for a graph without edges)
+    """
+    return leading_eigenpair(A, dense_threshold=dense_threshold)[0]
+
+
+class EigenCache:
+    """
+    Leading eigenpairs of year networks, keyed by (year, weighted)
+
+    A repeated lookup for the same year and node set returns the cached
+    eigenvalue without solving again. For a new year, start_vector maps the
+    eigenvector of the nearest cached year through firm names, so adjacent
+    years (which share most of their window) start LOBPCG close to the
+    solution (see leading_eigenpair). Firms not in the cached year start at
+    the mean entry. The saving is modest (on the order of 20% fewer
+    mat-vecs per solve), so compute_centralities_for_networks only uses it
+    with warm_start_eigen=True.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[int, bool], Tuple[float, np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def store(self, year: int, weighted: bool, eigenvalue: float,
+              eigenvector: np.ndarray, firm_names) -> None:
+        """Cache the leading eigenpair of a year network"""
+        self._entries[(int(year), bool(weighted))] = (
+            eigenvalue, np.asarray(eigenvector, dtype=float), np.asarray(firm_names, dtype=object)
+        )
+
+    def lookup(self, year: int, weighted: bool, firm_names) -> Optional[Tuple[float, np.ndarray]]:
+        """Cached (λ_max, eigenvector) if the year was solved for the same nodes"""
+        entry = self._entries.get((int(year), bool(weighted)))
+        if entry is None:
+            return None
+        eigenvalue, eigenvector, names = entry
+        firm_names = np.asarray(firm_names, dtype=object)
+        if len(names) != len(firm_names) or not np.array_equal(names, firm_names):
+            return None
+        return eigenvalue, eigenvector
+
+    def start_vector(self, year: int, weighted: bool, firm_names) -> Optional[np.ndarray]:
+        """
+        Starting vector from the nearest cached year (earlier years preferred)
+
+        Parameters
+        ----------
+        year : int
+            Year being solved
+        weighted : bool
+            Weighted or unweighted adjacency
+        firm_names : array-like
+            Node labels of the year network, in matrix order
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Start vector aligned with firm_names, or None if nothing is cached
+        """
+        candidates = [y for (y, w) in self._entries if w == bool(weighted) and y != int(year)]
+        if not candidates:
+            return None
+        nearest = min(candidates, key=lambda y: (abs(y - year), y > year))
+        _, eigenvector, names = self._entries[(nearest, bool(weighted))]
+
+        positions = pd.Index(names).get_indexer(pd.Index(firm_names, dtype=object))
+        found = positions >= 0
+        if not found.any():
+            return None
+        v0 = np.full(len(positions), np.abs(eigenvector).mean())
+        v0[found] = np.abs(eigenvector[positions[found]])
+        return v0
+
+    def subset(self, years: List[int]) -> 'EigenCache':
+        """New cache holding only the given years (e.g. to ship to a worker)"""
+        cache = EigenCache()
+        cache._entries = {key: entry for key, entry in self._entries.items() if key[0] in set(years)}
+        return cache
+
 
+def _leading_eigenvalue(firm_names: List,
+                        A: sp.spmatrix,
+                        weighted: bool,
+                        year: Optional[int] = None,
+                        eigen_cache: Optional[EigenCache] = None) -> float:
+    """λ_max of A, reusing or warm-starting from eigen_cache when given"""
+    if eigen_cache is None or year is None:
+        return largest_eigenvalue(A)
 
-def compute_power_centrality(G: nx.Graph, 
+    cached = eigen_cache.lookup(year, weighted, firm_names)
+    if cached is not None:
+        return cached[0]
+
+    v0 = eigen_cache.start_vector(year, weighted, firm_names)
+    eigenvalue, eigenvector = leading_eigenpair(A, v0=v0)
+    eigen_cache.store(year, weighted, eigenvalue, eigenvector, firm_names)
+    return eigenvalue
+
+
+def warm_eigen_cache(networks: Dict[int, Union[nx.Graph, CSRGraph]],
+                     weighted: bool = False,
+                     weight: str = 'weight',
+                     eigen_cache: Optional[EigenCache] = None) -> EigenCache:
+    """
+    Solve the leading eigenpair of every year network in year order
+
+    Each year is warm-started from the previous one.
+
+    Parameters
+    ----------
+    networks : Dict[int, nx.Graph or CSRGraph]
+        Dictionary of {year: network}
+    weighted : bool, default=False
+        Use edge weights in the adjacency matrix
+    weight : str, default='weight'
+        Edge weight attribute name
+    eigen_cache : Optional[EigenCache], default=None
+        Cache to fill (a new one if None)
+
+    Returns
+    -------
+    EigenCache
+    """
+    eigen_cache = eigen_cache if eigen_cache is not None else EigenCache()
+    for year in sorted(networks):
+        G = networks[year]
+        if G.number_of_nodes() > 0:
+            A = adjacency_matrix(G, weighted=weighted, weight=weight)
+            _leading_eigenvalue(list(G.nodes()), A, weighted, year, eigen_cache)
+    return eigen_cache
+
+
+# scipy < 1.12 names the CG relative tolerance `tol`
+_CG_RTOL_ARG = 'rtol' if 'rtol' in inspect.signature(spla.cg).parameters else 'tol'
+
+
+def _solve_power(A: sp.csr_matrix,
+                 betas: List[float],
+                 solver: str = 'auto',
+                 direct_threshold: int = POWER_DIRECT_MAX_NODES,
+                 rtol: float = 1e-10) -> List[np.ndarray]:
+    """
+    Solve (I - βA) x = A·1 for every β with sparse solvers
+
+    For β < 1/λ_max the system matrix is symmetric positive definite, so
+    large graphs use conjugate gradients warm-started from the previous β's
+    solution; small graphs (or solver='direct') use a sparse LU solve.
+    """
+    n = A.shape[0]
+    if solver not in ('auto', 'direct', 'cg'):
+        raise ValueError(f"Unknown solver '{solver}'. Use 'auto', 'direct' or 'cg'.")
+    use_direct = solver == 'direct' or (solver == 'auto' and n <= direct_threshold)
+
+    A = sp.csr_matrix(A, dtype=float)
+    b = A @ np.ones(n)
+    I = sp.identity(n, dtype=float, format='csc')
+
+    solutions = {}
+    x0 = b
+    for beta in sorted(set(betas)):
+        if beta == 0:
+            x = b.copy()
+        elif use_direct:
+            x = spla.spsolve((I - beta * A).tocsc(), b)
+        else:
+            x, info = spla.cg(I - beta * A, b, x0=x0, atol=0.0, maxiter=10 * n,
+                               **{_CG_RTOL_ARG: rtol})
+            if info != 0:
+                logger.warning(f"Power centrality CG did not converge for beta={beta:.4g}; "
+                               f"falling back to a sparse LU solve")
+                x = spla.spsolve((I - beta * A).tocsc(), b)
+            x0 = x
+        solutions[beta] = x
+
+    return [solutions[beta] for beta in betas]
+
+
+def compute_power_centralities(G: Union[nx.Graph, CSRGraph],
+                               beta_values: Optional[List[float]] = None,
+                               normalized: bool = False,
+                               weighted: bool = False,
+                               weight: str = 'weight',
+                               compute_power_max: bool = True,
+                               solver: str = 'auto',
+                               year: Optional[int] = None,
+                               eigen_cache: Optional[EigenCache] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute power centrality (Bonacich) for several betas at once
+
+    λ_max is computed once per graph and each beta is solved as a sparse
+    linear system, so no dense n x n matrix is ever allocated.
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    beta_values : Optional[List[float]], default=None
+        Betas relative to 1/λ_max (default: [0.0, 0.75, 0.99]).
+        Values >= 1 are capped at 0.99.
+    normalized : bool, default=False
+        If True, normalize each column by its max value
+    weighted : bool, default=False
+        If True, use edge weights. If False, use unweighted adjacency matrix.
+    weight : str, default='weight'
+        Edge weight attribute name
+    compute_power_max : bool, default=True
+        Also return pwr_max (1/λ_max)
+    solver : str, default='auto'
+        'direct' (sparse LU), 'cg' (conjugate gradients) or 'auto'
+        (LU up to POWER_DIRECT_MAX_NODES nodes, CG above; LU fill-in
+        grows quickly on large dense networks)
+    year : Optional[int], default=None
+        Network year, used as the eigen_cache key
+    eigen_cache : Optional[EigenCache], default=None
+        Reuse / warm-start λ_max across calls and adjacent years
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        {'pwr_max': ..., 'pwr_p{100*beta}': ...} with values in G.nodes() order
+    """
+    ctx = GraphContext(G, weight=weight, year=year, eigen_cache=eigen_cache)
+    return _power_measure(ctx, {
+        'power_beta_values': beta_values,
+        'normalize_power': normalized,
+        'use_weighted_power': weighted,
+        'compute_power_max': compute_power_max,
+        'power_solver': solver,
+    })
+
+
+def compute_power_centrality(G: Union[nx.Graph, CSRGraph], 
                             beta: float = 0.5, 
                             normalized: bool = False,
                             weighted: bool = False,
@@ -104,7 +715,7 @@ def compute_power_centrality(G: nx.Graph,
     
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         Network
     beta : float, default=0.5
         Beta parameter (should be < 1/λ_max)
@@ -125,45 +736,236 @@ def compute_power_centrality(G: nx.Graph,
     
     try:
         # Get adjacency matrix (weighted or unweighted)
-        if weighted:
-            A = nx.adjacency_matrix(G, weight=weight)
-        else:
-            # Unweighted: ignore edge weights
-            A = nx.adjacency_matrix(G, weight=None)
-        
-        # Convert to float type (required for eigs and matrix operations)
-        A = A.astype(float)
-        
-        # Get largest eigenvalue
-        eigenvalues, _ = eigs(A, k=1, which='LM')
-        lambda_max = np.abs(eigenvalues[0].real)
+        A = adjacency_matrix(G, weighted=weighted, weight=weight)
+        lambda_max = largest_eigenvalue(A)
         
         # Adjust beta if needed
-        if beta >= 1/lambda_max:
+        if lambda_max > 0 and beta >= 1/lambda_max:
             beta = (1/lambda_max) * 0.99
         
         # Compute power centrality
         # c = (I - βA)^(-1) A 1
-        n = G.number_of_nodes()
-        I = np.eye(n, dtype=float)
-        A_dense = A.todense()
-        
-        inv_matrix = np.linalg.inv(I - beta * A_dense)
-        ones = np.ones(n, dtype=float)
-        power_cent = inv_matrix @ A_dense @ ones
+        power_cent = _solve_power(A, [beta])[0]
         
         # Normalize if requested
         if normalized:
             power_cent = power_cent / np.max(power_cent) if np.max(power_cent) > 0 else power_cent
         
-        return dict(zip(G.nodes(), power_cent.flat))
+        return dict(zip(G.nodes(), power_cent.tolist()))
         
+    except TypeError:
+        # Programming / API errors must not turn into zero columns
+        raise
     except Exception as e:
         logger.warning(f"Error computing power centrality: {e}")
         return {node: 0.0 for node in G.nodes()}
 
 
-def compute_constraint(G: nx.Graph, 
+def _upper_edges(A: sp.spmatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Upper-triangle edges (row, col, value) of a symmetric matrix, sorted by (row, col)"""
+    U = sp.triu(sp.csr_matrix(A), k=1).tocsr()
+    U.eliminate_zeros()
+    U.sort_indices()
+    rows = np.repeat(np.arange(U.shape[0]), np.diff(U.indptr))
+    return rows, U.indices.astype(np.int64), U.data
+
+
+def _iter_triangles(rows: np.ndarray,
+                    cols: np.ndarray,
+                    n: int,
+                    max_wedges: int = 1_000_000):
+    """
+    Enumerate every triangle of an undirected graph once, in chunks
+
+    Edges are oriented from lower to higher (degree, index) rank, so each
+    node only pairs up its out-neighbours (at most O(sqrt(m)) of them) and
+    every triangle is found exactly once. Closing edges are looked up by
+    binary search in the sorted edge keys.
+
+    Parameters
+    ----------
+    rows, cols : np.ndarray
+        Upper-triangle edges sorted by (row, col), e.g. from _upper_edges
+    n : int
+        Number of nodes
+    max_wedges : int, default=1_000_000
+        Approximate number of candidate wedges per chunk
+
+    Yields
+    ------
+    Tuple[np.ndarray, ...]
+        (u, v, w, e_uv, e_uw, e_vw): triangle vertices and the positions of
+        its three edges in rows/cols
+    """
+    n_edges = len(rows)
+    if n_edges == 0:
+        return
+    keys = rows * n + cols
+    degree = np.bincount(rows, minlength=n) + np.bincount(cols, minlength=n)
+    rank = np.empty(n, dtype=np.int64)
+    rank[np.lexsort((np.arange(n), degree))] = np.arange(n)
+
+    low_first = rank[rows] < rank[cols]
+    src = np.where(low_first, rows, cols)
+    dst = np.where(low_first, cols, rows)
+    order = np.argsort(src, kind='stable')
+    src, dst, edge_id = src[order], dst[order], order
+
+    out_degree = np.bincount(src, minlength=n)
+    indptr = np.concatenate(([0], np.cumsum(out_degree)))
+    wedges = out_degree * (out_degree - 1) // 2
+    bounds = np.searchsorted(np.cumsum(wedges), np.arange(max_wedges, wedges.sum(), max_wedges))
+    bounds = np.unique(np.concatenate(([0], bounds + 1, [n])).clip(0, n))
+
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        first_edge, last_edge = indptr[lo], indptr[hi]
+        if last_edge - first_edge < 2:
+            continue
+        # Pair each out-edge with the out-edges after it in the same row
+        edges = np.arange(first_edge, last_edge)
+        n_partners = indptr[src[edges] + 1] - edges - 1
+        first = np.repeat(edges, n_partners)
+        offsets = np.arange(len(first)) - np.repeat(np.cumsum(n_partners) - n_partners, n_partners)
+        second = first + 1 + offsets
+
+        v, w = dst[first], dst[second]
+        closing = np.minimum(v, w) * n + np.maximum(v, w)
+        pos = np.searchsorted(keys, closing).clip(0, n_edges - 1)
+        found = keys[pos] == closing
+        if not found.any():
+            continue
+        first, second = first[found], second[found]
+        yield src[first], v[found], w[found], edge_id[first], edge_id[second], pos[found]
+
+
+def _triangle_statistics(rows: np.ndarray,
+                         cols: np.ndarray,
+                         n: int,
+                         edge_weights: Dict[object, Tuple[np.ndarray, np.ndarray]],
+                         count_nodes: bool = True,
+                         max_wedges: int = 1_000_000) -> Tuple[Optional[np.ndarray], Dict[object, np.ndarray]]:
+    """
+    Triangle counts per node and constraint sums per edge in one enumeration
+
+    Parameters
+    ----------
+    rows, cols : np.ndarray
+        Upper-triangle edges sorted by (row, col)
+    n : int
+        Number of nodes
+    edge_weights : Dict[object, Tuple[np.ndarray, np.ndarray]]
+        {key: (edge values aligned with rows/cols, node strengths)}; for each
+        key T_ij = Σ_w A_iw A_wj / s_w is accumulated per edge
+    count_nodes : bool, default=True
+        Also count triangles per node
+    max_wedges : int, default=1_000_000
+        Chunk size of the triangle enumeration
+
+    Returns
+    -------
+    Tuple[Optional[np.ndarray], Dict[object, np.ndarray]]
+        (triangles per node or None, {key: T per edge})
+    """
+    n_edges = len(rows)
+    triangles = np.zeros(n, dtype=np.int64) if count_nodes else None
+    sums = {key: np.zeros(n_edges) for key in edge_weights}
+
+    for u, v, w, e_uv, e_uw, e_vw in _iter_triangles(rows, cols, n, max_wedges):
+        if count_nodes:
+            triangles += np.bincount(np.concatenate((u, v, w)), minlength=n)
+        for key, (values, strength) in edge_weights.items():
+            a_uv, a_uw, a_vw = values[e_uv], values[e_uw], values[e_vw]
+            T = sums[key]
+            T += np.bincount(e_vw, weights=a_uv * a_uw / strength[u], minlength=n_edges)
+            T += np.bincount(e_uv, weights=a_uw * a_vw / strength[w], minlength=n_edges)
+            T += np.bincount(e_uw, weights=a_uv * a_vw / strength[v], minlength=n_edges)
+
+    return triangles, sums
+
+
+def _constraint_from_triangle_sums(rows: np.ndarray,
+                                   cols: np.ndarray,
+                                   values: np.ndarray,
+                                   strength: np.ndarray,
+                                   T: np.ndarray) -> np.ndarray:
+    """constraint_i = Σ_j (A_ij + T_ij)² / s_i² (nan for isolated nodes)"""
+    n = len(strength)
+    q2 = (values + T) ** 2
+    constraint = np.bincount(rows, weights=q2, minlength=n) + np.bincount(cols, weights=q2, minlength=n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        constraint = constraint / strength**2
+    constraint[strength == 0] = np.nan
+    return constraint
+
+
+def burt_constraint_array(A: sp.spmatrix, max_wedges: int = 1_000_000) -> np.ndarray:
+    """
+    Burt's constraint of every node from a sparse adjacency matrix
+
+    With the proportional tie matrix P = D⁻¹A (D = node strengths),
+    constraint_i = Σ_{j ∈ N(i)} (P_ij + (P·P)_ij)². Writing
+    T_ij = Σ_w A_iw A_wj / s_w (symmetric, non-zero on an edge only through
+    triangles), P_ij + (P·P)_ij = (A_ij + T_ij) / s_i, so
+    constraint_i = Σ_j (A_ij + T_ij)² / s_i². T is accumulated over the
+    graph's triangles instead of forming the two-hop product P·P.
+
+    Parameters
+    ----------
+    A : sp.spmatrix
+        Symmetric adjacency matrix (weighted or binary, no self-loops)
+    max_wedges : int, default=1_000_000
+        Chunk size of the triangle enumeration (bounds peak memory)
+
+    Returns
+    -------
+    np.ndarray
+        Constraint per node in matrix order (nan for isolated nodes)
+    """
+    n = A.shape[0]
+    rows, cols, values = _upper_edges(A)
+    values = values.astype(float)
+    strength = np.bincount(rows, weights=values, minlength=n) + np.bincount(cols, weights=values, minlength=n)
+
+    _, sums = _triangle_statistics(rows, cols, n, {0: (values, strength)}, count_nodes=False,
+                                   max_wedges=max_wedges)
+    return _constraint_from_triangle_sums(rows, cols, values, strength, sums[0])
+
+
+def compute_constraint_and_structural_holes(G: Union[nx.Graph, CSRGraph],
+                                            weighted: bool = False,
+                                            weight: str = 'weight',
+                                            cap_at_one: bool = True) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Compute constraint and structural holes (1 - constraint) in one pass
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    weighted : bool, default=False
+        If True, use edge weights. If False, treat all edges equally.
+    weight : str, default='weight'
+        Edge weight attribute name
+    cap_at_one : bool, default=True
+        Cap constraint at 1.0 (sh is bounded to [0, 1] either way)
+
+    Returns
+    -------
+    Tuple[Dict[str, float], Dict[str, float]]
+        (constraint, sh). Isolated nodes get nan constraint and sh = 1.0.
+    """
+    ctx = GraphContext(G, weight=weight)
+    options = {
+        'use_weighted_constraint': weighted,
+        'use_weighted_structural_holes': weighted,
+        'constraint_cap_at_one': cap_at_one,
+    }
+    constraint = _constraint_measure(ctx, options)['constraint']
+    sh = _structural_holes_measure(ctx, options)['sh']
+    return dict(zip(ctx.nodes, constraint.tolist())), dict(zip(ctx.nodes, sh.tolist()))
+
+
+def compute_constraint(G: Union[nx.Graph, CSRGraph], 
                       weighted: bool = False,
                       weight: str = 'weight',
                       cap_at_one: bool = True) -> Dict[str, float]:
@@ -172,7 +974,7 @@ def compute_constraint(G: nx.Graph,
     
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         Network
     weighted : bool, default=False
         If True, use edge weights. If False, treat all edges equally.
@@ -187,22 +989,10 @@ def compute_constraint(G: nx.Graph,
     Dict[str, float]
         Constraint values (capped at 1.0 if cap_at_one=True)
     """
-    try:
-        weight_param = weight if weighted else None
-        constraint_dict = nx.constraint(G, weight=weight_param)
-        
-        # Cap values at 1.0 if requested
-        if cap_at_one:
-            constraint_dict = {node: min(val, 1.0) if val is not None else val 
-                             for node, val in constraint_dict.items()}
-        
-        return constraint_dict
-    except Exception as e:
-        logger.warning(f"Error computing constraint: {e}")
-        return {node: 0.0 for node in G.nodes()}
+    return compute_constraint_and_structural_holes(G, weighted, weight, cap_at_one)[0]
 
 
-def compute_structural_holes(G: nx.Graph,
+def compute_structural_holes(G: Union[nx.Graph, CSRGraph],
                              weighted: bool = False,
                              weight: str = 'weight') -> Dict[str, float]:
     """
@@ -210,7 +1000,7 @@ def compute_structural_holes(G: nx.Graph,
 
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         Network
     weighted : bool, default=False
         If True, use edge weights for constraint calculation
@@ -222,31 +1012,42 @@ def compute_structural_holes(G: nx.Graph,
     Dict[str, float]
         Structural holes values (1 - constraint), bounded to [0, 1]
     """
-    try:
-        weight_param = weight if weighted else None
-        constraint_dict = nx.constraint(G, weight=weight_param)
-        sh_dict = {}
-        for node, val in constraint_dict.items():
-            if val is None:
-                sh_dict[node] = 0.0
-            else:
-                sh_dict[node] = max(0.0, min(1.0, 1.0 - val))
-        return sh_dict
-    except Exception as e:
-        logger.warning(f"Error computing structural holes: {e}")
-        return {node: 0.0 for node in G.nodes()}
+    return compute_constraint_and_structural_holes(G, weighted, weight)[1]
 
 
-def compute_ego_density(G: nx.Graph) -> Dict[str, float]:
+def triangle_counts(A: sp.spmatrix, max_wedges: int = 1_000_000) -> np.ndarray:
+    """
+    Number of triangles through each node (= diag(A³)/2 for binary A)
+
+    Parameters
+    ----------
+    A : sp.spmatrix
+        Symmetric adjacency matrix (weights are ignored)
+    max_wedges : int, default=1_000_000
+        Chunk size of the triangle enumeration
+
+    Returns
+    -------
+    np.ndarray
+        Triangle count per node in matrix order
+    """
+    rows, cols, _ = _upper_edges(A)
+    return _triangle_statistics(rows, cols, A.shape[0], {}, max_wedges=max_wedges)[0]
+
+
+def compute_ego_density(G: Union[nx.Graph, CSRGraph]) -> Dict[str, float]:
     """
     Compute ego network density (unweighted)
     
     Ego network density measures how densely connected a node's neighbors are.
     Density = (actual edges among neighbors) / (possible edges among neighbors)
+
+    Edges among a node's neighbors are the triangles through the node, so
+    all nodes are computed at once from triangle counts.
     
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         Network
     
     Returns
@@ -254,34 +1055,661 @@ def compute_ego_density(G: nx.Graph) -> Dict[str, float]:
     Dict[str, float]
         Ego network density values (0 to 1)
     """
-    ego_density_dict = {}
-    
-    for node in G.nodes():
-        # Get neighbors (ego network)
-        neighbors = list(G.neighbors(node))
-        
-        if len(neighbors) <= 1:
-            # Density undefined for 0 or 1 neighbor
-            ego_density_dict[node] = 0.0
-        else:
-            # Create subgraph of neighbors (exclude ego)
-            ego_subgraph = G.subgraph(neighbors)
-            
-            # Count actual edges (unweighted)
-            actual_edges = ego_subgraph.number_of_edges()
-            
-            # Calculate possible edges
-            n_neighbors = len(neighbors)
-            possible_edges = n_neighbors * (n_neighbors - 1) / 2
-            
-            # Density
-            density = actual_edges / possible_edges if possible_edges > 0 else 0.0
-            ego_density_dict[node] = density
-    
-    return ego_density_dict
+    ctx = GraphContext(G)
+    return dict(zip(ctx.nodes, _ego_density_measure(ctx, {})['ego_dens'].tolist()))
+
+
+# ----------------------------------------------------------------------
+# Shared intermediates and measure registry
+# ----------------------------------------------------------------------
+
+TRIANGLE_INTERMEDIATES = ('triangles', 'triangle_sums')
+UNWEIGHTED_INTERMEDIATES = ('degree', 'triangles', 'networkx', 'igraph')
+
+
+class GraphContext:
+    """
+    Per-graph intermediates shared by centrality measures
+
+    Intermediates are addressed as (name, weighted) and computed at most
+    once per graph:
+
+    - 'adjacency'     : sparse adjacency matrix (CSR, G.nodes() order)
+    - 'degree'        : number of neighbours
+    - 'strength'      : weighted degree (degree if unweighted)
+    - 'upper_edges'   : (rows, cols, values) of the upper triangle
+    - 'lambda_max'    : largest adjacency eigenvalue (uses eigen_cache)
+    - 'triangles'     : triangles through each node
+    - 'triangle_sums' : per-edge T_ij = Σ_w A_iw A_wj / s_w (constraint)
+    - 'constraint'    : uncapped Burt constraint (nan for isolates)
+    - 'networkx'      : the graph as nx.Graph (shortest-path measures)
+    - 'igraph'        : the graph as igraph.Graph (backend='igraph')
+    - 'igraph_constraint' : Burt constraint from igraph (nan for isolates)
+
+    prepare() computes all triangle intermediates of a plan in a single
+    triangle enumeration; everything else is computed on first use.
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    weight : str, default='weight'
+        Edge weight attribute name
+    year : Optional[int], default=None
+        Network year (eigen_cache key)
+    eigen_cache : Optional[EigenCache], default=None
+        Cache used to reuse / warm-start λ_max
+    max_wedges : int, default=1_000_000
+        Chunk size of the triangle enumeration
+    backend : str, default='networkx'
+        Graph backend for λ_max (see network.backends)
+    """
+
+    INTERMEDIATES = ('adjacency', 'degree', 'strength', 'upper_edges', 'lambda_max',
+                     'triangles', 'triangle_sums', 'constraint', 'networkx',
+                     'igraph', 'igraph_constraint')
+
+    def __init__(self, G: Union[nx.Graph, CSRGraph],
+                 weight: str = 'weight',
+                 year: Optional[int] = None,
+                 eigen_cache: Optional[EigenCache] = None,
+                 max_wedges: int = 1_000_000,
+                 backend: str = 'networkx'):
+        self.graph = G
+        self.backend = backends.check_backend(backend)
+        self.weight = weight
+        self.year = year
+        self.eigen_cache = eigen_cache
+        self.max_wedges = max_wedges
+        self.nodes = list(G.nodes())
+        self.n = len(self.nodes)
+        self.computed: List[Tuple[str, bool]] = []
+        self._cache: Dict[Tuple[str, bool], object] = {}
+
+    @staticmethod
+    def key(name: str, weighted: bool = False) -> Tuple[str, bool]:
+        """Normalized intermediate key (unweighted-only intermediates ignore weighted)"""
+        if name not in GraphContext.INTERMEDIATES:
+            raise ValueError(f"Unknown intermediate '{name}'. "
+                             f"Use one of {', '.join(GraphContext.INTERMEDIATES)}.")
+        return name, bool(weighted) and name not in UNWEIGHTED_INTERMEDIATES
+
+    def get(self, name: str, weighted: bool = False):
+        """Intermediate value, computed on first request"""
+        key = self.key(name, weighted)
+        if key not in self._cache:
+            if name in TRIANGLE_INTERMEDIATES:
+                self._compute_triangles([key])
+            else:
+                self._cache[key] = getattr(self, f'_compute_{name}')(key[1])
+                self.computed.append(key)
+        return self._cache[key]
+
+    def prepare(self, plan: List[Tuple[str, bool]]) -> 'GraphContext':
+        """Compute the plan's triangle intermediates together in one enumeration"""
+        pending = [self.key(*key) for key in plan
+                   if key[0] in TRIANGLE_INTERMEDIATES and self.key(*key) not in self._cache]
+        if pending:
+            self._compute_triangles(pending)
+        return self
+
+    def prepare_local(self, plan: List[Tuple[str, bool]], rows: np.ndarray) -> 'GraphContext':
+        """
+        Compute the plan's triangle-based intermediates for some rows only
+
+        'triangles' and 'constraint' are computed from row slices of the
+        adjacency matrix for the given rows; every other entry is left at
+        0 / nan. Used by incremental updates, where the other rows are
+        copied from the previous year, so only measures that read those
+        rows may use these intermediates.
+
+        Parameters
+        ----------
+        plan : List[Tuple[str, bool]]
+            Intermediates (from plan_intermediates)
+        rows : np.ndarray
+            Node positions to compute
+
+        Returns
+        -------
+        GraphContext
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        for key in dict.fromkeys(self.key(*key) for key in plan):
+            name, weighted = key
+            if key in self._cache or name not in ('triangles', 'constraint'):
+                continue
+
+            A = self.get('adjacency', weighted).astype(float)
+            sub = A[rows]
+            if name == 'triangles':
+                values = np.zeros(self.n)
+                values[rows] = np.asarray(sub.multiply(sub @ A).sum(axis=1)).ravel() / 2
+            else:
+                # T_ij = Σ_w A_iw A_wj / s_w on the rows' own edges, as in burt_constraint_array
+                strength = self.get('strength', weighted).astype(float)
+                inv_strength = np.divide(1.0, strength, out=np.zeros(self.n), where=strength > 0)
+                T = (sub @ sp.diags(inv_strength) @ A).multiply(sub != 0)
+                q = sub + T
+                values = np.full(self.n, np.nan)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    values[rows] = np.asarray(q.multiply(q).sum(axis=1)).ravel() / strength[rows] ** 2
+                values[rows[strength[rows] == 0]] = np.nan
+            self._cache[key] = values
+            self.computed.append(key)
+        return self
+
+    def _compute_adjacency(self, weighted: bool) -> sp.csr_matrix:
+        A = sp.csr_matrix(adjacency_matrix(self.graph, weighted=weighted, weight=self.weight))
+        A.sort_indices()
+        return A
+
+    def _compute_degree(self, weighted: bool) -> np.ndarray:
+        return np.diff(self.get('adjacency', False).indptr).astype(np.int64)
+
+    def _compute_strength(self, weighted: bool) -> np.ndarray:
+        if not weighted:
+            return self.get('degree')
+        return np.asarray(self.get('adjacency', True).sum(axis=1)).ravel()
+
+    def _compute_upper_edges(self, weighted: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if not weighted:
+            return _upper_edges(self.get('adjacency', False))
+        # Same edge order as the unweighted edges, so triangle sums line up
+        rows, cols, _ = self.get('upper_edges', False)
+        values = np.asarray(self.get('adjacency', True)[rows, cols]).ravel()
+        return rows, cols, values
+
+    def _compute_lambda_max(self, weighted: bool) -> float:
+        if self.backend == 'igraph':
+            return backends.igraph_leading_eigenvalue(self.get('igraph'), self.weight if weighted else None)
+        return _leading_eigenvalue(self.nodes, self.get('adjacency', weighted), weighted,
+                                   self.year, self.eigen_cache)
+
+    def _compute_triangles(self, keys: List[Tuple[str, bool]]) -> None:
+        rows, cols, _ = self.get('upper_edges', False)
+        edge_weights = {}
+        for name, weighted in keys:
+            if name == 'triangle_sums':
+                values = self.get('upper_edges', weighted)[2].astype(float)
+                edge_weights[weighted] = (values, self.get('strength', weighted).astype(float))
+
+        count_nodes = ('triangles', False) in keys
+        triangles, sums = _triangle_statistics(rows, cols, self.n, edge_weights,
+                                               count_nodes=count_nodes, max_wedges=self.max_wedges)
+        if count_nodes:
+            self._cache[('triangles', False)] = triangles
+            self.computed.append(('triangles', False))
+        for weighted, T in sums.items():
+            self._cache[('triangle_sums', weighted)] = T
+            self.computed.append(('triangle_sums', weighted))
+
+    def _compute_constraint(self, weighted: bool) -> np.ndarray:
+        rows, cols, values = self.get('upper_edges', weighted)
+        return _constraint_from_triangle_sums(rows, cols, values.astype(float),
+                                              self.get('strength', weighted).astype(float),
+                                              self.get('triangle_sums', weighted))
+
+    def _compute_networkx(self, weighted: bool) -> nx.Graph:
+        return as_networkx(self.graph, self.weight)
+
+    def _compute_igraph(self, weighted: bool):
+        return backends.to_igraph(self.graph, self.weight)
+
+    def _compute_igraph_constraint(self, weighted: bool) -> np.ndarray:
+        return backends.igraph_constraint(self.get('igraph'), self.weight if weighted else None)
+
+
+def _intermediate_dependencies(name: str, weighted: bool) -> List[Tuple[str, bool]]:
+    """Intermediates that must exist before (name, weighted) is computed"""
+    if name == 'degree':
+        return [('adjacency', False)]
+    if name == 'strength':
+        return [('adjacency', True)] if weighted else [('degree', False)]
+    if name == 'upper_edges':
+        return [('upper_edges', False), ('adjacency', True)] if weighted else [('adjacency', False)]
+    if name == 'lambda_max':
+        return [('adjacency', weighted)]
+    if name == 'triangles':
+        return [('upper_edges', False)]
+    if name == 'triangle_sums':
+        return [('upper_edges', weighted), ('strength', weighted)]
+    if name == 'constraint':
+        return [('triangle_sums', weighted)]
+    if name == 'igraph_constraint':
+        return [('igraph', False)]
+    return []
+
+
+@dataclass(frozen=True)
+class CentralityMeasure:
+    """
+    A registered centrality measure
+
+    Attributes
+    ----------
+    name : str
+        Registry name
+    requires : Callable[[dict], List[Tuple[str, bool]]]
+        Intermediates (see GraphContext) needed for the given options
+    compute : Callable[[GraphContext, dict], Dict[str, np.ndarray]]
+        Returns {column name: values in ctx.nodes order}
+    """
+    name: str
+    requires: Callable[[dict], List[Tuple[str, bool]]]
+    compute: Callable[[GraphContext, dict], Dict[str, np.ndarray]]
+
+
+CENTRALITY_MEASURES: Dict[str, CentralityMeasure] = {}
+
+# compute_all_centralities flag for each built-in measure
+MEASURE_FLAGS = {
+    'degree': 'compute_degree',
+    'betweenness': 'compute_betweenness',
+    'power': 'compute_power',
+    'constraint': 'compute_constraint_measure',
+    'structural_holes': 'compute_structural_holes_measure',
+    'ego_density': 'compute_ego_density_measure',
+}
+
+
+def register_measure(name: str, requires: Callable[[dict], List[Tuple[str, bool]]]):
+    """
+    Register a centrality measure (decorator)
+
+    The decorated function takes (ctx: GraphContext, options: dict) and
+    returns {column name: values}; options are compute_all_centralities'
+    keyword arguments. It should read graph data only through ctx.get so
+    intermediates are shared with the other measures.
+
+    Parameters
+    ----------
+    name : str
+        Registry name (used in compute_all_centralities(extra_measures=...))
+    requires : Callable[[dict], List[Tuple[str, bool]]]
+        Intermediates needed for the given options
+    """
+    def decorator(func):
+        CENTRALITY_MEASURES[name] = CentralityMeasure(name, requires, func)
+        return func
+    return decorator
+
+
+def plan_intermediates(measures: List[str], options: dict) -> List[Tuple[str, bool]]:
+    """
+    Intermediates needed by a set of measures, in dependency order
+
+    Parameters
+    ----------
+    measures : List[str]
+        Registered measure names
+    options : dict
+        Measure options (compute_all_centralities keyword arguments)
+
+    Returns
+    -------
+    List[Tuple[str, bool]]
+        Unique (name, weighted) keys; dependencies come first
+    """
+    plan = []
+
+    def visit(name, weighted):
+        key = GraphContext.key(name, weighted)
+        if key in plan:
+            return
+        for dependency in _intermediate_dependencies(*key):
+            visit(*dependency)
+        plan.append(key)
+
+    for measure in measures:
+        if measure not in CENTRALITY_MEASURES:
+            raise ValueError(f"Unknown centrality measure '{measure}'. "
+                             f"Use one of {', '.join(CENTRALITY_MEASURES)}.")
+        for name, weighted in CENTRALITY_MEASURES[measure].requires(options):
+            visit(name, weighted)
+    return plan
+
+
+@register_measure('degree', requires=lambda o: [('strength', True)] if o.get('use_weighted_degree', False)
+                  else [('degree', False)])
+def _degree_measure(ctx: GraphContext, options: dict) -> Dict[str, np.ndarray]:
+    if options.get('use_weighted_degree', False):
+        return {'dgr_cent': ctx.get('strength', True)}
+
+    degree = ctx.get('degree')
+    if options.get('normalize_degree', False) and ctx.n > 1:
+        # Normalize by (n-1) for unweighted
+        degree = degree / (ctx.n - 1)
+    return {'dgr_cent': degree}
+
+
+def _graph_key(options: dict) -> Tuple[str, bool]:
+    """Graph view used for shortest-path measures under the selected backend"""
+    return ('igraph' if options.get('backend', 'networkx') == 'igraph' else 'networkx'), False
+
+
+def _constraint_key(options: dict, flag: str) -> Tuple[str, bool]:
+    """Constraint intermediate under the selected backend"""
+    name = 'igraph_constraint' if options.get('backend', 'networkx') == 'igraph' else 'constraint'
+    return name, options.get(flag, False)
+
+
+@register_measure('betweenness', requires=lambda o: [_graph_key(o)])
+def _betweenness_measure(ctx: GraphContext, options: dict) -> Dict[str, np.ndarray]:
+    # Both graph views keep ctx.nodes order, so results are used as arrays directly
+    G = ctx.get(*_graph_key(options))
+    use_igraph = not isinstance(G, nx.Graph)
+    normalized = options.get('normalize_betweenness', True)
+    weight_param = ctx.weight if options.get('use_weighted_betweenness', False) else None
+    approximate = options.get('use_approximate_betweenness', True)
+    seed = options.get('betweenness_seed', 42)
+    target_error = options.get('betweenness_target_error')
+
+    if approximate and target_error is not None:
+        btw_cent, btw_se, rel_error = _adaptive_betweenness_arrays(
+            G, normalized, weight_param, target_error, batch_size=ADAPTIVE_BETWEENNESS_BATCH,
+            min_batches=ADAPTIVE_BETWEENNESS_MIN_BATCHES,
+            max_samples=None, seed=seed)
+        logger.info(f"Year {ctx.year}: adaptive betweenness relative error {rel_error:.4f}")
+        return {'btw_cent': btw_cent, 'btw_se': btw_se, 'btw_rel_err': np.full(ctx.n, rel_error)}
+
+    k = options.get('betweenness_k', BETWEENNESS_PIVOTS)
+    if approximate and ctx.n > k:
+        if not use_igraph:
+            btw_cent = nx.betweenness_centrality(G, k=k, normalized=normalized, weight=weight_param, seed=seed)
+            return {'btw_cent': np.fromiter(btw_cent.values(), dtype=float, count=ctx.n)}
+        # Same pivot estimator as networkx: k sampled sources scaled by n / k
+        sources = np.random.default_rng(seed).choice(ctx.n, size=k, replace=False)
+        btw_cent = backends.igraph_betweenness(G, weight_param, sources=sources.tolist()) * (ctx.n / k)
+    elif use_igraph:
+        btw_cent = backends.igraph_betweenness(G, weight_param)
+    else:
+        return {'btw_cent': _exact_betweenness_array(G, normalized, weight_param,
+                                                     n_jobs=options.get('betweenness_n_jobs', 1),
+                                                     chunk_size=BETWEENNESS_CHUNK_SIZE)}
+
+    if normalized and ctx.n > 2:
+        btw_cent = btw_cent * (2 / ((ctx.n - 1) * (ctx.n - 2)))
+    return {'btw_cent': btw_cent}
+
+
+@register_measure('power', requires=lambda o: [('adjacency', o.get('use_weighted_power', False)),
+                                               ('lambda_max', o.get('use_weighted_power', False))])
+def _power_measure(ctx: GraphContext, options: dict) -> Dict[str, np.ndarray]:
+    beta_values = options.get('power_beta_values')
+    if beta_values is None:
+        beta_values = [0.0, 0.75, 0.99]
+    weighted = options.get('use_weighted_power', False)
+    normalized = options.get('normalize_power', True)
+    compute_power_max = options.get('compute_power_max', True)
+
+    columns = [f'pwr_p{int(beta_rel*100)}' for beta_rel in beta_values]
+    if compute_power_max:
+        columns = ['pwr_max'] + columns
+
+    try:
+        lambda_max = ctx.get('lambda_max', weighted)
+        if lambda_max <= 0:
+            # No edges: A·1 = 0 for every beta
+            return {col: np.zeros(ctx.n) for col in columns}
+
+        betas = [0.0 if beta_rel == 0 else (0.99 if beta_rel >= 1 else beta_rel) / lambda_max
+                 for beta_rel in beta_values]
+        solutions = _solve_power(ctx.get('adjacency', weighted), betas,
+                                 solver=options.get('power_solver', 'auto'))
+
+        result = {}
+        if compute_power_max:
+            result['pwr_max'] = np.full(ctx.n, 1 / lambda_max)
+        for beta_rel, x in zip(beta_values, solutions):
+            if normalized and np.max(x) > 0:
+                x = x / np.max(x)
+            result[f'pwr_p{int(beta_rel*100)}'] = x
+        return result
+
+    except TypeError:
+        # Programming / API errors must not turn into zero columns
+        raise
+    except Exception as e:
+        logger.warning(f"Error computing power centralities: {e}")
+        return {col: np.zeros(ctx.n) for col in columns}
+
+
+@register_measure('constraint', requires=lambda o: [_constraint_key(o, 'use_weighted_constraint')])
+def _constraint_measure(ctx: GraphContext, options: dict) -> Dict[str, np.ndarray]:
+    try:
+        constraint = ctx.get(*_constraint_key(options, 'use_weighted_constraint'))
+    except Exception as e:
+        logger.warning(f"Error computing constraint: {e}")
+        return {'constraint': np.zeros(ctx.n)}
+
+    if options.get('constraint_cap_at_one', True):
+        # Isolated nodes keep nan (np.minimum propagates it)
+        constraint = np.minimum(constraint, 1.0)
+    return {'constraint': constraint}
+
+
+@register_measure('structural_holes',
+                  requires=lambda o: [_constraint_key(o, 'use_weighted_structural_holes')])
+def _structural_holes_measure(ctx: GraphContext, options: dict) -> Dict[str, np.ndarray]:
+    try:
+        constraint = ctx.get(*_constraint_key(options, 'use_weighted_structural_holes'))
+    except Exception as e:
+        logger.warning(f"Error computing structural holes: {e}")
+        return {'sh': np.zeros(ctx.n)}
+
+    # Bounded to [0, 1]; isolated nodes (nan constraint) get 1.0
+    sh = np.clip(1.0 - constraint, 0.0, 1.0)
+    sh[np.isnan(sh)] = 1.0
+    return {'sh': sh}
+
+
+@register_measure('ego_density', requires=lambda o: [('degree', False), ('triangles', False)])
+def _ego_density_measure(ctx: GraphContext, options: dict) -> Dict[str, np.ndarray]:
+    degree = ctx.get('degree')
+    # Density undefined for 0 or 1 neighbor
+    possible_edges = degree * (degree - 1) / 2
+    ego_density = np.divide(ctx.get('triangles'), possible_edges,
+                            out=np.zeros(ctx.n), where=degree > 1)
+    return {'ego_dens': ego_density}
+
+
+class CentralityProfiler:
+    """
+    Per-(year, measure) timing and memory records of a centrality run
 
+    Pass one instance as `profiler` to compute_all_centralities or
+    compute_centralities_for_networks. Each measure adds a record with
+    wall and CPU seconds, the peak memory allocated while it ran, the
+    graph size and the algorithm variant. Shared intermediates are charged
+    to the 'intermediates' pseudo-measure when computed up front
+    (triangle statistics) and otherwise to the first measure that needs
+    them. Without a profiler nothing is timed.
 
-def compute_all_centralities(G: nx.Graph,
+    Parameters
+    ----------
+    trace_memory : bool, default=True
+        Track peak allocations with tracemalloc (numpy buffers included).
+        Tracing slows pure-Python code such as networkx betweenness several
+        fold, so use trace_memory=False when comparing wall times.
+    log_path : Optional[Path], default=None
+        If set, every record is also appended to this JSON-lines file
+        (e.g. paths.LOG_DIR / 'centrality_profile.jsonl')
+    """
+
+    FIELDS = ['year', 'measure', 'variant', 'n_nodes', 'n_edges', 'wall_s', 'cpu_s', 'peak_mb']
+
+    def __init__(self, trace_memory: bool = True, log_path: Optional[Path] = None):
+        self.trace_memory = trace_memory
+        self.log_path = Path(log_path) if log_path is not None else None
+        self.records: List[dict] = []
+
+    @contextmanager
+    def measure(self, year: int, measure: str, variant: str, n_nodes: int, n_edges: int):
+        """Time the enclosed block and append its record"""
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                'year': year,
+                'measure': measure,
+                'variant': variant,
+                'n_nodes': int(n_nodes),
+                'n_edges': int(n_edges),
+                'wall_s': time.perf_counter() - wall,
+                'cpu_s': time.process_time() - cpu,
+                'peak_mb': None,
+            }
+            if self.trace_memory:
+                record['peak_mb'] = (tracemalloc.get_traced_memory()[1] - base) / 1024**2
+            if started_tracing:
+                tracemalloc.stop()
+            self.add(record)
+
+    def add(self, record: dict) -> None:
+        """Append a record (also to log_path, if set)"""
+        self.records.append(record)
+        if self.log_path is not None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+
+    def to_frame(self) -> pd.DataFrame:
+        """Records as a DataFrame"""
+        return pd.DataFrame(self.records, columns=self.FIELDS)
+
+    def summary(self) -> pd.DataFrame:
+        """Total wall / CPU seconds and maximum peak memory per measure"""
+        return (self.to_frame()
+                .groupby('measure', sort=False)
+                .agg(wall_s=('wall_s', 'sum'), cpu_s=('cpu_s', 'sum'), peak_mb=('peak_mb', 'max'),
+                     years=('year', 'nunique'))
+                .sort_values('wall_s', ascending=False))
+
+
+def _measure_variant(name: str, ctx: GraphContext, options: dict) -> str:
+    """Short description of the algorithm a measure will use on this graph"""
+    weighted = {
+        'degree': 'use_weighted_degree',
+        'betweenness': 'use_weighted_betweenness',
+        'power': 'use_weighted_power',
+        'constraint': 'use_weighted_constraint',
+        'structural_holes': 'use_weighted_structural_holes',
+    }.get(name)
+    prefix = 'weighted' if weighted and options.get(weighted, False) else 'unweighted'
+    if options.get('backend', 'networkx') == 'igraph' and name in ('betweenness', 'power', 'constraint',
+                                                                     'structural_holes'):
+        prefix = f"{prefix}, igraph"
+
+    if name == 'betweenness':
+        if options.get('use_approximate_betweenness', True):
+            if options.get('betweenness_target_error') is not None:
+                return f"{prefix}, adaptive(target_error={options['betweenness_target_error']})"
+            k = options.get('betweenness_k', BETWEENNESS_PIVOTS)
+            if ctx.n > k:
+                return f"{prefix}, pivots(k={k})"
+        return f"{prefix}, exact(n_jobs={options.get('betweenness_n_jobs', 1)})"
+    if name == 'power':
+        solver = options.get('power_solver', 'auto')
+        if solver == 'auto':
+            solver = 'direct' if ctx.n <= POWER_DIRECT_MAX_NODES else 'cg'
+        return f"{prefix}, {solver}, {len(options.get('power_beta_values') or [])} betas"
+    if name in CENTRALITY_MEASURES and name not in MEASURE_FLAGS:
+        return 'custom'
+    return prefix
+
+
+# Measures that only depend on a node's 2-hop neighbourhood, with their columns
+LOCAL_MEASURES = {
+    'degree': 'dgr_cent',
+    'constraint': 'constraint',
+    'structural_holes': 'sh',
+    'ego_density': 'ego_dens',
+}
+
+
+def changed_neighbourhoods(prev_G: Union[nx.Graph, CSRGraph],
+                           G: Union[nx.Graph, CSRGraph],
+                           weighted: bool = False,
+                           weight: str = 'weight') -> np.ndarray:
+    """
+    Nodes of G whose local measures may differ from the previous network
+
+    An edge that was added, removed or (if weighted) re-weighted changes
+    the degree / strength of its endpoints and the ego networks and
+    two-step paths of their neighbours. The result marks these endpoints,
+    their neighbours in either network, and nodes absent from prev_G.
+
+    Parameters
+    ----------
+    prev_G : nx.Graph or CSRGraph
+        Previous network
+    G : nx.Graph or CSRGraph
+        Current network
+    weighted : bool, default=False
+        If True, weight changes count as edge changes
+    weight : str, default='weight'
+        Edge weight attribute name
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask in G.nodes() order
+    """
+    names = list(G.nodes())
+    n = len(names)
+    index = {name: i for i, name in enumerate(names)}
+    prev_pos = np.fromiter((index.get(name, -1) for name in prev_G.nodes()), dtype=np.int64,
+                           count=prev_G.number_of_nodes())
+
+    # Union index: current nodes first, then nodes that only exist in prev_G
+    dropped = prev_pos < 0
+    prev_pos[dropped] = n + np.arange(dropped.sum())
+    N = n + int(dropped.sum())
+
+    A = sp.csr_matrix(adjacency_matrix(G, weighted=weighted, weight=weight), dtype=float)
+    A = sp.csr_matrix((A.data, A.indices, np.append(A.indptr, np.full(N - n, A.indptr[-1]))),
+                      shape=(N, N))
+    P = sp.coo_matrix(adjacency_matrix(prev_G, weighted=weighted, weight=weight), dtype=float)
+    P = sp.csr_matrix((P.data, (prev_pos[P.row], prev_pos[P.col])), shape=(N, N))
+
+    diff = sp.csr_matrix(A - P)
+    diff.eliminate_zeros()
+    endpoints = (np.diff(diff.indptr) > 0).astype(float)
+    reach = endpoints + (A != 0) @ endpoints + (P != 0) @ endpoints
+
+    changed = reach[:n] > 0
+    is_new = np.ones(n, dtype=bool)
+    is_new[prev_pos[~dropped]] = False
+    return changed | is_new
+
+
+def _reusable_rows(ctx: GraphContext,
+                   previous: Tuple[Union[nx.Graph, CSRGraph], pd.DataFrame],
+                   local: List[str],
+                   options: dict) -> Optional[Tuple[np.ndarray, pd.DataFrame]]:
+    """Unchanged-node mask and their previous local columns (None if nothing can be reused)"""
+    prev_G, prev_df = previous
+    columns = [LOCAL_MEASURES[name] for name in local]
+    if prev_df is None or prev_df.empty or not set(columns + ['firmname']).issubset(prev_df.columns):
+        return None
+
+    weighted = any(options.get(flag, False) for flag in
+                   ('use_weighted_degree', 'use_weighted_constraint', 'use_weighted_structural_holes'))
+    prev_rows = pd.Index(prev_df['firmname']).get_indexer(ctx.nodes)
+    unchanged = ~changed_neighbourhoods(prev_G, ctx.graph, weighted=weighted, weight=ctx.weight)
+    unchanged &= prev_rows >= 0
+    return unchanged, prev_df[columns].iloc[prev_rows[unchanged]]
+
+
+def compute_all_centralities(G: Union[nx.Graph, CSRGraph],
                             year: int,
                             compute_degree: bool = True,
                             compute_betweenness: bool = True,
@@ -303,15 +1731,29 @@ def compute_all_centralities(G: nx.Graph,
                             constraint_cap_at_one: bool = True,
                             power_beta_values: Optional[List[float]] = None,
                             compute_power_max: bool = True,
-                            use_approximate_betweenness: bool = True) -> pd.DataFrame:
+                            use_approximate_betweenness: bool = True,
+                            betweenness_k: int = BETWEENNESS_PIVOTS,
+                            betweenness_n_jobs: int = 1,
+                            betweenness_target_error: Optional[float] = None,
+                            betweenness_seed: Optional[int] = 42,
+                            eigen_cache: Optional[EigenCache] = None,
+                            extra_measures: Optional[List[str]] = None,
+                            previous: Optional[Tuple[Union[nx.Graph, CSRGraph], pd.DataFrame]] = None,
+                            verify_incremental: bool = False,
+                            profiler: Optional[CentralityProfiler] = None,
+                            backend: str = 'networkx') -> pd.DataFrame:
     """
     Compute all centrality measures for a network
     
     This implements the R function VC_centralities()
+
+    The requested measures are planned together (plan_intermediates) and
+    share one GraphContext, so adjacency, degrees, λ_max and triangle
+    statistics are computed once per graph.
     
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         VC network
     year : int
         Year identifier
@@ -358,108 +1800,104 @@ def compute_all_centralities(G: nx.Graph,
         Compute pwr_max (1/lambda_max)
     use_approximate_betweenness : bool, default=True
         Use approximate betweenness for large networks
+    betweenness_k : int, default=BETWEENNESS_PIVOTS
+        Pivot sources for approximate betweenness (graphs with more nodes
+        than this are sampled)
+    betweenness_n_jobs : int, default=1
+        Parallel jobs for exact betweenness (source-partitioned)
+    betweenness_target_error : Optional[float], default=None
+        If set with use_approximate_betweenness, sample sources adaptively
+        until this relative error is reached and add btw_se (per-node
+        standard error) and btw_rel_err (achieved relative error) columns
+    betweenness_seed : Optional[int], default=42
+        Seed for sampled betweenness sources
+    eigen_cache : Optional[EigenCache], default=None
+        Cache of leading eigenpairs to reuse / warm-start λ_max for power centrality
+    extra_measures : Optional[List[str]], default=None
+        Additional measures from CENTRALITY_MEASURES (see register_measure)
+    previous : Optional[Tuple[network, pd.DataFrame]], default=None
+        Previous year's network and its result (computed with the same
+        options). Local measures (LOCAL_MEASURES) are then recomputed only
+        for nodes whose neighbourhood changed (changed_neighbourhoods) and
+        copied from the previous result for all other nodes. Normalized
+        degree is recomputed in full when the number of nodes changed.
+    verify_incremental : bool, default=False
+        With previous, also recompute the local measures for every node and
+        raise AssertionError if any value differs
+    profiler : Optional[CentralityProfiler], default=None
+        Collects a timing / memory record per measure
+    backend : str, default='networkx'
+        'networkx' or 'igraph' (betweenness, constraint and λ_max on
+        igraph's C implementations; see network.backends). Output columns
+        are the same for both.
     
     Returns
     -------
     pd.DataFrame
         Centrality measures for all nodes
     """
+    options = {name: value for name, value in locals().items()
+               if name not in ('G', 'year', 'eigen_cache', 'extra_measures',
+                               'previous', 'verify_incremental', 'profiler')}
+
     if G.number_of_nodes() == 0:
         return pd.DataFrame()
     
     if power_beta_values is None:
-        power_beta_values = [0.0, 0.75, 0.99]
+        options['power_beta_values'] = [0.0, 0.75, 0.99]
+
+    measures = [name for name, flag in MEASURE_FLAGS.items() if options[flag]]
+    measures += [name for name in (extra_measures or []) if name not in measures]
+
+    ctx = GraphContext(G, weight=weight_column, year=year, eigen_cache=eigen_cache, backend=backend)
+    plan = plan_intermediates(measures, options)
+    logger.debug(f"Year {year}: measures {measures}, intermediates {plan}")
+
+    local = [name for name in measures if name in LOCAL_MEASURES]
+    if (previous is not None and 'degree' in local and options['normalize_degree']
+            and not options['use_weighted_degree'] and ctx.n != previous[0].number_of_nodes()):
+        # degree / (n-1) changes for every node when n changes
+        local.remove('degree')
+    global_plan = plan_intermediates([name for name in measures if name not in local], options)
+    reuse = None
+    # Row-restricted intermediates must not leak into measures that read every row
+    if previous is not None and local and not any(
+            name in TRIANGLE_INTERMEDIATES + ('constraint',) for name, _ in global_plan):
+        reuse = _reusable_rows(ctx, previous, local, options)
+
+    def profiled(measure, variant):
+        if profiler is None:
+            return nullcontext()
+        return profiler.measure(year, measure, variant, ctx.n, G.number_of_edges())
+
+    if reuse is not None:
+        unchanged, prev_values = reuse
+        with profiled('intermediates', f'incremental({ctx.n - unchanged.sum()} of {ctx.n} nodes)'):
+            ctx.prepare(global_plan)
+            ctx.prepare_local(plan_intermediates(local, options), np.flatnonzero(~unchanged))
+        logger.info(f"Year {year}: recomputing local measures for {ctx.n - unchanged.sum()} "
+                    f"of {ctx.n} nodes")
+    elif any(name in TRIANGLE_INTERMEDIATES for name, _ in plan):
+        with profiled('intermediates', 'triangle pass'):
+            ctx.prepare(plan)
     
-    # Initialize result dictionary
+    # Initialize result dictionary (compact id columns, as in constants.DTYPE_OPTIMIZATION)
     result = {
-        'firmname': list(G.nodes()),
-        'year': [year] * G.number_of_nodes()
+        'firmname': pd.Categorical(ctx.nodes),
+        'year': np.full(ctx.n, year, dtype=np.int16)
     }
-    
-    # Degree centrality
-    if compute_degree:
-        degree_cent = compute_degree_centrality(
-            G, 
-            normalized=normalize_degree,
-            weighted=use_weighted_degree,
-            weight=weight_column
-        )
-        result['dgr_cent'] = [degree_cent.get(node, 0) for node in G.nodes()]
-    
-    # Betweenness centrality
-    if compute_betweenness:
-        btw_cent = compute_betweenness_centrality(
-            G, 
-            normalized=normalize_betweenness,
-            weighted=use_weighted_betweenness,
-            weight=weight_column,
-            approximate=use_approximate_betweenness
-        )
-        result['btw_cent'] = [btw_cent.get(node, 0) for node in G.nodes()]
-    
-    # Power centrality (multiple beta values)
-    if compute_power:
-        # Get max eigenvalue for beta calculation (use unweighted if requested)
-        try:
-            if use_weighted_power:
-                A = nx.adjacency_matrix(G, weight=weight_column)
-            else:
-                A = nx.adjacency_matrix(G, weight=None)
-            
-            eigenvalues, _ = eigs(A, k=1, which='LM')
-            lambda_max = np.abs(eigenvalues[0].real)
-            
-            # Add pwr_max (1/lambda_max) if requested
-            if compute_power_max:
-                result['pwr_max'] = [1/lambda_max] * G.number_of_nodes()
-            
-            for beta_rel in power_beta_values:
-                if beta_rel == 0:
-                    beta = 0
-                else:
-                    beta = (1/lambda_max) * beta_rel
-                
-                power_cent = compute_power_centrality(
-                    G, 
-                    beta, 
-                    normalized=normalize_power,
-                    weighted=use_weighted_power,
-                    weight=weight_column
-                )
-                col_name = f'pwr_p{int(beta_rel*100)}'
-                result[col_name] = [power_cent.get(node, 0) for node in G.nodes()]
-                
-        except Exception as e:
-            logger.warning(f"Error computing power centralities: {e}")
-            if compute_power_max:
-                result['pwr_max'] = [0.0] * G.number_of_nodes()
-            for beta_rel in power_beta_values:
-                col_name = f'pwr_p{int(beta_rel*100)}'
-                result[col_name] = [0.0] * G.number_of_nodes()
-    
-    # Constraint
-    if compute_constraint_measure:
-        constraint_vals = compute_constraint(
-            G,
-            weighted=use_weighted_constraint,
-            weight=weight_column,
-            cap_at_one=constraint_cap_at_one
-        )
-        result['constraint'] = [constraint_vals.get(node, np.nan) for node in G.nodes()]
-    
-    # Structural holes (effective size)
-    if compute_structural_holes_measure:
-        sh_vals = compute_structural_holes(
-            G,
-            weighted=use_weighted_structural_holes,
-            weight=weight_column
-        )
-        result['sh'] = [sh_vals.get(node, 0.0) for node in G.nodes()]
-
-    # Ego network density (always unweighted)
-    if compute_ego_density_measure:
-        ego_dens = compute_ego_density(G)
-        result['ego_dens'] = [ego_dens.get(node, 0.0) for node in G.nodes()]
+    for name in measures:
+        variant = _measure_variant(name, ctx, options) if profiler is not None else None
+        if reuse is not None and name in local:
+            variant = f"{variant}, incremental" if variant else None
+        with profiled(name, variant):
+            columns = CENTRALITY_MEASURES[name].compute(ctx, options)
+        if reuse is not None and name in local:
+            for column, values in columns.items():
+                values = np.array(values)
+                values[unchanged] = prev_values[column].to_numpy(dtype=values.dtype)
+                columns[column] = values
+        result.update(columns)
     
     # Create DataFrame
     df_result = pd.DataFrame(result)
@@ -467,27 +1905,210 @@ def compute_all_centralities(G: nx.Graph,
     # Fill NaN constraint values if requested
     if compute_constraint_measure and constraint_fill_na:
         df_result['constraint'] = df_result['constraint'].fillna(constraint_fill_value)
+
+    if verify_incremental and reuse is not None:
+        full = compute_all_centralities(G, year, eigen_cache=eigen_cache, extra_measures=extra_measures,
+                                        **options)
+        for column in (LOCAL_MEASURES[name] for name in local):
+            if not np.allclose(df_result[column].to_numpy(dtype=float), full[column].to_numpy(dtype=float),
+                               rtol=1e-9, atol=1e-12, equal_nan=True):
+                raise AssertionError(f"Year {year}: incremental {column} differs from full recomputation")
     
     return df_result
 
 
-def compute_centralities_for_networks(networks: Dict[int, nx.Graph],
+# Measures that run together when a large year is split into subtasks. The
+# groups are contiguous in MEASURE_FLAGS order (so merged columns keep the
+# usual order) and the triangle-based measures stay together so they still
+# share one enumeration.
+MEASURE_GROUPS = [
+    ('degree',),
+    ('betweenness',),
+    ('power',),
+    ('constraint', 'structural_holes', 'ego_density'),
+]
+
+
+def estimate_centrality_cost(n_nodes: int, n_edges: int, **kwargs) -> Dict[str, float]:
+    """
+    Rough relative cost of each requested measure for one network
+
+    The units are arbitrary (about one edge visit); only the ratios
+    between jobs matter for scheduling. Exact betweenness is one BFS per
+    node (n * m), sampled betweenness one BFS per pivot, power centrality
+    a few dozen sparse mat-vecs per beta, and the triangle measures are
+    bounded by m^1.5. Measures registered through extra_measures are
+    counted as one pass over the graph.
+
+    Parameters
+    ----------
+    n_nodes : int
+        Number of nodes
+    n_edges : int
+        Number of edges
+    **kwargs : dict
+        compute_all_centralities arguments (flags and options)
+
+    Returns
+    -------
+    Dict[str, float]
+        {measure: estimated cost} for the measures that will run
+    """
+    n, m = float(n_nodes), float(n_edges)
+    cost = {}
+    if kwargs.get('compute_degree', True):
+        cost['degree'] = n + m
+    if kwargs.get('compute_betweenness', True):
+        if not kwargs.get('use_approximate_betweenness', True):
+            n_sources = n
+        elif kwargs.get('betweenness_target_error') is not None:
+            n_sources = min(n, ADAPTIVE_BETWEENNESS_SOURCES)
+        else:
+            n_sources = min(n, kwargs.get('betweenness_k', BETWEENNESS_PIVOTS))
+        cost['betweenness'] = n_sources * (n + m)
+    if kwargs.get('compute_power', True):
+        n_betas = len(kwargs.get('power_beta_values') or [0.0, 0.75, 0.99])
+        cost['power'] = 50 * (n_betas + 1) * (n + m)
+    triangle_cost = n + m ** 1.5
+    for name in ('constraint', 'structural_holes', 'ego_density'):
+        if kwargs.get(MEASURE_FLAGS[name], True):
+            cost[name] = triangle_cost
+    for name in kwargs.get('extra_measures') or []:
+        cost.setdefault(name, n + m)
+    return cost
+
+
+def plan_centrality_jobs(networks: Dict[int, Union[nx.Graph, CSRGraph]],
+                         n_workers: int,
+                         **kwargs) -> List[Tuple[float, int, Optional[Tuple[str, ...]]]]:
+    """
+    Order per-year centrality jobs largest first, splitting the big years
+
+    A year whose estimated cost exceeds an equal share of the total
+    (total / n_workers) is split into one subtask per MEASURE_GROUPS entry
+    (plus one for the extra_measures) so it can spread over several workers. Dispatching the list in order
+    is the longest-processing-time-first heuristic.
+
+    Parameters
+    ----------
+    networks : Dict[int, nx.Graph or CSRGraph]
+        Dictionary of {year: network}
+    n_workers : int
+        Number of parallel workers
+    **kwargs : dict
+        compute_all_centralities arguments
+
+    Returns
+    -------
+    List[Tuple[float, int, Optional[Tuple[str, ...]]]]
+        (estimated cost, year, measure group or None for the whole year),
+        most expensive first
+    """
+    costs = {
+        year: estimate_centrality_cost(G.number_of_nodes(), G.number_of_edges(), **kwargs)
+        for year, G in networks.items()
+    }
+    share = sum(sum(c.values()) for c in costs.values()) / max(n_workers, 1)
+    grouped = {name for group in MEASURE_GROUPS for name in group}
+    extra_group = tuple(name for name in kwargs.get('extra_measures') or [] if name not in grouped)
+    groups = MEASURE_GROUPS + ([extra_group] if extra_group else [])
+
+    jobs = []
+    for year, cost in costs.items():
+        total = sum(cost.values())
+        if total <= share or len(cost) < 2:
+            jobs.append((total, year, None))
+            continue
+        for group in groups:
+            group_cost = sum(cost.get(name, 0.0) for name in group)
+            if group_cost > 0:
+                jobs.append((group_cost, year, group))
+
+    jobs.sort(key=lambda job: -job[0])
+    return jobs
+
+
+def _centrality_job(G: Union[nx.Graph, CSRGraph],
+                    year: int,
+                    group: Optional[Tuple[str, ...]],
+                    kwargs: dict) -> Tuple[pd.DataFrame, List[dict]]:
+    """Run compute_all_centralities for one year, restricted to a measure group"""
+    # Workers profile into their own instance; the parent merges the records
+    profiler = kwargs.get('profiler')
+    if profiler is not None:
+        profiler = CentralityProfiler(trace_memory=profiler.trace_memory)
+        kwargs = {**kwargs, 'profiler': profiler}
+    if group is not None:
+        kwargs = dict(kwargs)
+        for name, flag in MEASURE_FLAGS.items():
+            kwargs[flag] = kwargs.get(flag, True) and name in group
+        kwargs['extra_measures'] = [name for name in kwargs.get('extra_measures') or [] if name in group]
+    df = compute_all_centralities(G, year, **kwargs)
+    return df, (profiler.records if profiler is not None else [])
+
+
+def concat_centralities(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Stack per-year centrality frames into one firm-year panel
+
+    firmname stays categorical over the union of all years' firms
+    (pd.concat would fall back to object strings when the per-year
+    categories differ) and the numeric columns are stacked as arrays.
+
+    Parameters
+    ----------
+    frames : List[pd.DataFrame]
+        Outputs of compute_all_centralities
+
+    Returns
+    -------
+    pd.DataFrame
+        Firm-year centrality panel
+    """
+    from pandas.api.types import union_categoricals
+
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    firmname = union_categoricals([pd.Categorical(df['firmname']) for df in frames])
+    panel = pd.concat([df.drop(columns='firmname') for df in frames], ignore_index=True)
+    panel.insert(0, 'firmname', firmname)
+    return panel
+
+
+def compute_centralities_for_networks(networks: Dict[int, Union[nx.Graph, CSRGraph]],
                                      use_parallel: bool = True,
                                      n_jobs: int = -1,
+                                     warm_start_eigen: bool = False,
+                                     incremental: bool = False,
                                      **kwargs) -> pd.DataFrame:
     """
     Compute centralities for multiple networks
     
     Parameters
     ----------
-    networks : Dict[int, nx.Graph]
+    networks : Dict[int, nx.Graph or CSRGraph]
         Dictionary of {year: network}
     use_parallel : bool, default=True
         Use parallel processing
     n_jobs : int, default=-1
-        Number of parallel jobs
+        Number of parallel jobs. Jobs are dispatched largest first and the
+        biggest years are split by measure group (see plan_centrality_jobs).
+    warm_start_eigen : bool, default=False
+        Seed each year's λ_max solve with the adjacent year's eigenvector
+        (see EigenCache). In parallel mode the eigenpairs are solved
+        serially up front in year order and each worker gets its year's
+        entry, which only pays off when λ_max dominates the run.
+    incremental : bool, default=False
+        Update local measures from the previous year's result for nodes
+        whose neighbourhood did not change (see compute_all_centralities
+        `previous`). Years depend on each other, so this runs serially;
+        pass verify_incremental=True to check against full recomputation.
     **kwargs : dict
-        Additional arguments for compute_all_centralities
+        Additional arguments for compute_all_centralities. A `profiler`
+        (CentralityProfiler) collects per-(year, measure) records in both
+        serial and parallel mode.
     
     Returns
     -------
@@ -495,27 +2116,79 @@ def compute_centralities_for_networks(networks: Dict[int, nx.Graph],
         Centralities for all years
     """
     logger.info(f"Computing centralities for {len(networks)} networks...")
+
+    eigen_cache = None
+    # The igraph backend solves λ_max itself, without the cache
+    if (warm_start_eigen and kwargs.get('compute_power', True) and 'eigen_cache' not in kwargs
+            and kwargs.get('backend', 'networkx') == 'networkx'):
+        eigen_cache = EigenCache()
     
-    if use_parallel and len(networks) > 1:
-        from joblib import Parallel, delayed
+    if incremental and use_parallel:
+        logger.info("Incremental centralities run serially (each year builds on the previous one)")
+
+    if use_parallel and not incremental and len(networks) > 1:
+        from joblib import Parallel, delayed, effective_n_jobs
         from tqdm import tqdm
+
+        if eigen_cache is not None:
+            warm_eigen_cache(networks,
+                             weighted=kwargs.get('use_weighted_power', False),
+                             weight=kwargs.get('weight_column', 'weight'),
+                             eigen_cache=eigen_cache)
         
-        results = Parallel(n_jobs=n_jobs)(
-            delayed(compute_all_centralities)(network, year, **kwargs)
-            for year, network in tqdm(networks.items(), desc="Computing centralities")
+        jobs = plan_centrality_jobs(networks, effective_n_jobs(n_jobs),
+                                    **{k: v for k, v in kwargs.items() if k != 'profiler'})
+        logger.info(f"Scheduled {len(jobs)} jobs for {len(networks)} years (largest first)")
+
+        def job_kwargs(year, group):
+            if eigen_cache is None or (group is not None and 'power' not in group):
+                return kwargs
+            return {**kwargs, 'eigen_cache': eigen_cache.subset([year])}
+
+        # batch_size=1 so the ordering is kept and no worker idles behind a batch
+        outputs = Parallel(n_jobs=n_jobs, batch_size=1)(
+            delayed(_centrality_job)(networks[year], year, group, job_kwargs(year, group))
+            for _, year, group in tqdm(jobs, desc="Computing centralities")
         )
-        
-        centrality_df = pd.concat(results, ignore_index=True)
+
+        # Reassemble in year order; split years are merged column-wise in group order
+        parts = {}
+        profiler = kwargs.get('profiler')
+        for (_, year, group), (df, records) in zip(jobs, outputs):
+            if profiler is not None:
+                for record in records:
+                    profiler.add(record)
+            # The extra_measures group comes last, as in compute_all_centralities
+            order = MEASURE_GROUPS.index(group) if group in MEASURE_GROUPS else len(MEASURE_GROUPS)
+            parts.setdefault(year, []).append((order, df))
+
+        results = []
+        for year in networks:
+            year_parts = [df for _, df in sorted(parts[year], key=lambda part: part[0])]
+            merged = year_parts[0]
+            for df in year_parts[1:]:
+                if df.empty:
+                    continue
+                merged = df if merged.empty else pd.concat([merged, df.drop(columns=['firmname', 'year'])], axis=1)
+            results.append(merged)
+
+        centrality_df = concat_centralities(results)
     else:
         from tqdm import tqdm
+        if eigen_cache is not None:
+            kwargs['eigen_cache'] = eigen_cache
         results = []
+        previous = None
         for year, network in tqdm(networks.items(), desc="Computing centralities"):
-            df = compute_all_centralities(network, year, **kwargs)
+            df = compute_all_centralities(network, year, previous=previous, **kwargs)
             results.append(df)
+            if incremental:
+                previous = (network, df)
         
-        centrality_df = pd.concat(results, ignore_index=True)
+        centrality_df = concat_centralities(results)
     
     logger.info(f"Computed centralities: {len(centrality_df)} firm-year observations")
+    if kwargs.get('profiler') is not None and kwargs['profiler'].records:
+        logger.info(f"Centrality time by measure:\n{kwargs['profiler'].summary().to_string()}")
     
     return centrality_df
-
@@ -8,21 +8,37 @@ converting VC-Company bipartite networks to VC-VC one-mode networks.
 import pandas as pd
 import numpy as np
 import networkx as nx
+import scipy.sparse as sp
 from networkx.algorithms import bipartite
 import logging
-from typing import Optional, Tuple
+import numbers
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
 from ..config import parameters
+from .csr_graph import CSRGraph
+
+NETWORK_OUTPUTS = ('graph', 'sparse', 'csr')
 
 logger = logging.getLogger(__name__)
 
 
 def create_event_identifier(df: pd.DataFrame,
                             company_col: str = 'comname',
-                            year_col: str = 'year') -> pd.DataFrame:
+                            year_col: str = 'year',
+                            as_integer: bool = True,
+                            return_lookup: bool = False) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame]]:
     """
     Create event identifier for bipartite network
     
+    An event is a company-year. By default the identifier is an integer
+    code, company_code * n_years + year_code, where both codes come from
+    pd.factorize (missing values get their own code, as 'nan' did in the
+    string identifier). This avoids building and hashing one Python string
+    per round row.
+    
     Parameters
     ----------
     df : pd.DataFrame
@@ -31,14 +47,33 @@ def create_event_identifier(df: pd.DataFrame,
         Company name column
     year_col : str, default='year'
         Year column
+    as_integer : bool, default=True
+        If False, build the legacy '<company>_<year>' string identifier
+    return_lookup : bool, default=False
+        Also return a lookup table with columns [event, company_col, year_col]
     
     Returns
     -------
-    pd.DataFrame
-        Data with event column
+    pd.DataFrame or Tuple[pd.DataFrame, pd.DataFrame]
+        Data with event column (and the event lookup table if requested)
     """
     df = df.copy()
-    df['event'] = df[company_col].astype(str) + '_' + df[year_col].astype(str)
+    
+    if as_integer:
+        company_codes, _ = pd.factorize(df[company_col], use_na_sentinel=False)
+        year_codes, year_values = pd.factorize(df[year_col], use_na_sentinel=False)
+        df['event'] = company_codes.astype(np.int64) * len(year_values) + year_codes
+    else:
+        df['event'] = df[company_col].astype(str) + '_' + df[year_col].astype(str)
+    
+    if return_lookup:
+        lookup = (
+            df[['event', company_col, year_col]]
+            .drop_duplicates(subset='event')
+            .reset_index(drop=True)
+        )
+        return df, lookup
+    
     return df
 
 
@@ -48,6 +83,9 @@ def construct_bipartite_network(edgelist: pd.DataFrame,
     """
     Construct bipartite network (VC-Event)
     
+    Event nodes are tagged as ('event', event id) so they stay disjoint
+    from firm nodes even when both use integer labels.
+    
     Parameters
     ----------
     edgelist : pd.DataFrame
@@ -67,14 +105,14 @@ def construct_bipartite_network(edgelist: pd.DataFrame,
     
     # Get unique firms and events
     firms = edgelist[firm_col].unique()
-    events = edgelist[event_col].unique()
+    events = [('event', event) for event in edgelist[event_col].unique()]
     
     # Add nodes with bipartite attribute
     B.add_nodes_from(firms, bipartite=0)
     B.add_nodes_from(events, bipartite=1)
     
     # Add edges
-    edges = list(zip(edgelist[firm_col], edgelist[event_col]))
+    edges = [(firm, ('event', event)) for firm, event in zip(edgelist[firm_col], edgelist[event_col])]
     B.add_edges_from(edges)
     
     return B
@@ -107,6 +145,225 @@ def project_to_onemode(bipartite_network: nx.Graph,
     return G
 
 
+def build_incidence_matrix(edgelist: pd.DataFrame,
+                           firm_col: str = 'firmname',
+                           event_col: str = 'event') -> Tuple[sp.csr_matrix, np.ndarray]:
+    """
+    Build binary event-by-firm incidence matrix from an edge list
+    
+    Firms and events are factorized to integer codes (firms in order of
+    first appearance). Repeated firm-event rows collapse to a single 1,
+    matching the simple graph used by the networkx engine.
+    
+    Parameters
+    ----------
+    edgelist : pd.DataFrame
+        Edge list with firm and event columns
+    firm_col : str, default='firmname'
+        Firm column name
+    event_col : str, default='event'
+        Event column name
+    
+    Returns
+    -------
+    Tuple[sp.csr_matrix, np.ndarray]
+        (incidence matrix of shape (n_events, n_firms), firm labels)
+    """
+    firm_codes, firm_labels = pd.factorize(edgelist[firm_col])
+    event_codes, event_labels = pd.factorize(edgelist[event_col])
+    
+    # Missing firm/event values have code -1
+    valid = (firm_codes >= 0) & (event_codes >= 0)
+    if not valid.all():
+        firm_codes = firm_codes[valid]
+        event_codes = event_codes[valid]
+    
+    B = sp.csr_matrix(
+        (np.ones(len(firm_codes), dtype=np.int32), (event_codes, firm_codes)),
+        shape=(len(event_labels), len(firm_labels))
+    )
+    # Duplicate rows were summed on construction; binarize
+    B.data[:] = 1
+    
+    return B, np.asarray(firm_labels, dtype=object)
+
+
+def project_to_onemode_sparse(edgelist: pd.DataFrame,
+                              firm_col: str = 'firmname',
+                              event_col: str = 'event') -> Tuple[sp.csr_matrix, np.ndarray]:
+    """
+    Project VC-Event edge list to weighted VC-VC co-investment matrix
+    
+    Computes W = B^T·B from the binary incidence matrix B, so W[i, j] is
+    the number of events shared by firms i and j. Edge weights are
+    identical to bipartite.weighted_projected_graph.
+    
+    Parameters
+    ----------
+    edgelist : pd.DataFrame
+        Edge list with firm and event columns
+    firm_col : str, default='firmname'
+        Firm column name
+    event_col : str, default='event'
+        Event column name
+    
+    Returns
+    -------
+    Tuple[sp.csr_matrix, np.ndarray]
+        (symmetric co-investment matrix with zero diagonal, firm labels)
+    """
+    B, firm_labels = build_incidence_matrix(edgelist, firm_col, event_col)
+    
+    W = (B.T @ B).tocsr()
+    W.setdiag(0)
+    W.eliminate_zeros()
+    W.sort_indices()
+    
+    return W, firm_labels
+
+
+def project_to_onemode_igraph(edgelist: pd.DataFrame,
+                              firm_col: str = 'firmname',
+                              event_col: str = 'event') -> Tuple[sp.csr_matrix, np.ndarray]:
+    """
+    Project VC-Event edge list with igraph's bipartite projection
+
+    Builds the firm-event bipartite igraph.Graph from the binary incidence
+    matrix and projects it onto the firms with multiplicities (shared
+    events) as edge weights. Same output as project_to_onemode_sparse.
+
+    Parameters
+    ----------
+    edgelist : pd.DataFrame
+        Edge list with firm and event columns
+    firm_col : str, default='firmname'
+        Firm column name
+    event_col : str, default='event'
+        Event column name
+
+    Returns
+    -------
+    Tuple[sp.csr_matrix, np.ndarray]
+        (symmetric co-investment matrix with zero diagonal, firm labels)
+    """
+    import igraph as ig
+
+    B, firm_labels = build_incidence_matrix(edgelist, firm_col, event_col)
+    n_events, n_firms = B.shape
+    incidence = B.tocoo()
+
+    # Firms are vertices 0..n_firms-1, events follow
+    bipartite_graph = ig.Graph(
+        n=n_firms + n_events,
+        edges=np.column_stack([incidence.col, n_firms + incidence.row]).tolist()
+    )
+    types = np.r_[np.zeros(n_firms, dtype=bool), np.ones(n_events, dtype=bool)].tolist()
+    projected = bipartite_graph.bipartite_projection(types=types, multiplicity=True, which=0)
+
+    edges = np.asarray(projected.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+    weights = np.asarray(projected.es['weight'] if projected.ecount() else [], dtype=np.int32)
+    W = sp.csr_matrix(
+        (np.r_[weights, weights], (np.r_[edges[:, 0], edges[:, 1]], np.r_[edges[:, 1], edges[:, 0]])),
+        shape=(n_firms, n_firms)
+    )
+    W.sort_indices()
+
+    return W, firm_labels
+
+
+def filter_sparse_edges_by_weight(W: sp.csr_matrix,
+                                  firm_labels: np.ndarray,
+                                  min_weight: int = 1) -> Tuple[sp.csr_matrix, np.ndarray]:
+    """
+    Filter co-investment matrix entries by weight threshold
+    
+    Sparse counterpart of filter_edges_by_weight: entries below min_weight
+    are dropped and firms left without any edge are removed.
+    
+    Parameters
+    ----------
+    W : sp.csr_matrix
+        Co-investment matrix
+    firm_labels : np.ndarray
+        Firm labels aligned with W
+    min_weight : int, default=1
+        Minimum edge weight
+    
+    Returns
+    -------
+    Tuple[sp.csr_matrix, np.ndarray]
+        Filtered matrix and firm labels
+    """
+    if min_weight <= 1:
+        return W, firm_labels
+    
+    n_edges_before = W.nnz // 2
+    n_nodes_before = W.shape[0]
+    
+    W = W.copy()
+    W.data[W.data < min_weight] = 0
+    W.eliminate_zeros()
+    
+    # Remove isolated nodes
+    keep = np.diff(W.indptr) > 0
+    W = W[keep][:, keep].tocsr()
+    firm_labels = firm_labels[keep]
+    
+    logger.info(f"Edge filtering (weight>={min_weight}): "
+                f"{n_edges_before} → {W.nnz // 2} edges, "
+                f"{n_nodes_before} → {W.shape[0]} nodes")
+    
+    return W, firm_labels
+
+
+def sparse_to_networkx(W: sp.csr_matrix, firm_labels: np.ndarray) -> nx.Graph:
+    """
+    Convert co-investment matrix to weighted nx.Graph
+    
+    Parameters
+    ----------
+    W : sp.csr_matrix
+        Symmetric co-investment matrix
+    firm_labels : np.ndarray
+        Firm labels aligned with W
+    
+    Returns
+    -------
+    nx.Graph
+        VC network with integer 'weight' edge attribute
+    """
+    G = nx.Graph()
+    # Same node attribute as the networkx projection
+    G.add_nodes_from(firm_labels.tolist(), bipartite=0)
+    
+    upper = sp.triu(W, k=1).tocoo()
+    G.add_weighted_edges_from(zip(
+        firm_labels[upper.row].tolist(),
+        firm_labels[upper.col].tolist(),
+        upper.data.tolist()
+    ))
+    
+    return G
+
+
+def _empty_network(output: str):
+    """Empty network in the requested output format"""
+    if output == 'sparse':
+        return sp.csr_matrix((0, 0), dtype=np.int32), np.array([], dtype=object)
+    if output == 'csr':
+        return CSRGraph(np.zeros(1, dtype=np.int32), [], np.array([], dtype=np.int32), [])
+    return nx.Graph()
+
+
+def _format_network(W: sp.csr_matrix, firm_labels: np.ndarray, output: str):
+    """Co-investment matrix in the requested output format"""
+    if output == 'sparse':
+        return W, firm_labels
+    if output == 'csr':
+        return CSRGraph.from_scipy(W, firm_labels)
+    return sparse_to_networkx(W, firm_labels)
+
+
 def filter_edges_by_weight(G: nx.Graph, min_weight: int = 1) -> nx.Graph:
     """
     Filter edges by weight threshold
@@ -150,7 +407,9 @@ def construct_vc_network(round_df: pd.DataFrame,
                         edge_cutpoint: Optional[int] = None,
                         firm_col: str = 'firmname',
                         event_col: str = 'event',
-                        year_col: str = 'year') -> nx.Graph:
+                        year_col: str = 'year',
+                        engine: str = 'networkx',
+                        output: str = 'graph') -> Union[nx.Graph, Tuple[sp.csr_matrix, np.ndarray], CSRGraph]:
     """
     Construct VC network for a specific year
     
@@ -177,12 +436,24 @@ def construct_vc_network(round_df: pd.DataFrame,
         Event column name
     year_col : str, default='year'
         Year column name
+    engine : str, default='networkx'
+        Projection engine: 'networkx' (bipartite graph projection),
+        'sparse' (scipy incidence matrix, W = B^T·B) or 'igraph' (igraph
+        bipartite projection). All give identical edge weights.
+    output : str, default='graph'
+        'graph' returns nx.Graph; 'sparse' returns (csr_matrix, firm labels);
+        'csr' returns CSRGraph
     
     Returns
     -------
-    nx.Graph
+    nx.Graph, Tuple[sp.csr_matrix, np.ndarray] or CSRGraph
         VC network
     """
+    if engine not in ('networkx', 'sparse', 'igraph'):
+        raise ValueError(f"Unknown projection engine: {engine}")
+    if output not in NETWORK_OUTPUTS:
+        raise ValueError(f"Unknown network output: {output}")
+    
     # Filter by time window
     if time_window is not None:
         edgelist = round_df[
@@ -194,13 +465,26 @@ def construct_vc_network(round_df: pd.DataFrame,
     
     if len(edgelist) == 0:
         logger.warning(f"No data for year {year}")
-        return nx.Graph()
+        return _empty_network(output)
     
     # Create event identifier if not present
     if event_col not in edgelist.columns:
         edgelist = create_event_identifier(edgelist)
         event_col = 'event'
     
+    if engine in ('sparse', 'igraph'):
+        # Project via incidence matrix
+        project = project_to_onemode_sparse if engine == 'sparse' else project_to_onemode_igraph
+        W, firm_labels = project(edgelist, firm_col, event_col)
+        
+        # Filter edges
+        if edge_cutpoint is not None and edge_cutpoint > 1:
+            W, firm_labels = filter_sparse_edges_by_weight(W, firm_labels, edge_cutpoint)
+        
+        logger.info(f"Year {year}: {W.shape[0]} VCs, {W.nnz // 2} edges")
+        
+        return _format_network(W, firm_labels, output)
+    
     # Construct bipartite network
     bipartite_net = construct_bipartite_network(edgelist, firm_col, event_col)
     
@@ -214,15 +498,359 @@ def construct_vc_network(round_df: pd.DataFrame,
     logger.info(f"Year {year}: {vc_network.number_of_nodes()} VCs, "
                 f"{vc_network.number_of_edges()} edges")
     
+    if output == 'sparse':
+        firm_labels = np.array(list(vc_network.nodes()), dtype=object)
+        W = nx.to_scipy_sparse_array(vc_network, nodelist=firm_labels.tolist(),
+                                     weight='weight', format='csr')
+        return sp.csr_matrix(W), firm_labels
+    if output == 'csr':
+        return CSRGraph.from_networkx(vc_network)
+    
     return vc_network
 
 
+def _cooccurrence_counts(firm_codes: np.ndarray,
+                         event_codes: np.ndarray,
+                         n_firms: int) -> sp.csr_matrix:
+    """Co-investment counts B^T·B over integer codes (diagonal = events per firm)"""
+    if len(firm_codes) == 0:
+        return sp.csr_matrix((n_firms, n_firms), dtype=np.int32)
+    ev_codes, ev_local = np.unique(event_codes, return_inverse=True)
+    B = sp.csr_matrix(
+        (np.ones(len(firm_codes), dtype=np.int32), (ev_local, firm_codes)),
+        shape=(len(ev_codes), n_firms)
+    )
+    B.data[:] = 1
+    return (B.T @ B).tocsr()
+
+
+def _window_years(year: int, time_window: Optional[int]) -> range:
+    """Years covered by the network of a target year (year-time_window to year-1)"""
+    if time_window is None:
+        return range(year - 1, year)
+    return range(year - time_window, year)
+
+
+def construct_networks_incremental(round_df: pd.DataFrame,
+                                   years: list,
+                                   time_window: Optional[int] = 5,
+                                   edge_cutpoint: Optional[int] = None,
+                                   firm_col: str = 'firmname',
+                                   event_col: str = 'event',
+                                   year_col: str = 'year',
+                                   output: str = 'graph') -> dict:
+    """
+    Construct VC networks for multiple years with a sliding window
+    
+    Instead of re-filtering and re-projecting every window, co-investment
+    counts are computed once per calendar year (C_t = B_t^T·B_t over a
+    global firm index) and a running sum is updated from one target year
+    to the next: counts of years entering the window are added and counts
+    of years leaving it are subtracted. Each investment year is therefore
+    projected once rather than time_window times.
+    
+    Since an event (company-year) belongs to a single year, the window sum
+    equals the projection of the whole window, so networks are identical
+    to construct_vc_network. If events span several years the function
+    falls back to per-year construction.
+    
+    Parameters
+    ----------
+    round_df : pd.DataFrame
+        Investment round data
+    years : list
+        List of target years
+    time_window : Optional[int], default=5
+        Time window in years (None uses only year-1)
+    edge_cutpoint : Optional[int], default=None
+        Minimum edge weight threshold
+    firm_col : str, default='firmname'
+        Firm column name
+    event_col : str, default='event'
+        Event column name
+    year_col : str, default='year'
+        Year column name
+    output : str, default='graph'
+        'graph' (nx.Graph), 'sparse' ((csr_matrix, firm labels)) or 'csr' (CSRGraph)
+    
+    Returns
+    -------
+    dict
+        Dictionary of {year: network}
+    """
+    if output not in NETWORK_OUTPUTS:
+        raise ValueError(f"Unknown network output: {output}")
+    
+    if len(years) == 0:
+        return {}
+    
+    # Rows needed by any window
+    first_year = min(_window_years(y, time_window).start for y in years)
+    last_year = max(years) - 1
+    edgelist = round_df[
+        (round_df[year_col] >= first_year) &
+        (round_df[year_col] <= last_year)
+    ]
+    
+    if event_col not in edgelist.columns:
+        edgelist = create_event_identifier(edgelist)
+        event_col = 'event'
+    
+    if len(edgelist) > 0 and edgelist.groupby(event_col, observed=True)[year_col].nunique().max() > 1:
+        logger.warning("Events span multiple years; falling back to per-year construction")
+        return {
+            year: construct_vc_network(round_df, year, time_window, edge_cutpoint,
+                                       firm_col=firm_col, event_col=event_col,
+                                       year_col=year_col, engine='sparse', output=output)
+            for year in years
+        }
+    
+    # Global integer codes
+    firm_codes, firm_labels = pd.factorize(edgelist[firm_col])
+    event_codes, _ = pd.factorize(edgelist[event_col])
+    firm_labels = np.asarray(firm_labels, dtype=object)
+    row_years = edgelist[year_col].to_numpy()
+    valid = (firm_codes >= 0) & (event_codes >= 0)
+    firm_codes, event_codes, row_years = firm_codes[valid], event_codes[valid], row_years[valid]
+    n_firms = len(firm_labels)
+    
+    # Row positions grouped by calendar year
+    order = np.argsort(row_years, kind='stable')
+    row_years_sorted = row_years[order]
+    
+    def _year_counts(t: int) -> sp.csr_matrix:
+        """Co-investment counts contributed by calendar year t (diagonal kept)"""
+        lo, hi = np.searchsorted(row_years_sorted, [t, t + 1])
+        idx = order[lo:hi]
+        return _cooccurrence_counts(firm_codes[idx], event_codes[idx], n_firms)
+    
+    from tqdm import tqdm
+    
+    # Running window sum; diagonal holds each firm's event count in the window
+    S = sp.csr_matrix((n_firms, n_firms), dtype=np.int32)
+    year_counts = {}
+    networks = {}
+    
+    for year in tqdm(sorted(set(years)), desc="Constructing networks (incremental)"):
+        window = set(_window_years(year, time_window))
+        
+        for t in sorted(set(year_counts) - window):
+            S = S - year_counts.pop(t)
+        for t in sorted(window - set(year_counts)):
+            year_counts[t] = _year_counts(t)
+            S = S + year_counts[t]
+        S.eliminate_zeros()
+        
+        active = np.flatnonzero(S.diagonal() > 0)
+        if len(active) == 0:
+            logger.warning(f"No data for year {year}")
+            networks[year] = _empty_network(output)
+            continue
+        
+        W = S[active][:, active].tocsr()
+        W.setdiag(0)
+        W.eliminate_zeros()
+        W.sort_indices()
+        labels = firm_labels[active]
+        
+        if edge_cutpoint is not None and edge_cutpoint > 1:
+            W, labels = filter_sparse_edges_by_weight(W, labels, edge_cutpoint)
+        
+        logger.info(f"Year {year}: {W.shape[0]} VCs, {W.nnz // 2} edges")
+        
+        networks[year] = _format_network(W, labels, output)
+    
+    return {year: networks[year] for year in years}
+
+
+def encode_round_data(round_df: pd.DataFrame,
+                      firm_col: str = 'firmname',
+                      event_col: str = 'event',
+                      year_col: str = 'year',
+                      company_col: str = 'comname') -> Dict[str, np.ndarray]:
+    """
+    Encode firm, event and year columns as compact integer arrays
+    
+    Rows are sorted by year so that any time window is a contiguous slice
+    (located with np.searchsorted on the 'year' array). Firm labels keep
+    their values: they are stored as strings or int64, whichever they all
+    are, so networks built from the encoding have the same nodes as
+    construct_vc_network.
+    
+    Parameters
+    ----------
+    round_df : pd.DataFrame
+        Investment round data
+    firm_col : str, default='firmname'
+        Firm column name
+    event_col : str, default='event'
+        Event column name (company-year events from company_col and
+        year_col if missing)
+    year_col : str, default='year'
+        Year column name
+    company_col : str, default='comname'
+        Company column name, used only if event_col is missing
+    
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Arrays 'firm' (int32), 'event' (int32), 'year' (int16) and
+        'firm_labels' (fixed-width unicode or int64, indexed by firm code)
+    
+    Raises
+    ------
+    ValueError
+        If firm labels are neither all strings nor all integers
+    """
+    df = round_df[[c for c in (firm_col, event_col, year_col) if c in round_df.columns]]
+    if event_col not in df.columns:
+        events = create_event_identifier(round_df[[company_col, year_col]],
+                                         company_col=company_col, year_col=year_col)
+        df = df.assign(**{event_col: events['event'].to_numpy()})
+    
+    firm_codes, firm_labels = pd.factorize(df[firm_col])
+    event_codes, _ = pd.factorize(df[event_col])
+    years = df[year_col].to_numpy()
+    
+    valid = (firm_codes >= 0) & (event_codes >= 0) & pd.notna(years)
+    order = np.argsort(years[valid], kind='stable')
+    
+    # .npy files are opened without pickle support, so no object arrays
+    labels = np.asarray(firm_labels, dtype=object)
+    if all(isinstance(label, str) for label in labels):
+        labels = labels.astype(str)
+    elif all(isinstance(label, numbers.Integral) and not isinstance(label, bool) for label in labels):
+        labels = labels.astype(np.int64)
+    else:
+        raise ValueError("Firm labels must be all strings or all integers to encode round data")
+    
+    return {
+        'firm': firm_codes[valid][order].astype(np.int32),
+        'event': event_codes[valid][order].astype(np.int32),
+        'year': years[valid][order].astype(np.int16),
+        'firm_labels': labels
+    }
+
+
+def save_encoded_rounds(encoded: Dict[str, np.ndarray], folder: Path) -> Path:
+    """
+    Write encoded round arrays to .npy files for memory-mapped access
+    
+    Parameters
+    ----------
+    encoded : Dict[str, np.ndarray]
+        Output of encode_round_data
+    folder : Path
+        Output directory
+    
+    Returns
+    -------
+    Path
+        The output directory
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    for name, arr in encoded.items():
+        np.save(folder / f"{name}.npy", arr)
+    return folder
+
+
+def load_encoded_rounds(folder: Path, mmap_mode: Optional[str] = 'r') -> Dict[str, np.ndarray]:
+    """
+    Open encoded round arrays written by save_encoded_rounds
+    
+    Parameters
+    ----------
+    folder : Path
+        Directory with the .npy files
+    mmap_mode : Optional[str], default='r'
+        Memory-map mode passed to np.load (None loads into RAM)
+    
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Arrays 'firm', 'event', 'year' and 'firm_labels'
+    """
+    folder = Path(folder)
+    return {
+        name: np.load(folder / f"{name}.npy", mmap_mode=mmap_mode)
+        for name in ('firm', 'event', 'year', 'firm_labels')
+    }
+
+
+def construct_vc_network_from_encoded(encoded: Union[Dict[str, np.ndarray], Path, str],
+                                      year: int,
+                                      time_window: Optional[int] = 5,
+                                      edge_cutpoint: Optional[int] = None,
+                                      output: str = 'graph') -> Union[nx.Graph, Tuple[sp.csr_matrix, np.ndarray], CSRGraph]:
+    """
+    Construct VC network for a specific year from encoded round arrays
+    
+    Only the window slice of the (memory-mapped) arrays is read, so a
+    worker's memory use depends on the window size, not on the dataset.
+    The network is identical to construct_vc_network with the sparse
+    engine, including the firm labels.
+    
+    Parameters
+    ----------
+    encoded : Dict[str, np.ndarray] or Path or str
+        Encoded arrays, or directory written by save_encoded_rounds
+    year : int
+        Target year
+    time_window : Optional[int], default=5
+        Time window in years (None uses only year-1)
+    edge_cutpoint : Optional[int], default=None
+        Minimum edge weight threshold
+    output : str, default='graph'
+        'graph' (nx.Graph), 'sparse' ((csr_matrix, firm labels)) or 'csr' (CSRGraph)
+    
+    Returns
+    -------
+    nx.Graph, Tuple[sp.csr_matrix, np.ndarray] or CSRGraph
+        VC network
+    """
+    if output not in NETWORK_OUTPUTS:
+        raise ValueError(f"Unknown network output: {output}")
+    if isinstance(encoded, (str, Path)):
+        encoded = load_encoded_rounds(encoded)
+    
+    window = _window_years(year, time_window)
+    lo, hi = np.searchsorted(encoded['year'], [window.start, window.stop])
+    
+    if hi <= lo:
+        logger.warning(f"No data for year {year}")
+        return _empty_network(output)
+    
+    # Compact firm index for this window
+    firm_ids, firm_local = np.unique(np.asarray(encoded['firm'][lo:hi]), return_inverse=True)
+    W = _cooccurrence_counts(firm_local, np.asarray(encoded['event'][lo:hi]), len(firm_ids))
+    W.setdiag(0)
+    W.eliminate_zeros()
+    W.sort_indices()
+    labels = np.asarray(encoded['firm_labels'][firm_ids]).astype(object)
+    
+    if edge_cutpoint is not None and edge_cutpoint > 1:
+        W, labels = filter_sparse_edges_by_weight(W, labels, edge_cutpoint)
+    
+    logger.info(f"Year {year}: {W.shape[0]} VCs, {W.nnz // 2} edges")
+    
+    return _format_network(W, labels, output)
+
+
 def construct_networks_for_years(round_df: pd.DataFrame,
                                  years: list,
                                  time_window: int = 5,
                                  edge_cutpoint: Optional[int] = None,
                                  use_parallel: bool = True,
-                                 n_jobs: int = -1) -> dict:
+                                 n_jobs: int = -1,
+                                 engine: str = 'networkx',
+                                 output: str = 'graph',
+                                 incremental: bool = False,
+                                 shared_memory: bool = False,
+                                 temp_folder: Optional[str] = None,
+                                 use_cache: bool = False,
+                                 force_recompute: bool = False,
+                                 cache_dir: Optional[Path] = None) -> dict:
     """
     Construct VC networks for multiple years
     
@@ -240,20 +868,107 @@ def construct_networks_for_years(round_df: pd.DataFrame,
         Use parallel processing
     n_jobs : int, default=-1
         Number of parallel jobs
+    engine : str, default='networkx'
+        Projection engine ('networkx', 'sparse' or 'igraph'), see construct_vc_network
+    output : str, default='graph'
+        Network output ('graph', 'sparse' or 'csr'), see construct_vc_network
+    incremental : bool, default=False
+        Slide the window across years (construct_networks_incremental)
+        instead of rebuilding each year. Runs sequentially.
+    shared_memory : bool, default=False
+        Encode rounds once into integer arrays in memory-mapped files and
+        let parallel workers read their window slice from them
+        (construct_vc_network_from_encoded) instead of pickling round_df
+        for every year
+    temp_folder : Optional[str], default=None
+        Parent directory for the memory-mapped files (system temp if None)
+    use_cache : bool, default=False
+        Reload year networks from the on-disk cache (network.cache) when
+        the window's round data and the network parameters are unchanged;
+        build and store the missing ones
+    force_recompute : bool, default=False
+        Rebuild all years and overwrite their cache entries
+    cache_dir : Optional[Path], default=None
+        Cache directory (paths.CACHE_DIR / 'networks' if None)
     
     Returns
     -------
     dict
         Dictionary of {year: network}
     """
+    if use_cache:
+        from . import cache as network_cache
+        
+        cache_dir = Path(cache_dir) if cache_dir is not None else network_cache.default_cache_dir()
+        fingerprints = network_cache.compute_year_fingerprints(round_df)
+        keys = {
+            year: network_cache.network_cache_key(
+                _window_years(year, time_window), fingerprints,
+                time_window=time_window, edge_cutpoint=edge_cutpoint
+            )
+            for year in years
+        }
+        
+        networks = {}
+        missing = []
+        for year in years:
+            cached = None if force_recompute else network_cache.load_cached_network(cache_dir, year, keys[year])
+            if cached is None:
+                missing.append(year)
+            else:
+                networks[year] = _format_network(*cached, output)
+        
+        logger.info(f"Network cache: {len(years) - len(missing)} hits, {len(missing)} to build")
+        
+        if missing:
+            built = construct_networks_for_years(
+                round_df, missing, time_window, edge_cutpoint,
+                use_parallel=use_parallel, n_jobs=n_jobs, engine=engine, output='sparse',
+                incremental=incremental, shared_memory=shared_memory, temp_folder=temp_folder
+            )
+            for year in missing:
+                W, labels = built[year]
+                network_cache.save_cached_network(cache_dir, year, keys[year], W, labels)
+                networks[year] = _format_network(W, labels, output)
+        
+        return {year: networks[year] for year in years}
+    
     logger.info(f"Constructing networks for {len(years)} years...")
     
-    if use_parallel and len(years) > 1:
+    if incremental:
+        return construct_networks_incremental(round_df, years, time_window, edge_cutpoint,
+                                              output=output)
+    
+    encoded = None
+    if shared_memory and use_parallel and len(years) > 1:
+        try:
+            encoded = encode_round_data(round_df)
+        except ValueError as e:
+            logger.warning(f"{e}; building networks without shared memory")
+    
+    if encoded is not None:
+        from joblib import Parallel, delayed
+        from tqdm import tqdm
+        
+        folder = Path(tempfile.mkdtemp(prefix='vc_rounds_', dir=temp_folder))
+        try:
+            save_encoded_rounds(encoded, folder)
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(construct_vc_network_from_encoded)(str(folder), year, time_window,
+                                                           edge_cutpoint, output=output)
+                for year in tqdm(years, desc="Constructing networks")
+            )
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+        
+        networks = dict(zip(years, results))
+    elif use_parallel and len(years) > 1:
         from joblib import Parallel, delayed
         from tqdm import tqdm
         
         results = Parallel(n_jobs=n_jobs)(
-            delayed(construct_vc_network)(round_df, year, time_window, edge_cutpoint)
+            delayed(construct_vc_network)(round_df, year, time_window, edge_cutpoint,
+                                          engine=engine, output=output)
             for year in tqdm(years, desc="Constructing networks")
         )
         
@@ -262,7 +977,8 @@ def construct_networks_for_years(round_df: pd.DataFrame,
         from tqdm import tqdm
         networks = {}
         for year in tqdm(years, desc="Constructing networks"):
-            networks[year] = construct_vc_network(round_df, year, time_window, edge_cutpoint)
+            networks[year] = construct_vc_network(round_df, year, time_window, edge_cutpoint,
+                                                  engine=engine, output=output)
     
     return networks
 
@@ -0,0 +1,268 @@
+"""
+Compact integer-indexed graph representation
+
+This module implements CSRGraph, a lightweight undirected weighted graph
+stored as CSR arrays (indptr/indices/weights) plus firm names. It is the
+compact alternative to nx.Graph for year networks: a few bytes per edge,
+cheap to pickle for parallel workers, and directly usable as a scipy
+sparse adjacency matrix.
+"""
+
+import numpy as np
+import networkx as nx
+import scipy.sparse as sp
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class CSRGraph:
+    """
+    Undirected weighted graph in compressed sparse row form
+
+    Node i is firm_names[i]; its neighbours are
+    indices[indptr[i]:indptr[i+1]] with edge weights in the same slice of
+    weights. Every undirected edge is stored in both directions and there
+    are no self-loops.
+
+    Parameters
+    ----------
+    indptr : np.ndarray
+        Row pointer array of length n_nodes + 1
+    indices : np.ndarray
+        Column indices (neighbour positions)
+    weights : np.ndarray
+        Edge weights aligned with indices
+    firm_names : array-like
+        Node labels, one per row
+    """
+
+    def __init__(self, indptr, indices, weights, firm_names):
+        n = len(firm_names)
+        index_dtype = np.int32 if len(indices) < np.iinfo(np.int32).max else np.int64
+
+        self.indptr = np.asarray(indptr, dtype=index_dtype)
+        self.indices = np.asarray(indices, dtype=index_dtype)
+        self.weights = np.asarray(weights)
+        self.firm_names = np.asarray(firm_names, dtype=object)
+        self._index = None
+
+        if len(self.indptr) != n + 1:
+            raise ValueError(f"indptr has length {len(self.indptr)}, expected {n + 1}")
+        if len(self.indices) != len(self.weights):
+            raise ValueError("indices and weights must have the same length")
+
+    # ------------------------------------------------------------------
+    # Constructors / adapters
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_scipy(cls, W: sp.spmatrix, firm_names) -> 'CSRGraph':
+        """
+        Build from a symmetric sparse adjacency matrix
+
+        Parameters
+        ----------
+        W : sp.spmatrix
+            Symmetric adjacency / co-investment matrix (diagonal ignored)
+        firm_names : array-like
+            Node labels aligned with W
+
+        Returns
+        -------
+        CSRGraph
+        """
+        W = sp.csr_matrix(W, copy=True)
+        if W.diagonal().any():
+            W.setdiag(0)
+        W.eliminate_zeros()
+        W.sort_indices()
+        return cls(W.indptr, W.indices, W.data, firm_names)
+
+    @classmethod
+    def from_networkx(cls, G: nx.Graph, weight: str = 'weight') -> 'CSRGraph':
+        """
+        Build from an nx.Graph (node order is preserved)
+
+        Parameters
+        ----------
+        G : nx.Graph
+            Undirected network
+        weight : str, default='weight'
+            Edge weight attribute (missing weights count as 1)
+
+        Returns
+        -------
+        CSRGraph
+        """
+        nodes = list(G.nodes())
+        if len(nodes) == 0:
+            return cls(np.zeros(1, dtype=np.int32), [], np.array([], dtype=np.int32), [])
+        W = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, format='csr')
+        return cls.from_scipy(W, nodes)
+
+    def to_scipy(self, weighted: bool = True) -> sp.csr_matrix:
+        """
+        Sparse adjacency matrix sharing the graph's index arrays
+
+        Parameters
+        ----------
+        weighted : bool, default=True
+            If False, all edge weights are 1
+
+        Returns
+        -------
+        sp.csr_matrix
+            Adjacency matrix (treat as read-only)
+        """
+        n = self.number_of_nodes()
+        data = self.weights if weighted else np.ones(len(self.indices), dtype=np.int8)
+        return sp.csr_matrix((data, self.indices, self.indptr), shape=(n, n))
+
+    def to_networkx(self, weight: str = 'weight') -> nx.Graph:
+        """
+        Convert to nx.Graph
+
+        Parameters
+        ----------
+        weight : str, default='weight'
+            Edge attribute name for the weights
+
+        Returns
+        -------
+        nx.Graph
+        """
+        G = nx.Graph()
+        G.add_nodes_from(self.firm_names.tolist())
+
+        rows = np.repeat(np.arange(self.number_of_nodes()), np.diff(self.indptr))
+        upper = rows < self.indices
+        G.add_edges_from(
+            (u, v, {weight: w}) for u, v, w in zip(
+                self.firm_names[rows[upper]].tolist(),
+                self.firm_names[self.indices[upper]].tolist(),
+                self.weights[upper].tolist()
+            )
+        )
+        return G
+
+    # ------------------------------------------------------------------
+    # nx.Graph-like interface
+    # ------------------------------------------------------------------
+
+    @property
+    def node_index(self) -> Dict[object, int]:
+        """Mapping firm name -> row position (built lazily)"""
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self.firm_names.tolist())}
+        return self._index
+
+    def number_of_nodes(self) -> int:
+        return len(self.firm_names)
+
+    def number_of_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def __len__(self) -> int:
+        return self.number_of_nodes()
+
+    def nodes(self):
+        """Firm names in row order (supports fast membership tests)"""
+        return self.node_index.keys()
+
+    def has_node(self, name) -> bool:
+        return name in self.node_index
+
+    def __contains__(self, name) -> bool:
+        return self.has_node(name)
+
+    def neighbors(self, name) -> List[object]:
+        """
+        Neighbour firm names of a node
+
+        Parameters
+        ----------
+        name : object
+            Firm name
+
+        Returns
+        -------
+        List[object]
+            Neighbour firm names
+        """
+        i = self.node_index[name]
+        return self.firm_names[self.indices[self.indptr[i]:self.indptr[i + 1]]].tolist()
+
+    def degree_array(self, weighted: bool = False) -> np.ndarray:
+        """
+        Degree (or strength) of every node in row order
+
+        Parameters
+        ----------
+        weighted : bool, default=False
+            If True, sum edge weights instead of counting edges
+
+        Returns
+        -------
+        np.ndarray
+        """
+        if weighted:
+            return np.asarray(self.to_scipy(weighted=True).sum(axis=1)).ravel()
+        return np.diff(self.indptr)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the CSR arrays in bytes (excluding firm name strings)"""
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes + self.firm_names.nbytes
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_index'] = None  # rebuilt on demand after unpickling
+        return state
+
+    def __repr__(self) -> str:
+        return (f"CSRGraph with {self.number_of_nodes()} nodes and "
+                f"{self.number_of_edges()} edges")
+
+
+def as_networkx(G, weight: str = 'weight') -> nx.Graph:
+    """
+    Return G as nx.Graph (CSRGraph is converted, nx.Graph passed through)
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    weight : str, default='weight'
+        Edge attribute name used for CSRGraph weights
+
+    Returns
+    -------
+    nx.Graph
+    """
+    if isinstance(G, CSRGraph):
+        return G.to_networkx(weight=weight)
+    return G
+
+
+def adjacency_matrix(G, weighted: bool = False, weight: str = 'weight') -> sp.csr_matrix:
+    """
+    Sparse adjacency matrix of nx.Graph or CSRGraph in G.nodes() order
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    weighted : bool, default=False
+        If True, use edge weights; otherwise all edges count as 1
+    weight : str, default='weight'
+        Edge weight attribute name (nx.Graph only)
+
+    Returns
+    -------
+    sp.csr_matrix
+    """
+    if isinstance(G, CSRGraph):
+        return G.to_scipy(weighted=weighted)
+    return sp.csr_matrix(nx.adjacency_matrix(G, weight=weight if weighted else None))
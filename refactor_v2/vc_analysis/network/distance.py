@@ -1,56 +1,248 @@
-"""Network distance calculations"""
+"""
+Network distance calculations
 
+Shortest-path lengths are computed by a block BFS over the sparse
+adjacency matrix: a block of sources advances one level at a time with a
+single sparse-dense product (A @ frontier), so no per-node Python work is
+done. Distances are stored in an int16 matrix with UNREACHABLE (9999) for
+pairs that are disconnected or further apart than max_distance.
+"""
+
+import numpy as np
 import pandas as pd
 import networkx as nx
+import scipy.sparse as sp
 import logging
-from typing import Dict
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from . import backends
+from .csr_graph import CSRGraph, adjacency_matrix
 
 logger = logging.getLogger(__name__)
 
+UNREACHABLE = 9999  # Distance code for infinite / beyond-cutoff distances
+
+
+def _bfs_block(A: sp.csr_matrix, sources: np.ndarray, max_distance: Optional[int]) -> np.ndarray:
+    """Distances from a block of sources (rows) to every node (columns)"""
+    n = A.shape[0]
+    b = len(sources)
+    block = np.full((b, n), UNREACHABLE, dtype=np.int16)
+    block[np.arange(b), sources] = 0
+
+    # Frontier / visited as (n, b) columns so each level is one A @ frontier
+    frontier = np.zeros((n, b), dtype=np.float32)
+    frontier[sources, np.arange(b)] = 1
+    visited = frontier > 0
+
+    level = 0
+    while max_distance is None or level < max_distance:
+        reached = (A @ frontier) > 0
+        reached &= ~visited
+        if not reached.any():
+            break
+        level += 1
+        visited |= reached
+        block.T[reached] = level
+        frontier = reached.astype(np.float32)
+
+    return block
 
-def compute_network_distances(G: nx.Graph, max_distance: int = 10) -> pd.DataFrame:
+
+def _distance_blocks(G: Union[nx.Graph, CSRGraph],
+                     max_distance: Optional[int],
+                     sources: np.ndarray,
+                     block_size: int,
+                     backend: str) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield (offset into sources, int16 distance block) for consecutive source blocks"""
+    if max_distance is not None and max_distance >= UNREACHABLE:
+        raise ValueError(f"max_distance must be below {UNREACHABLE}, got {max_distance}")
+
+    if backends.check_backend(backend) == 'igraph':
+        g = backends.to_igraph(G)
+        for start in range(0, len(sources), block_size):
+            block = backends.igraph_distances(g, max_distance, sources=sources[start:start + block_size])
+            yield start, np.where(np.isinf(block), UNREACHABLE, block).astype(np.int16)
+        return
+
+    A = sp.csr_matrix(adjacency_matrix(G, weighted=False), dtype=np.float32)
+    for start in range(0, len(sources), block_size):
+        yield start, _bfs_block(A, sources[start:start + block_size], max_distance)
+
+
+def distance_matrix(G: Union[nx.Graph, CSRGraph],
+                    max_distance: Optional[int] = 10,
+                    sources: Optional[np.ndarray] = None,
+                    block_size: int = 256,
+                    backend: str = 'networkx') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unweighted shortest-path lengths as a compact int16 matrix
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Network
+    max_distance : Optional[int], default=10
+        Maximum distance to compute (None = no cutoff); longer paths are UNREACHABLE
+    sources : Optional[np.ndarray], default=None
+        Positions (in G.nodes() order) of the source rows (all nodes if None)
+    block_size : int, default=256
+        Sources per BFS block (peak memory ~ 6 * n * block_size bytes)
+    backend : str, default='networkx'
+        'networkx' (sparse block BFS) or 'igraph' (igraph's BFS, see network.backends)
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (int16 distances of shape (len(sources), n), firm names in column order)
+    """
+    nodes = np.asarray(list(G.nodes()), dtype=object)
+    n = len(nodes)
+    sources = np.arange(n) if sources is None else np.asarray(sources, dtype=np.int64)
+    D = np.empty((len(sources), n), dtype=np.int16)
+
+    for start, block in _distance_blocks(G, max_distance, sources, block_size, backend):
+        D[start:start + len(block)] = block
+
+    return D, nodes
+
+
+def compute_network_distances(G: Union[nx.Graph, CSRGraph],
+                              max_distance: int = 10,
+                              backend: str = 'networkx',
+                              output: str = 'long',
+                              block_size: int = 256) -> pd.DataFrame:
     """
     Compute pairwise network distances
-    
+
     Parameters
     ----------
-    G : nx.Graph
+    G : nx.Graph or CSRGraph
         Network
     max_distance : int, default=10
         Maximum distance to compute
-    
+    backend : str, default='networkx'
+        'networkx' (sparse block BFS) or 'igraph' (see distance_matrix)
+    output : str, default='long'
+        'long': one row per ordered pair (vc1, vc2, distance, dist1, dist2,
+        dist3plus), vc1/vc2 categorical; 'matrix': int16 distance matrix
+        indexed by firm names on both axes
+    block_size : int, default=256
+        Sources per BFS block
+
     Returns
     -------
     pd.DataFrame
-        Distance matrix in long format
+        Distances (UNREACHABLE = 9999 for infinite distance)
     """
+    if output not in ('long', 'matrix'):
+        raise ValueError(f"Unknown distance output: {output}. Use 'long' or 'matrix'.")
     if G.number_of_nodes() == 0:
         return pd.DataFrame()
-    
-    # Compute all pairs shortest path lengths
-    distances = dict(nx.all_pairs_shortest_path_length(G, cutoff=max_distance))
-    
-    # Convert to DataFrame
-    data = []
-    nodes = list(G.nodes())
-    
-    for source in nodes:
-        source_dists = distances.get(source, {})
-        for target in nodes:
-            if source != target:
-                dist = source_dists.get(target, 9999)  # 9999 for infinite distance
-                data.append({
-                    'vc1': source,
-                    'vc2': target,
-                    'distance': dist
-                })
-    
-    df = pd.DataFrame(data)
-    
+
+    D, nodes = distance_matrix(G, max_distance, block_size=block_size, backend=backend)
+    n = len(nodes)
+
+    if output == 'matrix':
+        return pd.DataFrame(D, index=nodes, columns=nodes)
+
+    # Ordered pairs without the diagonal, source-major: row i skips column i
+    vc1 = np.repeat(np.arange(n, dtype=np.int32), n - 1)
+    vc2 = np.tile(np.arange(n - 1, dtype=np.int32), n)
+    vc2 += vc2 >= vc1
+    distance = D[~np.eye(n, dtype=bool)]
+
+    categories = pd.Index(nodes)
+    df = pd.DataFrame({
+        'vc1': pd.Categorical.from_codes(vc1, categories=categories),
+        'vc2': pd.Categorical.from_codes(vc2, categories=categories),
+        'distance': distance,
+    })
+
     # Create categorical distance variables
-    df['dist1'] = (df['distance'] == 1).astype(int)
-    df['dist2'] = (df['distance'] == 2).astype(int)
-    df['dist3plus'] = (df['distance'] > 2).astype(int)
-    
+    df['dist1'] = (distance == 1).astype(np.int8)
+    df['dist2'] = (distance == 2).astype(np.int8)
+    df['dist3plus'] = (distance > 2).astype(np.int8)
+
     return df
 
+
+def compute_dyad_distances(dyads: pd.DataFrame,
+                           networks: Dict[int, Union[nx.Graph, CSRGraph]],
+                           vc1_col: str = 'vc1',
+                           vc2_col: str = 'vc2',
+                           year_col: str = 'year',
+                           max_distance: int = 10,
+                           block_size: int = 256,
+                           backend: str = 'networkx') -> pd.DataFrame:
+    """
+    Network distances for specific (year, vc1, vc2) dyads
+
+    Dyads are grouped by year; within a year, one BFS is run per distinct
+    source firm (in blocks, see distance_matrix) and all dyads of that
+    source are read off its row. The side of the dyads with fewer
+    distinct firms is used as the source, so cost scales with the number
+    of distinct sources instead of all n² pairs.
+
+    Firms missing from the year's network, and years without a network,
+    get UNREACHABLE (9999), the same as disconnected pairs.
+
+    Parameters
+    ----------
+    dyads : pd.DataFrame
+        Dyads, e.g. case_control_sampling output with vc1_col='leadVC',
+        vc2_col='coVC' and a year column
+    networks : Dict[int, nx.Graph or CSRGraph]
+        Dictionary of {year: network}
+    vc1_col, vc2_col : str
+        Firm columns of the dyad
+    year_col : str, default='year'
+        Network year of each dyad
+    max_distance : int, default=10
+        Maximum distance to compute
+    block_size : int, default=256
+        Sources per BFS block
+    backend : str, default='networkx'
+        'networkx' (sparse block BFS) or 'igraph'
+
+    Returns
+    -------
+    pd.DataFrame
+        dyads with distance (int16), dist1, dist2 and dist3plus columns added
+    """
+    distance = np.full(len(dyads), UNREACHABLE, dtype=np.int16)
+
+    for year, rows in dyads.groupby(year_col, sort=False, observed=True).indices.items():
+        G = networks.get(year)
+        if G is None or G.number_of_nodes() == 0:
+            logger.warning(f"No network for year {year}: {len(rows)} dyads set to {UNREACHABLE}")
+            continue
+
+        index = pd.Index(list(G.nodes()))
+        u = index.get_indexer(dyads[vc1_col].to_numpy()[rows])
+        v = index.get_indexer(dyads[vc2_col].to_numpy()[rows])
+
+        same = (u == v) & (u >= 0)
+        distance[rows[same]] = 0
+        valid = (u >= 0) & (v >= 0) & ~same
+        if not valid.any():
+            continue
+        rows, u, v = rows[valid], u[valid], v[valid]
+
+        # Undirected: BFS from whichever side has fewer distinct firms
+        if len(np.unique(v)) < len(np.unique(u)):
+            u, v = v, u
+        sources, source_of_dyad = np.unique(u, return_inverse=True)
+
+        for start, block in _distance_blocks(G, max_distance, sources, block_size, backend):
+            in_block = (source_of_dyad >= start) & (source_of_dyad < start + len(block))
+            distance[rows[in_block]] = block[source_of_dyad[in_block] - start, v[in_block]]
+
+        logger.debug(f"Year {year}: {len(rows)} dyads from {len(sources)} BFS sources")
+
+    result = dyads.copy()
+    result['distance'] = distance
+    result['dist1'] = (distance == 1).astype(np.int8)
+    result['dist2'] = (distance == 2).astype(np.int8)
+    result['dist3plus'] = (distance > 2).astype(np.int8)
+    return result
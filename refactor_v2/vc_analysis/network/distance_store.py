@@ -0,0 +1,285 @@
+"""
+Memory-mapped store of per-year network distances
+
+Each year's truncated distance matrix is written once to a uint8 .npy
+file under paths.CACHE_DIR / 'distances' (255 = unreachable or beyond
+max_distance), filled block by block from the sparse BFS in
+network.distance. Firms get a stable integer code from a store-wide label
+array that is only ever appended to; a per-year position array maps
+firm codes to rows/columns of that year's matrix.
+
+Readers open the files with np.load(mmap_mode='r'), so any number of
+worker processes can share a store by passing its folder path: lookups
+only page in the matrix entries they touch. Writing is meant for a
+single process.
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+import networkx as nx
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from ..config import paths
+from .csr_graph import CSRGraph
+from .distance import UNREACHABLE, _distance_blocks
+
+logger = logging.getLogger(__name__)
+
+STORE_SUBDIR = 'distances'
+STORE_VERSION = 1
+STORE_UNREACHABLE = 255  # uint8 code for UNREACHABLE
+
+
+def default_store_dir() -> Path:
+    """Default directory for the distance store"""
+    return paths.CACHE_DIR / STORE_SUBDIR
+
+
+def _read_meta(folder: Path) -> Dict:
+    path = folder / 'meta.json'
+    if not path.exists():
+        return {'version': STORE_VERSION, 'max_distance': None, 'years': []}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _atomic_save(path: Path, arr: np.ndarray) -> None:
+    tmp = path.with_name(f".{path.stem}.tmp.npy")
+    np.save(tmp, arr)
+    os.replace(tmp, path)
+
+
+def _write_meta(folder: Path, meta: Dict) -> None:
+    tmp = folder / '.meta.json.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, folder / 'meta.json')
+
+
+def _load_labels(folder: Path) -> np.ndarray:
+    path = folder / 'firm_labels.npy'
+    return np.load(path) if path.exists() else np.array([], dtype=str)
+
+
+def save_distance_year(G: Union[nx.Graph, CSRGraph],
+                       year: int,
+                       folder: Optional[Path] = None,
+                       max_distance: int = 10,
+                       block_size: int = 256,
+                       backend: str = 'networkx') -> Path:
+    """
+    Compute one year's distance matrix and write it to the store
+
+    Firms not yet in the store are appended to the label array, so codes
+    of existing firms never change. The matrix is written through a
+    memory map in BFS blocks and then moved into place, so concurrent
+    readers never see a partial file.
+
+    Parameters
+    ----------
+    G : nx.Graph or CSRGraph
+        Year network
+    year : int
+        Network year
+    folder : Optional[Path], default=None
+        Store directory (default_store_dir() if None)
+    max_distance : int, default=10
+        Distance cutoff; must match the store's cutoff and be below 255
+    block_size : int, default=256
+        Sources per BFS block
+    backend : str, default='networkx'
+        'networkx' (sparse block BFS) or 'igraph'
+
+    Returns
+    -------
+    Path
+        Path of the year's distance file
+    """
+    if not 0 <= max_distance < STORE_UNREACHABLE:
+        raise ValueError(f"max_distance must be in [0, {STORE_UNREACHABLE}), got {max_distance}")
+
+    folder = Path(folder) if folder is not None else default_store_dir()
+    folder.mkdir(parents=True, exist_ok=True)
+
+    meta = _read_meta(folder)
+    if meta['max_distance'] not in (None, max_distance):
+        raise ValueError(f"Store at {folder} uses max_distance={meta['max_distance']}, got {max_distance}")
+
+    # Stable firm codes: append unseen firms to the store-wide labels
+    nodes = np.asarray(list(G.nodes())).astype(str)
+    labels = _load_labels(folder)
+    codes = pd.Index(labels).get_indexer(nodes)
+    new = codes < 0
+    if new.any():
+        codes[new] = len(labels) + np.arange(new.sum())
+        labels = np.concatenate([labels, nodes[new]])
+        _atomic_save(folder / 'firm_labels.npy', labels)
+
+    positions = np.full(len(labels), -1, dtype=np.int32)
+    positions[codes] = np.arange(len(nodes), dtype=np.int32)
+
+    n = len(nodes)
+    path = folder / f"distances_{year}.npy"
+    tmp = folder / f".distances_{year}.tmp.npy"
+    D = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.uint8, shape=(n, n))
+    for start, block in _distance_blocks(G, max_distance, np.arange(n), block_size, backend):
+        D[start:start + len(block)] = np.where(block == UNREACHABLE, STORE_UNREACHABLE, block)
+    D.flush()
+    del D
+    os.replace(tmp, path)
+    _atomic_save(folder / f"positions_{year}.npy", positions)
+
+    meta['max_distance'] = max_distance
+    meta['years'] = sorted(set(meta['years']) | {int(year)})
+    _write_meta(folder, meta)
+
+    logger.info(f"Year {year}: stored {n}x{n} distance matrix ({n * n / 1e6:.1f} MB) in {folder}")
+    return path
+
+
+def build_distance_store(networks: Dict[int, Union[nx.Graph, CSRGraph]],
+                         folder: Optional[Path] = None,
+                         max_distance: int = 10,
+                         block_size: int = 256,
+                         backend: str = 'networkx',
+                         overwrite: bool = False) -> Path:
+    """
+    Write the distance matrices of several year networks to the store
+
+    Parameters
+    ----------
+    networks : Dict[int, nx.Graph or CSRGraph]
+        Dictionary of {year: network}
+    folder : Optional[Path], default=None
+        Store directory (default_store_dir() if None)
+    max_distance : int, default=10
+        Distance cutoff
+    block_size : int, default=256
+        Sources per BFS block
+    backend : str, default='networkx'
+        'networkx' (sparse block BFS) or 'igraph'
+    overwrite : bool, default=False
+        Recompute years that are already stored
+
+    Returns
+    -------
+    Path
+        The store directory
+    """
+    folder = Path(folder) if folder is not None else default_store_dir()
+    stored = set(_read_meta(folder)['years'])
+
+    for year in sorted(networks):
+        if year in stored and not overwrite:
+            logger.debug(f"Year {year}: distances already stored")
+            continue
+        save_distance_year(networks[year], year, folder, max_distance, block_size, backend)
+
+    return folder
+
+
+def load_distance_store(folder: Optional[Path] = None,
+                        mmap_mode: Optional[str] = 'r') -> Dict:
+    """
+    Open a distance store
+
+    Parameters
+    ----------
+    folder : Optional[Path], default=None
+        Store directory (default_store_dir() if None)
+    mmap_mode : Optional[str], default='r'
+        Memory-map mode passed to np.load (None loads into RAM)
+
+    Returns
+    -------
+    Dict
+        'firm_labels' (indexed by firm code), 'max_distance', and per-year
+        dicts 'positions' (firm code -> matrix index, -1 if absent) and
+        'distances' (uint8 matrices)
+    """
+    folder = Path(folder) if folder is not None else default_store_dir()
+    meta = _read_meta(folder)
+    years = meta['years']
+    return {
+        'firm_labels': _load_labels(folder),
+        'max_distance': meta['max_distance'],
+        'positions': {year: np.load(folder / f"positions_{year}.npy") for year in years},
+        'distances': {year: np.load(folder / f"distances_{year}.npy", mmap_mode=mmap_mode) for year in years},
+    }
+
+
+def firm_codes(store: Union[Dict, Path, str], firms: Iterable) -> np.ndarray:
+    """
+    Stable firm codes for firm names (-1 for firms not in the store)
+
+    Parameters
+    ----------
+    store : Dict, Path or str
+        Output of load_distance_store, or the store directory
+    firms : Iterable
+        Firm names
+
+    Returns
+    -------
+    np.ndarray
+        int64 firm codes
+    """
+    if not isinstance(store, dict):
+        store = load_distance_store(store)
+    return pd.Index(store['firm_labels']).get_indexer(np.asarray(firms).astype(str)).astype(np.int64)
+
+
+def lookup_distances(store: Union[Dict, Path, str],
+                     years: np.ndarray,
+                     i: np.ndarray,
+                     j: np.ndarray) -> np.ndarray:
+    """
+    Distances for arrays of (year, firm code i, firm code j)
+
+    Parameters
+    ----------
+    store : Dict, Path or str
+        Output of load_distance_store, or the store directory
+    years : np.ndarray
+        Network year per query (scalar is broadcast)
+    i, j : np.ndarray
+        Firm codes (see firm_codes)
+
+    Returns
+    -------
+    np.ndarray
+        int16 distances; UNREACHABLE (9999) for disconnected pairs, pairs
+        beyond max_distance, unknown firms and years not in the store
+    """
+    if not isinstance(store, dict):
+        store = load_distance_store(store)
+
+    years, i, j = np.broadcast_arrays(np.asarray(years), np.asarray(i, dtype=np.int64), np.asarray(j, dtype=np.int64))
+    result = np.full(years.shape, UNREACHABLE, dtype=np.int16)
+
+    for year in np.unique(years):
+        year = int(year)
+        if year not in store['distances']:
+            continue
+        positions = store['positions'][year]
+        mask = years == year
+        pi = np.full(mask.sum(), -1, dtype=np.int64)
+        pj = np.full(mask.sum(), -1, dtype=np.int64)
+        qi, qj = i[mask], j[mask]
+        # Firms coded after this year was written are absent from it
+        known_i = (qi >= 0) & (qi < len(positions))
+        known_j = (qj >= 0) & (qj < len(positions))
+        pi[known_i] = positions[qi[known_i]]
+        pj[known_j] = positions[qj[known_j]]
+
+        found = (pi >= 0) & (pj >= 0)
+        values = np.full(mask.sum(), UNREACHABLE, dtype=np.int16)
+        values[found] = store['distances'][year][pi[found], pj[found]]
+        values[values == STORE_UNREACHABLE] = UNREACHABLE
+        result[mask] = values
+
+    return result
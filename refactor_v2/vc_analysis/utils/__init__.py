@@ -3,6 +3,7 @@
 from . import parallel
 from . import validation
 from . import io
+from . import benchmark
 
-__all__ = ['parallel', 'validation', 'io']
+__all__ = ['parallel', 'validation', 'io', 'benchmark']
 
@@ -0,0 +1,366 @@
+"""
+Benchmark harness for network construction and centrality
+
+Runs construct_vc_network, compute_all_centralities and
+compute_centralities_for_networks over a grid of synthetic input sizes
+(number of round rows, maximum syndicate size, time window) and records
+wall time, peak RSS and per-measure time for every stage. Each grid case
+runs in a fresh child process so peak RSS is not inflated by earlier cases.
+
+Reports are saved as JSON (metadata + records) with a CSV copy of the
+records. Two reports, e.g. from two commits or two engine options, can be
+compared side by side with compare_reports.
+
+Usage
+-----
+python -m vc_analysis.utils.benchmark run --sizes 10000 100000 --label sparse --engine sparse
+python -m vc_analysis.utils.benchmark compare baseline.json candidate.json
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config import constants
+from ..network.centrality import MEASURE_FLAGS
+
+logger = logging.getLogger(__name__)
+
+CASE_KEYS = ['n_rounds', 'max_syndicate_size', 'time_window', 'n_years', 'stage', 'year']
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of the current process in MB
+
+    Returns
+    -------
+    Optional[float]
+        High-water mark of RSS, or None where the resource module is unavailable
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return rss / 1024**2 if sys.platform == 'darwin' else rss / 1024
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                             cwd=Path(__file__).resolve().parent,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _record(records: List[dict], case: dict, stage: str, start: float,
+            year: Optional[int] = None, G=None) -> None:
+    records.append({
+        **case,
+        'stage': stage,
+        'year': year,
+        'wall_s': time.perf_counter() - start,
+        'peak_rss_mb': peak_rss_mb(),
+        'n_nodes': G.number_of_nodes() if G is not None else None,
+        'n_edges': G.number_of_edges() if G is not None else None,
+    })
+
+
+def run_case(n_rounds: int,
+             max_syndicate_size: int = 30,
+             time_window: int = 5,
+             years: Optional[List[int]] = None,
+             start_year: int = constants.ANALYSIS_CONSTANTS['MIN_YEAR'],
+             end_year: int = constants.ANALYSIS_CONSTANTS['MAX_YEAR'],
+             seed: int = constants.RANDOM_SEED,
+             per_measure: bool = True,
+             network_options: Optional[dict] = None,
+             centrality_options: Optional[dict] = None) -> List[dict]:
+    """
+    Benchmark one grid case in the current process
+
+    Stages (one record each, per year where applicable):
+    'generate', 'construct_vc_network', 'compute_all_centralities',
+    'measure:<name>' (if per_measure) and 'compute_centralities_for_networks'.
+
+    Parameters
+    ----------
+    n_rounds : int
+        Number of synthetic round rows
+    max_syndicate_size : int, default=30
+        Largest syndicate in the synthetic data
+    time_window : int, default=5
+        Network time window
+    years : Optional[List[int]], default=None
+        Network years (default: last three years of the synthetic range)
+    start_year, end_year : int
+        Synthetic data year range
+    seed : int, default=constants.RANDOM_SEED
+        Synthetic data seed
+    per_measure : bool, default=True
+        Also time each centrality measure on its own
+    network_options : Optional[dict], default=None
+        Extra keyword arguments for construct_vc_network (e.g. engine, output)
+    centrality_options : Optional[dict], default=None
+        Extra keyword arguments for compute_all_centralities /
+        compute_centralities_for_networks (e.g. use_parallel)
+
+    Returns
+    -------
+    List[dict]
+        Benchmark records
+    """
+    from ..data.synthetic import generate_firm_data, generate_round_and_company_data
+    from ..network.construction import create_event_identifier, construct_vc_network
+    from ..network.centrality import compute_all_centralities, compute_centralities_for_networks
+    from ..network.csr_graph import CSRGraph
+
+    network_options = dict(network_options or {})
+    centrality_options = dict(centrality_options or {})
+    for_networks_options = {
+        'use_parallel': centrality_options.pop('use_parallel', False),
+        'n_jobs': centrality_options.pop('n_jobs', -1),
+    }
+    if years is None:
+        years = list(range(end_year - 2, end_year + 1))
+
+    case = {'n_rounds': n_rounds, 'max_syndicate_size': max_syndicate_size,
+            'time_window': time_window, 'n_years': len(years)}
+    records = []
+
+    start = time.perf_counter()
+    n_firms = max(50, n_rounds // 20)
+    firm_df = generate_firm_data(n_firms, start_year, end_year, seed=seed)
+    round_df, _ = generate_round_and_company_data(n_rounds, firm_df, start_year, end_year,
+                                                  max_syndicate_size=max_syndicate_size, seed=seed)
+    round_df = create_event_identifier(round_df)
+    _record(records, case, 'generate', start)
+
+    networks = {}
+    for year in years:
+        start = time.perf_counter()
+        G = construct_vc_network(round_df, year, time_window=time_window, **network_options)
+        if isinstance(G, tuple):  # output='sparse'
+            G = CSRGraph.from_scipy(*G)
+        _record(records, case, 'construct_vc_network', start, year, G)
+        networks[year] = G
+
+    for year, G in networks.items():
+        start = time.perf_counter()
+        compute_all_centralities(G, year, **centrality_options)
+        _record(records, case, 'compute_all_centralities', start, year, G)
+
+        if per_measure and G.number_of_nodes() > 0:
+            for name, flag in MEASURE_FLAGS.items():
+                flags = {f: (f == flag) for f in MEASURE_FLAGS.values()}
+                start = time.perf_counter()
+                compute_all_centralities(G, year, **{**centrality_options, **flags})
+                _record(records, case, f'measure:{name}', start, year, G)
+
+    start = time.perf_counter()
+    compute_centralities_for_networks(networks, **for_networks_options, **centrality_options)
+    _record(records, case, 'compute_centralities_for_networks', start)
+
+    return records
+
+
+def run_benchmark(sizes: List[int],
+                  syndicate_sizes: Optional[List[int]] = None,
+                  time_windows: Optional[List[int]] = None,
+                  label: str = 'default',
+                  isolate: bool = True,
+                  **case_kwargs) -> dict:
+    """
+    Run run_case over the full grid of sizes x syndicate sizes x time windows
+
+    Parameters
+    ----------
+    sizes : List[int]
+        Numbers of synthetic round rows
+    syndicate_sizes : Optional[List[int]], default=None
+        Maximum syndicate sizes (default: [30])
+    time_windows : Optional[List[int]], default=None
+        Network time windows (default: [5])
+    label : str, default='default'
+        Report label (e.g. engine name or branch)
+    isolate : bool, default=True
+        Run each case in a fresh child process so peak RSS is per case
+    **case_kwargs : dict
+        Passed to run_case (years, seed, per_measure, network_options, ...)
+
+    Returns
+    -------
+    dict
+        Report with 'metadata' and 'records'
+    """
+    syndicate_sizes = syndicate_sizes or [30]
+    time_windows = time_windows or [5]
+    grid = list(itertools.product(sizes, syndicate_sizes, time_windows))
+
+    records = []
+    for n_rounds, max_syndicate_size, time_window in grid:
+        logger.info(f"Benchmark case: n_rounds={n_rounds:,}, max_syndicate_size={max_syndicate_size}, "
+                    f"time_window={time_window}")
+        args = (n_rounds, max_syndicate_size, time_window)
+        if isolate:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=1,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                case_records = executor.submit(run_case, *args, **case_kwargs).result()
+        else:
+            case_records = run_case(*args, **case_kwargs)
+        records.extend(case_records)
+
+    metadata = {
+        'label': label,
+        'commit': _git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'isolate': isolate,
+        'options': dict(case_kwargs),
+    }
+    return {'metadata': metadata, 'records': records}
+
+
+def save_report(report: dict, path: Path) -> Path:
+    """
+    Save a report as JSON plus a CSV copy of its records (same stem)
+
+    Parameters
+    ----------
+    report : dict
+        Output of run_benchmark
+    path : Path
+        JSON output path
+
+    Returns
+    -------
+    Path
+        JSON path
+    """
+    path = Path(path).with_suffix('.json')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    pd.DataFrame(report['records']).to_csv(path.with_suffix('.csv'), index=False)
+    logger.info(f"Saved benchmark report ({len(report['records'])} records) to {path}")
+    return path
+
+
+def load_report(path: Path) -> dict:
+    """Load a report saved by save_report"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(baseline: dict, candidate: dict) -> pd.DataFrame:
+    """
+    Compare two reports side by side
+
+    Parameters
+    ----------
+    baseline : dict
+        Reference report
+    candidate : dict
+        Report to compare against the baseline
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per case/stage/year present in both reports with wall time
+        and peak RSS of each, the speedup (baseline / candidate wall time)
+        and the RSS ratio (candidate / baseline)
+    """
+    labels = (baseline['metadata']['label'], candidate['metadata']['label'])
+    if labels[0] == labels[1]:
+        labels = (f"{labels[0]}_base", f"{labels[1]}_cand")
+
+    cols = CASE_KEYS + ['wall_s', 'peak_rss_mb']
+    base = pd.DataFrame(baseline['records'])[cols]
+    cand = pd.DataFrame(candidate['records'])[cols]
+    for df in (base, cand):
+        df['year'] = df['year'].fillna(-1).astype(int)
+
+    merged = base.merge(cand, on=CASE_KEYS, suffixes=tuple(f"_{label}" for label in labels))
+    merged['speedup'] = merged[f'wall_s_{labels[0]}'] / merged[f'wall_s_{labels[1]}']
+    merged['rss_ratio'] = merged[f'peak_rss_mb_{labels[1]}'] / merged[f'peak_rss_mb_{labels[0]}']
+    merged['year'] = merged['year'].replace(-1, np.nan)
+    return merged
+
+
+def _default_report_path(label: str) -> Path:
+    from ..config import paths
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return paths.RESULTS_DIR / 'benchmarks' / f"benchmark_{label}_{stamp}.json"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m vc_analysis.utils.benchmark',
+                                     description=__doc__.split('\n\n')[0].strip())
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='run the benchmark grid')
+    run.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    run.add_argument('--syndicate-sizes', type=int, nargs='+', default=[30])
+    run.add_argument('--time-windows', type=int, nargs='+', default=[5])
+    run.add_argument('--years', type=int, nargs='+', default=None)
+    run.add_argument('--seed', type=int, default=constants.RANDOM_SEED)
+    run.add_argument('--label', default='default')
+    run.add_argument('--engine', default='networkx', help="construct_vc_network engine")
+    run.add_argument('--output-format', default='graph', help="construct_vc_network output")
+    run.add_argument('--exact-betweenness', action='store_true')
+    run.add_argument('--no-per-measure', action='store_true')
+    run.add_argument('--no-isolate', action='store_true')
+    run.add_argument('--output', type=Path, default=None, help='JSON report path')
+
+    compare = sub.add_parser('compare', help='compare two JSON reports')
+    compare.add_argument('baseline', type=Path)
+    compare.add_argument('candidate', type=Path)
+    compare.add_argument('--output', type=Path, default=None, help='CSV output path')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    if args.command == 'run':
+        report = run_benchmark(
+            args.sizes, args.syndicate_sizes, args.time_windows,
+            label=args.label,
+            isolate=not args.no_isolate,
+            years=args.years,
+            seed=args.seed,
+            per_measure=not args.no_per_measure,
+            network_options={'engine': args.engine, 'output': args.output_format},
+            centrality_options={'use_approximate_betweenness': not args.exact_betweenness},
+        )
+        path = save_report(report, args.output or _default_report_path(args.label))
+        summary = pd.DataFrame(report['records']).groupby(['n_rounds', 'max_syndicate_size',
+                                                          'time_window', 'stage'], sort=False)
+        print(summary[['wall_s', 'peak_rss_mb']].agg({'wall_s': 'sum', 'peak_rss_mb': 'max'}).to_string())
+        print(f"\nReport: {path}")
+    else:
+        comparison = compare_reports(load_report(args.baseline), load_report(args.candidate))
+        if args.output:
+            comparison.to_csv(args.output, index=False)
+        with pd.option_context('display.width', 200, 'display.max_rows', None):
+            print(comparison.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+
+
+if __name__ == '__main__':
+    main()